@@ -255,6 +255,8 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
 class BinarySensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     """Represent a binary sensor."""
 
+    _state_only_properties = frozenset({"is_on", "state"})
+
     entity_description: BinarySensorEntityDescription
     _attr_device_class: BinarySensorDeviceClass | None
     _attr_is_on: bool | None = None
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
-from typing import cast
+import logging
+from typing import Any, cast
 
 from aiohttp import web
 import voluptuous as vol
@@ -17,6 +19,7 @@ from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
 from homeassistant.core import HomeAssistant, valid_entity_id
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
@@ -24,6 +27,8 @@ from . import websocket_api
 from .const import DOMAIN
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
+_LOGGER = logging.getLogger(__name__)
+
 CONF_ORDER = "use_include_order"
 
 _ONE_DAY = timedelta(days=1)
@@ -46,6 +51,7 @@ CONFIG_SCHEMA = vol.Schema(
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the history hooks."""
     hass.http.register_view(HistoryPeriodView())
+    hass.http.register_view(HistoryExportView())
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_setup(hass)
     return True
@@ -160,3 +166,83 @@ class HistoryPeriodView(HomeAssistantView):
                     ).values()
                 )
             )
+
+
+class HistoryExportView(HomeAssistantView):
+    """Stream the history of a period as newline delimited JSON.
+
+    Each line holds a chunk of compressed states of one entity. The
+    states are read from the database and written to the response
+    chunk by chunk so exporting a long period does not use more memory
+    than a single chunk.
+    """
+
+    url = "/api/history/export/{datetime}"
+    name = "api:history:export"
+
+    async def get(self, request: web.Request, datetime: str) -> web.StreamResponse:
+        """Stream history over a period of time."""
+        query = request.query
+
+        if (start_time := dt_util.parse_datetime(datetime)) is None:
+            return self.json_message("Invalid datetime", HTTPStatus.BAD_REQUEST)
+        start_time = dt_util.as_utc(start_time)
+
+        if not (entity_ids_str := query.get("filter_entity_id")) or not (
+            entity_ids := entity_ids_str.strip().lower().split(",")
+        ):
+            return self.json_message(
+                "filter_entity_id is missing", HTTPStatus.BAD_REQUEST
+            )
+
+        hass = request.app[KEY_HASS]
+
+        for entity_id in entity_ids:
+            if not hass.states.get(entity_id) and not valid_entity_id(entity_id):
+                return self.json_message(
+                    "Invalid filter_entity_id", HTTPStatus.BAD_REQUEST
+                )
+
+        end_time: dt | None = None
+        if (end_time_str := query.get("end_time")) and (
+            end_time := dt_util.parse_datetime(end_time_str)
+        ) is None:
+            return self.json_message("Invalid end_time", HTTPStatus.BAD_REQUEST)
+        if end_time:
+            end_time = dt_util.as_utc(end_time)
+
+        instance = get_instance(hass)
+        chunks = history.stream_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            "skip_initial_state" not in query,
+            query.get("significant_changes_only", "1") != "0",
+            "no_attributes" in query,
+        )
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        try:
+            # Each chunk is read in its own executor job and written from
+            # the event loop so a slow client never holds a database thread
+            while (
+                line := await instance.async_add_executor_job(_next_json_line, chunks)
+            ) is not None:
+                await response.write(line)
+            await response.write_eof()
+        except ConnectionResetError:
+            _LOGGER.debug("Client disconnected while exporting history")
+        finally:
+            await instance.async_add_executor_job(chunks.close)
+        return response
+
+
+def _next_json_line(
+    chunks: Iterator[tuple[str, list[dict[str, Any]]]],
+) -> bytes | None:
+    """Return the next chunk of states as a JSON line or None when done."""
+    if (chunk := next(chunks, None)) is None:
+        return None
+    entity_id, states = chunk
+    return json_bytes({"entity_id": entity_id, "states": states}) + b"\n"
@@ -73,38 +73,136 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    resolution: float | None,
+    columnar: bool = False,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            _get_significant_states(
                 hass,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
+                resolution,
+                columnar,
             ),
         )
     )
 
 
+def _get_significant_states(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    resolution: float | None,
+    columnar: bool,
+) -> dict[str, Any]:
+    """Fetch history significant_states as compressed states or columns."""
+    if columnar:
+        return history.get_significant_states_columnar(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            resolution,
+        )
+    return history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+        resolution,
+    )
+
+
+def _downsample_resolution(
+    msg: dict[str, Any], start_time: dt, end_time: dt | None
+) -> float | None:
+    """Return the resolution in seconds to downsample minimal responses to."""
+    if "resolution" in msg:
+        return cast(float, msg["resolution"])
+    if (
+        "max_points" in msg
+        and (seconds := ((end_time or dt_util.utcnow()) - start_time).total_seconds())
+        > 0
+    ):
+        return seconds / cast(int, msg["max_points"])
+    return None
+
+
+def _validate_downsample_minimal_response(msg: dict[str, Any]) -> dict[str, Any]:
+    """Validate downsampling is only requested for minimal responses.
+
+    Only minimal responses are downsampled, other responses would
+    silently return every state.
+    """
+    if ("resolution" in msg or "max_points" in msg) and not msg["minimal_response"]:
+        raise vol.Invalid("resolution and max_points require minimal_response")
+    return msg
+
+
+@callback
+def _async_downsample_supported(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    resolution: float | None,
+) -> bool:
+    """Return if downsampling is supported or send an error."""
+    if resolution and not get_instance(hass).states_meta_manager.active:
+        connection.send_error(
+            msg_id,
+            websocket_api.ERR_NOT_SUPPORTED,
+            "Downsampling is not supported until the database migration is complete",
+        )
+        return False
+    return True
+
+
 @websocket_api.websocket_command(
-    {
-        vol.Required("type"): "history/history_during_period",
-        vol.Required("start_time"): str,
-        vol.Optional("end_time"): str,
-        vol.Required("entity_ids"): [str],
-        vol.Optional("include_start_time_state", default=True): bool,
-        vol.Optional("significant_changes_only", default=True): bool,
-        vol.Optional("minimal_response", default=False): bool,
-        vol.Optional("no_attributes", default=False): bool,
-    }
+    vol.All(
+        websocket_api.BASE_COMMAND_MESSAGE_SCHEMA.extend(
+            {
+                vol.Required("type"): "history/history_during_period",
+                vol.Required("start_time"): str,
+                vol.Optional("end_time"): str,
+                vol.Required("entity_ids"): [str],
+                vol.Optional("include_start_time_state", default=True): bool,
+                vol.Optional("significant_changes_only", default=True): bool,
+                vol.Optional("minimal_response", default=False): bool,
+                vol.Optional("no_attributes", default=False): bool,
+                vol.Exclusive("resolution", "downsample"): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, min_included=False)
+                ),
+                vol.Exclusive("max_points", "downsample"): vol.All(
+                    int, vol.Range(min=1)
+                ),
+                vol.Optional("columnar", default=False): bool,
+            }
+        ),
+        _validate_downsample_minimal_response,
+    )
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
@@ -139,6 +237,10 @@ async def ws_get_history_during_period(
             connection.send_error(msg["id"], "invalid_entity_ids", "Invalid entity_ids")
             return
 
+    resolution = _downsample_resolution(msg, start_time, end_time)
+    if not _async_downsample_supported(hass, connection, msg["id"], resolution):
+        return
+
     include_start_time_state = msg["include_start_time_state"]
     no_attributes = msg["no_attributes"]
 
@@ -168,12 +270,14 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            resolution,
+            msg["columnar"],
         )
     )
 
 
 def _generate_stream_message(
-    states: dict[str, list[dict[str, Any]]],
+    states: dict[str, Any],
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -201,7 +305,7 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: dict[str, list[dict[str, Any]]],
+    states: dict[str, Any],
 ) -> bytes:
     """Generate a websocket response."""
     return json_bytes(
@@ -222,30 +326,31 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    resolution: float | None,
+    columnar: bool,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
+    states = _get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        resolution,
+        columnar,
     )
     last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
+    for entity_states in states.values():
+        if not entity_states:
+            continue
+        if columnar:
+            state_last_time = entity_states[COMPRESSED_STATE_LAST_UPDATED][-1]
+        else:
+            state_last_time = entity_states[-1][COMPRESSED_STATE_LAST_UPDATED]
+        if state_last_time > last_time_ts:
             last_time_ts = cast(float, state_last_time)
 
     if last_time_ts == 0:
@@ -277,6 +382,8 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    resolution: float | None = None,
+    columnar: bool = False,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
@@ -292,6 +399,8 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        resolution,
+        columnar,
     )
     if payload:
         connection.send_message(payload)
@@ -323,14 +432,47 @@ def _events_to_compressed_states(
     return states_by_entity_ids
 
 
+def _events_to_columnar_states(
+    events: Iterable[Event], no_attributes: bool
+) -> dict[str, dict[str, list[Any]]]:
+    """Convert events to columnar states."""
+    states_by_entity_ids: dict[str, dict[str, list[Any]]] = {}
+    for event in events:
+        state: State = event.data["new_state"]
+        if (columns := states_by_entity_ids.get(state.entity_id)) is None:
+            columns = states_by_entity_ids[state.entity_id] = {
+                COMPRESSED_STATE_STATE: [],
+                COMPRESSED_STATE_LAST_UPDATED: [],
+            }
+            if not no_attributes or state.domain in history.NEED_ATTRIBUTE_DOMAINS:
+                columns[COMPRESSED_STATE_ATTRIBUTES] = [[0, state.attributes]]
+        elif (
+            attributes_log := columns.get(COMPRESSED_STATE_ATTRIBUTES)
+        ) is not None and attributes_log[-1][1] != state.attributes:
+            attributes_log.append(
+                [len(columns[COMPRESSED_STATE_STATE]), state.attributes]
+            )
+        if state.last_changed != state.last_updated:
+            columns.setdefault(COMPRESSED_STATE_LAST_CHANGED, []).append(
+                [len(columns[COMPRESSED_STATE_STATE]), state.last_changed_timestamp]
+            )
+        columns[COMPRESSED_STATE_STATE].append(state.state)
+        columns[COMPRESSED_STATE_LAST_UPDATED].append(state.last_updated_timestamp)
+    return states_by_entity_ids
+
+
 async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
     msg_id: int,
     stream_queue: asyncio.Queue[Event],
     no_attributes: bool,
+    columnar: bool = False,
 ) -> None:
     """Stream events from the queue."""
+    events_to_states = (
+        _events_to_columnar_states if columnar else _events_to_compressed_states
+    )
     subscriptions_setup_complete_timestamp = (
         subscriptions_setup_complete_time.timestamp()
     )
@@ -348,7 +490,7 @@ async def _async_events_consumer(
         while not stream_queue.empty():
             events.append(stream_queue.get_nowait())
 
-        if history_states := _events_to_compressed_states(events, no_attributes):
+        if history_states := events_to_states(events, no_attributes):
             connection.send_message(
                 json_bytes(
                     messages.event_message(
@@ -396,16 +538,28 @@ def _async_subscribe_events(
 
 
 @websocket_api.websocket_command(
-    {
-        vol.Required("type"): "history/stream",
-        vol.Required("start_time"): str,
-        vol.Optional("end_time"): str,
-        vol.Required("entity_ids"): [str],
-        vol.Optional("include_start_time_state", default=True): bool,
-        vol.Optional("significant_changes_only", default=True): bool,
-        vol.Optional("minimal_response", default=False): bool,
-        vol.Optional("no_attributes", default=False): bool,
-    }
+    vol.All(
+        websocket_api.BASE_COMMAND_MESSAGE_SCHEMA.extend(
+            {
+                vol.Required("type"): "history/stream",
+                vol.Required("start_time"): str,
+                vol.Optional("end_time"): str,
+                vol.Required("entity_ids"): [str],
+                vol.Optional("include_start_time_state", default=True): bool,
+                vol.Optional("significant_changes_only", default=True): bool,
+                vol.Optional("minimal_response", default=False): bool,
+                vol.Optional("no_attributes", default=False): bool,
+                vol.Exclusive("resolution", "downsample"): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, min_included=False)
+                ),
+                vol.Exclusive("max_points", "downsample"): vol.All(
+                    int, vol.Range(min=1)
+                ),
+                vol.Optional("columnar", default=False): bool,
+            }
+        ),
+        _validate_downsample_minimal_response,
+    )
 )
 @websocket_api.async_response
 async def ws_stream(
@@ -444,6 +598,10 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    resolution = _downsample_resolution(msg, start_time, end_time)
+    if not _async_downsample_supported(hass, connection, msg_id, resolution):
+        return
+    columnar = msg["columnar"]
 
     if end_time and end_time <= utc_now:
         if (
@@ -470,6 +628,8 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            resolution,
+            columnar,
         )
         return
 
@@ -534,6 +694,8 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        resolution,
+        columnar,
     )
 
     if msg_id not in connection.subscriptions:
@@ -547,6 +709,7 @@ async def ws_stream(
             msg_id,
             stream_queue,
             no_attributes,
+            columnar,
         )
     )
 
@@ -578,4 +741,6 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        resolution=resolution,
+        columnar=columnar,
     )
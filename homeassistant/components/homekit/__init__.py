@@ -804,11 +804,10 @@ class HomeKit:
         ent_reg = er.async_get(self.hass)
         device_lookup: dict[str, dict[tuple[str, str | None], str]] = {}
         entity_states: list[State] = []
-        entity_filter = self._filter.get_filter()
         entries = ent_reg.entities
-        for state in self.hass.states.async_all():
-            entity_id = state.entity_id
-            if not entity_filter(entity_id):
+        states = self.hass.states
+        for entity_id in self._filter.async_filter_entity_ids(states):
+            if (state := states.get(entity_id)) is None:
                 continue
 
             if ent_reg_ent := ent_reg.async_get(entity_id):
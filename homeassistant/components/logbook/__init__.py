@@ -34,6 +34,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util.event_type import EventType
 
 from . import rest_api, websocket_api
+from .buffer import LogbookBuffer
 from .const import (  # noqa: F401
     ATTR_MESSAGE,
     DOMAIN,
@@ -138,7 +139,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    buffer = LogbookBuffer(hass, external_events, entities_filter)
+    buffer.async_setup()
+    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter, buffer)
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
@@ -162,5 +165,7 @@ def _process_logbook_platform(hass: HomeAssistant, domain: str, platform: Any) -
     ) -> None:
         """Teach logbook how to describe a new event."""
         external_events[event_name] = (domain, describe_callback)
+        if logbook_config.buffer:
+            logbook_config.buffer.async_listen(event_name)
 
     platform.async_describe_events(hass, _async_describe_event)
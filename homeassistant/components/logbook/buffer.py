@@ -0,0 +1,308 @@
+"""In-memory buffer of recent logbook entries."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from operator import attrgetter
+import threading
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    EVENT_CALL_SERVICE,
+    EVENT_LOGBOOK_ENTRY,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+import homeassistant.util.dt as dt_util
+from homeassistant.util.event_type import EventType
+
+from .helpers import _is_state_filtered, event_matches_entities_filter, extract_attr
+from .models import EventAsRow, LazyEventPartialState, async_event_to_row
+from .processor import (
+    ContextAugmenter,
+    EntityNameCache,
+    EventCache,
+    LogbookRun,
+    _humanify,
+    _row_time_fired_timestamp,
+)
+
+# The number of entries kept in memory
+LOGBOOK_BUFFER_MAX_ENTRIES = 10000
+
+_time_fired_ts = attrgetter("row.time_fired_ts")
+
+
+class LogbookBufferEntry:
+    """A logbook row in the buffer and its humanified form."""
+
+    __slots__ = ("row", "entity_ids", "device_ids", "unfiltered", "humanified", "data")
+
+    def __init__(
+        self,
+        row: EventAsRow,
+        entity_ids: list[str],
+        device_ids: list[str],
+        unfiltered: bool,
+    ) -> None:
+        """Init the entry."""
+        self.row = row
+        self.entity_ids = entity_ids
+        self.device_ids = device_ids
+        # If the logbook entities filter allows the row
+        self.unfiltered = unfiltered
+        self.humanified = False
+        self.data: dict[str, Any] | None = None
+
+
+class LogbookBuffer:
+    """Keep the most recent logbook rows in memory.
+
+    The buffer subscribes to the same events the live logbook stream
+    does and applies the same filtering as the recorder and the logbook
+    queries. Every row with a timestamp after covered_after is in the
+    buffer so requests for recent windows can be answered without
+    querying the database. When rows are evicted covered_after moves
+    forward and older windows fall back to the database.
+
+    Rows are added from the event loop and read from the executor. The
+    rows are humanified in the websocket format the first time they are
+    requested and the result is kept with the row. Each read humanifies
+    with its own LogbookRun so reads in different executor threads do not
+    share its caches.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        external_events: dict[
+            EventType[Any] | str,
+            tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
+        ],
+        entities_filter: Callable[[str], bool] | None,
+        max_entries: int = LOGBOOK_BUFFER_MAX_ENTRIES,
+    ) -> None:
+        """Init the buffer."""
+        self.hass = hass
+        self.external_events = external_events
+        self.entities_filter = entities_filter
+        self.max_entries = max_entries
+        self.covered_after = dt_util.utcnow().timestamp()
+        self._ent_reg = er.async_get(hass)
+        self._lock = threading.Lock()
+        self._entries: deque[LogbookBufferEntry] = deque()
+        self._by_entity_id: dict[str, deque[LogbookBufferEntry]] = {}
+        self._by_device_id: dict[str, deque[LogbookBufferEntry]] = {}
+        self._by_context_id: dict[bytes, deque[LogbookBufferEntry]] = {}
+        # The first row of each context is used to augment the rows
+        self._context_lookup: dict[bytes | None, Any] = {None: None}
+        self._event_types: set[EventType[Any] | str] = set()
+
+    @callback
+    def async_setup(self) -> None:
+        """Start buffering the logbook events."""
+        self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_add_state)
+        self.async_listen(EVENT_LOGBOOK_ENTRY)
+        # Service calls are not shown but like in the database they are
+        # the context of the rows they cause
+        self.async_listen(EVENT_CALL_SERVICE)
+        for event_type in self.external_events:
+            self.async_listen(event_type)
+
+    @callback
+    def async_listen(self, event_type: EventType[Any] | str) -> None:
+        """Start buffering an event type.
+
+        Events of this type that happened before are not in the buffer
+        so only newer rows can be served from it.
+        """
+        if event_type in self._event_types:
+            return
+        self._event_types.add(event_type)
+        self.hass.bus.async_listen(event_type, self._async_add_event)
+        self.covered_after = max(self.covered_after, dt_util.utcnow().timestamp())
+
+    @callback
+    def _async_add_state(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change if the logbook shows it."""
+        if (old_state := event.data["old_state"]) is None or (
+            new_state := event.data["new_state"]
+        ) is None:
+            return
+        if _is_state_filtered(new_state, old_state):
+            return
+        entity_id = new_state.entity_id
+        if not get_instance(self.hass).entity_filter(entity_id):
+            return
+        entities_filter = self.entities_filter
+        self._async_add(
+            LogbookBufferEntry(
+                async_event_to_row(event),
+                [entity_id],
+                [],
+                not entities_filter or entities_filter(entity_id),
+            )
+        )
+
+    @callback
+    def _async_add_event(self, event: Event) -> None:
+        """Add an event if the recorder records it."""
+        instance = get_instance(self.hass)
+        if event.event_type in instance.exclude_event_types:
+            return
+        event_data = event.data
+        entity_ids = extract_attr(event_data, ATTR_ENTITY_ID)
+        # Events for entities are only recorded if any of them is included
+        if entity_ids and not any(instance.entity_filter(eid) for eid in entity_ids):
+            return
+        entities_filter = self.entities_filter
+        self._async_add(
+            LogbookBufferEntry(
+                async_event_to_row(event),
+                entity_ids,
+                extract_attr(event_data, ATTR_DEVICE_ID),
+                not entities_filter
+                or event_matches_entities_filter(event_data, entities_filter),
+            )
+        )
+
+    @callback
+    def _async_add(self, entry: LogbookBufferEntry) -> None:
+        """Add an entry and evict the oldest one when the buffer is full."""
+        context_id_bin = entry.row.context_id_bin
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._evict()
+            self._entries.append(entry)
+            for entity_id in entry.entity_ids:
+                _index(self._by_entity_id, entity_id, entry)
+            for device_id in entry.device_ids:
+                _index(self._by_device_id, device_id, entry)
+            _index(self._by_context_id, context_id_bin, entry)
+            self._context_lookup.setdefault(context_id_bin, entry.row)
+
+    def _evict(self) -> None:
+        """Evict the oldest entry, the lock must be held."""
+        entry = self._entries.popleft()
+        for entity_id in entry.entity_ids:
+            _unindex(self._by_entity_id, entity_id)
+        for device_id in entry.device_ids:
+            _unindex(self._by_device_id, device_id)
+        context_id_bin = entry.row.context_id_bin
+        _unindex(self._by_context_id, context_id_bin)
+        if self._context_lookup.get(context_id_bin) is entry.row:
+            del self._context_lookup[context_id_bin]
+        self.covered_after = max(self.covered_after, entry.row.time_fired_ts)
+
+    def get_events(
+        self,
+        start_ts: float,
+        end_ts: float,
+        event_types: Iterable[EventType[Any] | str],
+        entity_ids: list[str] | None = None,
+        device_ids: list[str] | None = None,
+        context_id_bin: bytes | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get the humanified rows after start_ts and before end_ts.
+
+        The rows are selected like the logbook queries select them from
+        the database. This method is thread-safe and is expected to be
+        called from the executor.
+        """
+        with self._lock:
+            if context_id_bin is not None:
+                candidates = list(self._by_context_id.get(context_id_bin, ()))
+            elif entity_ids or device_ids:
+                selected: dict[int, LogbookBufferEntry] = {}
+                for index, keys in (
+                    (self._by_entity_id, entity_ids),
+                    (self._by_device_id, device_ids),
+                ):
+                    for key in keys or ():
+                        if indexed := index.get(key):
+                            selected.update((id(entry), entry) for entry in indexed)
+                candidates = list(selected.values())
+            else:
+                candidates = [entry for entry in self._entries if entry.unfiltered]
+            # The lookup is changed in the event loop, so the context rows
+            # of the candidates are copied
+            context_lookup: dict[bytes | None, Any] = {None: None}
+            for entry in candidates:
+                row = entry.row
+                for context_id_bin in (row.context_id_bin, row.context_parent_id_bin):
+                    if (
+                        context_row := self._context_lookup.get(context_id_bin)
+                    ) is not None:
+                        context_lookup[context_id_bin] = context_row
+
+        event_types_set = set(event_types)
+        entries = sorted(
+            (
+                entry
+                for entry in candidates
+                if start_ts < entry.row.time_fired_ts < end_ts
+                and (
+                    (event_type := entry.row.event_type) is None
+                    or event_type in event_types_set
+                )
+            ),
+            key=_time_fired_ts,
+        )
+        logbook_run = LogbookRun(
+            context_lookup=context_lookup,
+            external_events=self.external_events,
+            event_cache=EventCache({}),
+            entity_name_cache=EntityNameCache(self.hass),
+            include_entity_name=False,
+            format_time=_row_time_fired_timestamp,
+            memoize_new_contexts=False,
+        )
+        context_augmenter = ContextAugmenter(logbook_run)
+        return [
+            data
+            for entry in entries
+            if (data := self._humanify(entry, logbook_run, context_augmenter))
+        ]
+
+    def _humanify(
+        self,
+        entry: LogbookBufferEntry,
+        logbook_run: LogbookRun,
+        context_augmenter: ContextAugmenter,
+    ) -> dict[str, Any] | None:
+        """Humanify an entry once."""
+        if not entry.humanified:
+            entry.data = next(
+                _humanify(
+                    self.hass,
+                    [entry.row],
+                    self._ent_reg,
+                    logbook_run,
+                    context_augmenter,
+                ),
+                None,
+            )
+            entry.humanified = True
+        return entry.data
+
+
+def _index(
+    index: dict[Any, deque[LogbookBufferEntry]], key: Any, entry: LogbookBufferEntry
+) -> None:
+    """Add an entry to an index."""
+    if (entries := index.get(key)) is None:
+        entries = index[key] = deque()
+    entries.append(entry)
+
+
+def _unindex(index: dict[Any, deque[LogbookBufferEntry]], key: Any) -> None:
+    """Remove the oldest entry from an index."""
+    entries = index[key]
+    entries.popleft()
+    if not entries:
+        del index[key]
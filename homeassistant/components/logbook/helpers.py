@@ -104,6 +104,18 @@ def extract_attr(source: Mapping[str, Any], attr: str) -> list[str]:
     return str(value).split(",")
 
 
+@callback
+def event_matches_entities_filter(
+    event_data: Mapping[str, Any], entities_filter: Callable[[str], bool]
+) -> bool:
+    """Check if the entities filter allows an event."""
+    entity_ids = extract_attr(event_data, ATTR_ENTITY_ID)
+    if entity_ids and not any(entities_filter(entity_id) for entity_id in entity_ids):
+        return False
+    domain = event_data.get(ATTR_DOMAIN)
+    return not domain or entities_filter(f"{domain}._")
+
+
 @callback
 def event_forwarder_filtered(
     target: Callable[[Event], None],
@@ -125,16 +137,8 @@ def event_forwarder_filtered(
         @callback
         def _forward_events_filtered_by_entities_filter(event: Event) -> None:
             assert entities_filter is not None
-            event_data = event.data
-            entity_ids = extract_attr(event_data, ATTR_ENTITY_ID)
-            if entity_ids and not any(
-                entities_filter(entity_id) for entity_id in entity_ids
-            ):
-                return
-            domain = event_data.get(ATTR_DOMAIN)
-            if domain and not entities_filter(f"{domain}._"):
-                return
-            target(event)
+            if event_matches_entities_filter(event.data, entities_filter):
+                target(event)
 
         return _forward_events_filtered_by_entities_filter
 
@@ -22,6 +22,9 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+if TYPE_CHECKING:
+    from .buffer import LogbookBuffer
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -33,6 +36,7 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    buffer: LogbookBuffer | None = None
 
 
 class LazyEventPartialState:
@@ -118,7 +122,7 @@ class EventAsRow:
 
 
 @callback
-def async_event_to_row(event: Event) -> EventAsRow:
+def async_event_to_row(event: Event[Any]) -> EventAsRow:
     """Convert an event to a row."""
     if event.event_type != EVENT_STATE_CHANGED:
         context = event.context
@@ -5,12 +5,14 @@ from __future__ import annotations
 from collections.abc import Callable, Generator, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
 import logging
-from typing import Any
+from math import inf, nextafter
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -20,8 +22,10 @@ from homeassistant.components.recorder.models import (
     extract_metadata_ids,
     process_datetime_to_timestamp,
     process_timestamp_to_utc_isoformat,
+    ulid_to_bytes_or_none,
 )
 from homeassistant.components.recorder.util import (
+    chunked_or_all,
     execute_stmt_lambda_element,
     session_scope,
 )
@@ -65,7 +69,10 @@ from .const import (
 from .helpers import is_sensor_continuous
 from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
 from .queries import statement_for_request
-from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.common import PSEUDO_EVENT_STATE_CHANGED, select_context_rows
+
+if TYPE_CHECKING:
+    from .buffer import LogbookBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -111,6 +118,10 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        # The buffer keeps the rows humanified in the websocket format
+        self.buffer: LogbookBuffer | None = (
+            logbook_config.buffer if timestamp and not include_entity_name else None
+        )
         format_time = (
             _row_time_fired_timestamp if timestamp else _row_time_fired_isoformat
         )
@@ -143,7 +154,46 @@ class EventProcessor:
         start_day: dt,
         end_day: dt,
     ) -> list[dict[str, Any]]:
-        """Get events for a period of time."""
+        """Get events for a period of time.
+
+        Recent rows are served from the buffer, the database is only
+        queried for the rows which are older than the buffer.
+        """
+        if (buffer := self.buffer) is None:
+            return self._get_events_from_database(start_day, end_day)
+        end_ts = end_day.timestamp()
+        if (covered_after := buffer.covered_after) >= end_ts:
+            return self._get_events_from_database(start_day, end_day)
+        events: list[dict[str, Any]] = []
+        start_ts = start_day.timestamp()
+        if start_ts < covered_after:
+            # The database query excludes the end time so the buffer
+            # has to include it
+            split_day = dt_util.utc_from_timestamp(covered_after) + timedelta(
+                microseconds=1
+            )
+            if split_day >= end_day:
+                return self._get_events_from_database(start_day, end_day)
+            events = self._get_events_from_database(start_day, split_day)
+            start_ts = nextafter(split_day.timestamp(), -inf)
+        events.extend(
+            buffer.get_events(
+                start_ts,
+                end_ts,
+                self.event_types,
+                self.entity_ids,
+                self.device_ids,
+                ulid_to_bytes_or_none(self.context_id),
+            )
+        )
+        return events
+
+    def _get_events_from_database(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> list[dict[str, Any]]:
+        """Get events for a period of time from the database."""
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -168,9 +218,48 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
-            )
+            rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            if TYPE_CHECKING:
+                assert isinstance(rows, Sequence)
+            self._resolve_contexts(session, rows, end_day)
+            return self.humanify(rows)
+
+    def _resolve_contexts(
+        self, session: Session, rows: Sequence[Row], end_day: dt
+    ) -> None:
+        """Look up the rows that started the contexts of the rows.
+
+        The contexts of the rows, and the parent contexts they were
+        caused by, may have been started before the requested period.
+        They are resolved in one query which uses the context_id_bin
+        indexes, instead of being missing from the context lookup.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        context_ids_bin: set[bytes] = set()
+        resolved: set[bytes] = set()
+        for row in rows:
+            if row.context_only:
+                # The entity and device queries select all rows of their
+                # contexts already
+                resolved.add(row.context_id_bin)
+                continue
+            context_ids_bin.add(row.context_id_bin)
+            if context_parent_id_bin := row.context_parent_id_bin:
+                context_ids_bin.add(context_parent_id_bin)
+        context_ids_bin.difference_update(resolved, context_lookup)
+        if not context_ids_bin:
+            return
+        end_day_ts = end_day.timestamp()
+        memoize_context = context_lookup.setdefault
+        connection = session.connection()
+        # Each context id is bound twice, once for events and once for states
+        for context_ids_bin_chunk in chunked_or_all(
+            context_ids_bin, get_instance(self.hass).max_bind_vars // 2 - 1
+        ):
+            for context_row in connection.execute(
+                select_context_rows(end_day_ts, context_ids_bin_chunk)
+            ):
+                memoize_context(context_row.context_id_bin, context_row)
 
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
@@ -189,7 +278,7 @@ class EventProcessor:
 
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow, None, None] | Sequence[Row | EventAsRow] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
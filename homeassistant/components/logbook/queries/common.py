@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from typing import Final
 
 import sqlalchemy
-from sqlalchemy import select
+from sqlalchemy import select, union_all
 from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import CompoundSelect, Select
 
 from homeassistant.components.recorder.db_schema import (
     EVENTS_CONTEXT_ID_BIN_INDEX,
@@ -142,6 +143,31 @@ def select_states_context_only() -> Select:
     )
 
 
+def select_context_rows(
+    end_day: float, context_ids_bin: Collection[bytes]
+) -> CompoundSelect:
+    """Generate a select for the rows of contexts that happened before end_day.
+
+    The rows are marked as context_only and are ordered so the
+    first row of each context is the row that started it.
+    """
+    return union_all(
+        apply_events_context_hints(
+            select_events_context_only()
+            .where(Events.context_id_bin.in_(context_ids_bin))
+            .where(Events.time_fired_ts < end_day)
+            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id))
+        ),
+        apply_states_context_hints(
+            select_states_context_only()
+            .where(States.context_id_bin.in_(context_ids_bin))
+            .where(States.last_updated_ts < end_day)
+            .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+        ),
+    ).order_by(Events.time_fired_ts)
+
+
 def select_events_without_states(
     start_day: float, end_day: float, event_type_ids: tuple[int, ...]
 ) -> Select:
@@ -84,7 +84,7 @@ SUPPORTED_COMPONENTS = {
 MQTT_DISCOVERY_UPDATED: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
     "mqtt_discovery_updated_{}"
 )
-MQTT_DISCOVERY_NEW: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
+MQTT_DISCOVERY_NEW: SignalTypeFormat[list[MQTTDiscoveryPayload]] = SignalTypeFormat(
     "mqtt_discovery_new_{}_{}"
 )
 MQTT_DISCOVERY_NEW_COMPONENT = "mqtt_discovery_new_component"
@@ -111,7 +111,9 @@ class MQTTDiscoveryPayload(dict[str, Any]):
 
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry from already discovered list."""
-    get_mqtt_data(hass).discovery_already_discovered.remove(discovery_hash)
+    mqtt_data = get_mqtt_data(hass)
+    mqtt_data.discovery_already_discovered.remove(discovery_hash)
+    mqtt_data.discovery_payloads.pop(discovery_hash, None)
 
 
 def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
@@ -149,24 +151,62 @@ async def async_start(  # noqa: C901
     """Start MQTT Discovery."""
     mqtt_data = get_mqtt_data(hass)
     platform_setup_lock: dict[str, asyncio.Lock] = {}
+    # New discovery payloads by component, added in one batch per component
+    pending_new: dict[str, list[MQTTDiscoveryPayload]] = {}
 
-    async def _async_component_setup(discovery_payload: MQTTDiscoveryPayload) -> None:
+    @callback
+    def _async_add_components(
+        component: str, discovery_payloads: list[MQTTDiscoveryPayload]
+    ) -> None:
+        """Add discovered components of a loaded platform."""
+        for discovery_payload in discovery_payloads:
+            discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
+            message = f"Found new component: {component} {discovery_hash[1]}"
+            async_log_discovery_origin_info(message, discovery_payload)
+            mqtt_data.discovery_already_discovered.add(discovery_hash)
+        async_dispatcher_send(
+            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payloads
+        )
+
+    async def _async_component_setup(
+        component: str, discovery_payloads: list[MQTTDiscoveryPayload]
+    ) -> None:
         """Perform component set up."""
-        discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
-        component, discovery_id = discovery_hash
         platform_setup_lock.setdefault(component, asyncio.Lock())
         async with platform_setup_lock[component]:
             if component not in mqtt_data.platforms_loaded:
                 await async_forward_entry_setup_and_setup_discovery(
                     hass, config_entry, {component}
                 )
-        # Add component
-        message = f"Found new component: {component} {discovery_id}"
-        async_log_discovery_origin_info(message, discovery_payload)
-        mqtt_data.discovery_already_discovered.add(discovery_hash)
-        async_dispatcher_send(
-            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
-        )
+        _async_add_components(component, discovery_payloads)
+
+    async def _async_process_pending_new() -> None:
+        """Add the new discovery payloads received in the last iteration."""
+        batches = list(pending_new.items())
+        pending_new.clear()
+        for component, discovery_payloads in batches:
+            if component not in mqtt_data.platforms_loaded:
+                # Load component first
+                async_dispatcher_send(
+                    hass, MQTT_DISCOVERY_NEW_COMPONENT, component, discovery_payloads
+                )
+            else:
+                _async_add_components(component, discovery_payloads)
+
+    @callback
+    def _async_queue_new(component: str, payload: MQTTDiscoveryPayload) -> None:
+        """Queue a new discovery payload to be added with the others of its batch.
+
+        Retained discovery messages arrive in bursts at connect, payloads
+        received in the same iteration are validated and added together.
+        """
+        if not pending_new:
+            hass.async_create_task_internal(
+                _async_process_pending_new(),
+                "mqtt discovery new components",
+                eager_start=False,
+            )
+        pending_new.setdefault(component, []).append(payload)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
@@ -201,6 +241,24 @@ async def async_start(  # noqa: C901
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        if (
+            discovery_hash in mqtt_data.discovery_already_discovered
+            and discovery_hash not in mqtt_data.discovery_pending_discovered
+            and mqtt_data.discovery_payloads.get(discovery_hash) == payload
+        ):
+            # The same payload is published again, e.g. on reconnect
+            _LOGGER.debug(
+                "Ignoring unchanged discovery payload for %s %s",
+                component,
+                discovery_id,
+            )
+            return
+        mqtt_data.discovery_payloads[discovery_hash] = payload
+
         if payload:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
@@ -268,10 +326,6 @@ async def async_start(  # noqa: C901
                         if topic[-1] == TOPIC_BASE:
                             availability_conf[CONF_TOPIC] = f"{topic[:-1]}{base}"
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if discovery_payload:
             # Attach MQTT topic to the payload, used for debug prints
             setattr(
@@ -335,9 +389,10 @@ async def async_start(  # noqa: C901
                 "pending": deque([]),
             }
 
-        if component not in mqtt_data.platforms_loaded and payload:
-            # Load component first
-            async_dispatcher_send(hass, MQTT_DISCOVERY_NEW_COMPONENT, payload)
+        if payload and (
+            not already_discovered or component not in mqtt_data.platforms_loaded
+        ):
+            _async_queue_new(component, payload)
         elif already_discovered:
             # Dispatch update
             message = f"Component has already been discovered: {component} {discovery_id}, sending update"
@@ -345,14 +400,6 @@ async def async_start(  # noqa: C901
             async_dispatcher_send(
                 hass, MQTT_DISCOVERY_UPDATED.format(discovery_hash), payload
             )
-        elif payload:
-            # Add component
-            message = f"Found new component: {component} {discovery_id}"
-            async_log_discovery_origin_info(message, payload)
-            mqtt_data.discovery_already_discovered.add(discovery_hash)
-            async_dispatcher_send(
-                hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), payload
-            )
         else:
             # Unhandled discovery message
             async_dispatcher_send(
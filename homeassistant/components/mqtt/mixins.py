@@ -62,7 +62,6 @@ from homeassistant.helpers.typing import (
     DiscoveryInfoType,
     UndefinedType,
 )
-from homeassistant.util.json import json_loads
 from homeassistant.util.yaml import dump as yaml_dump
 
 from . import debug_info, subscription
@@ -111,6 +110,7 @@ from .models import (
     MqttValueTemplateException,
     PublishPayloadType,
     ReceiveMessage,
+    json_loads_payload,
 )
 from .subscription import (
     EntitySubscription,
@@ -280,38 +280,47 @@ async def _async_discover(
     domain: str,
     setup: Callable[[MQTTDiscoveryPayload], None] | None,
     async_setup: Callable[[MQTTDiscoveryPayload], Coroutine[Any, Any, None]] | None,
-    discovery_payload: MQTTDiscoveryPayload,
+    discovery_payloads: list[MQTTDiscoveryPayload],
 ) -> None:
-    """Discover and add an MQTT entity, automation or tag.
+    """Discover and add MQTT entities, automations or tags.
 
     setup is to be run in the event loop when there is nothing to be awaited.
+    A payload which fails to set up does not affect the others of the batch.
     """
     if not mqtt_config_entry_enabled(hass):
-        _LOGGER.warning(
-            (
-                "MQTT integration is disabled, skipping setup of discovered item "
-                "MQTT %s, payload %s"
-            ),
-            domain,
-            discovery_payload,
-        )
+        for discovery_payload in discovery_payloads:
+            _LOGGER.warning(
+                (
+                    "MQTT integration is disabled, skipping setup of discovered item "
+                    "MQTT %s, payload %s"
+                ),
+                domain,
+                discovery_payload,
+            )
         return
-    discovery_data = discovery_payload.discovery_data
-    try:
-        if setup is not None:
-            setup(discovery_payload)
-        elif async_setup is not None:
-            await async_setup(discovery_payload)
-    except vol.Invalid as err:
-        discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
-        clear_discovery_hash(hass, discovery_hash)
-        async_dispatcher_send(hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None)
-        async_handle_schema_error(discovery_payload, err)
-    except Exception:
-        discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
-        clear_discovery_hash(hass, discovery_hash)
-        async_dispatcher_send(hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None)
-        raise
+    for discovery_payload in discovery_payloads:
+        discovery_data = discovery_payload.discovery_data
+        try:
+            if setup is not None:
+                setup(discovery_payload)
+            elif async_setup is not None:
+                await async_setup(discovery_payload)
+        except vol.Invalid as err:
+            discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
+            clear_discovery_hash(hass, discovery_hash)
+            async_dispatcher_send(
+                hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None
+            )
+            async_handle_schema_error(discovery_payload, err)
+        except Exception:  # pylint: disable=broad-except
+            discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
+            clear_discovery_hash(hass, discovery_hash)
+            async_dispatcher_send(
+                hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None
+            )
+            _LOGGER.exception(
+                "Error setting up discovered MQTT %s %s", domain, discovery_hash[1]
+            )
 
 
 class _SetupNonEntityHelperCallbackProtocol(Protocol):  # pragma: no cover
@@ -362,28 +371,34 @@ async def async_setup_entity_entry_helper(
     """Set up entity creation dynamically through MQTT discovery."""
     mqtt_data = get_mqtt_data(hass)
 
-    @callback
-    def async_setup_from_discovery(
-        discovery_payload: MQTTDiscoveryPayload,
+    async def async_setup_from_discovery(
+        discovery_payloads: list[MQTTDiscoveryPayload],
     ) -> None:
-        """Set up an MQTT entity from discovery."""
-        nonlocal entity_class
-        config: DiscoveryInfoType = discovery_schema(discovery_payload)
-        if schema_class_mapping is not None:
-            entity_class = schema_class_mapping[config[CONF_SCHEMA]]
-        if TYPE_CHECKING:
-            assert entity_class is not None
-        async_add_entities(
-            [entity_class(hass, config, entry, discovery_payload.discovery_data)]
+        """Set up MQTT entities from discovery and add them together."""
+        entities: list[Entity] = []
+
+        @callback
+        def async_setup_entity(discovery_payload: MQTTDiscoveryPayload) -> None:
+            """Set up an MQTT entity from discovery."""
+            nonlocal entity_class
+            config: DiscoveryInfoType = discovery_schema(discovery_payload)
+            if schema_class_mapping is not None:
+                entity_class = schema_class_mapping[config[CONF_SCHEMA]]
+            if TYPE_CHECKING:
+                assert entity_class is not None
+            entities.append(
+                entity_class(hass, config, entry, discovery_payload.discovery_data)
+            )
+
+        await _async_discover(
+            hass, domain, async_setup_entity, None, discovery_payloads
         )
+        if entities:
+            async_add_entities(entities)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
-            hass,
-            MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
-            functools.partial(
-                _async_discover, hass, domain, async_setup_from_discovery, None
-            ),
+            hass, MQTT_DISCOVERY_NEW.format(domain, "mqtt"), async_setup_from_discovery
         )
     )
 
@@ -542,7 +557,9 @@ class MqttAttributes(Entity):
             """Update extra state attributes."""
             payload = attr_tpl(msg.payload)
             try:
-                json_dict = json_loads(payload) if isinstance(payload, str) else None
+                json_dict = (
+                    json_loads_payload(payload) if isinstance(payload, str) else None
+                )
                 if isinstance(json_dict, dict):
                     filtered_dict = {
                         k: v
@@ -8,6 +8,7 @@ from collections import deque
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import lru_cache
 import logging
 from typing import TYPE_CHECKING, Any, TypedDict
 
@@ -20,6 +21,7 @@ from homeassistant.helpers import template
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, TemplateVarsType
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, JsonValueType, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -44,6 +46,9 @@ _LOGGER = logging.getLogger(__name__)
 
 ATTR_THIS = "this"
 
+# Number of parsed JSON payloads which are kept
+JSON_PAYLOAD_CACHE_SIZE = 64
+
 PublishPayloadType = str | bytes | int | float | None
 
 
@@ -257,6 +262,32 @@ class MqttValueTemplateException(TemplateError):
         return self._message
 
 
+@lru_cache(JSON_PAYLOAD_CACHE_SIZE)
+def _json_loads_payload(payload: ReceivePayloadType) -> tuple[bool, JsonValueType]:
+    """Parse a JSON payload and return if it is valid with the parsed value.
+
+    An invalid payload is cached too since lru_cache does not cache
+    exceptions.
+    """
+    try:
+        return True, json_loads(payload)
+    except JSON_DECODE_EXCEPTIONS:
+        return False, None
+
+
+def json_loads_payload(payload: ReceivePayloadType) -> JsonValueType:
+    """Parse a JSON payload.
+
+    The subscribers of a message receive the same payload, so it is only
+    parsed once for all of them. The parsed object is shared and must not
+    be modified. Raises ValueError if the payload is not valid JSON.
+    """
+    valid, value = _json_loads_payload(payload)
+    if not valid:
+        raise ValueError("Payload is not valid JSON")
+    return value
+
+
 class MqttValueTemplate:
     """Class for rendering MQTT value template with possible json values."""
 
@@ -311,6 +342,11 @@ class MqttValueTemplate:
                 )
             values[ATTR_THIS] = self._template_state
 
+        if not self._value_template.is_static:
+            valid, value_json = _json_loads_payload(payload)
+            if valid:
+                values["value_json"] = value_json
+
         if default is PayloadSentinel.NONE:
             _LOGGER.debug(
                 "Rendering incoming payload '%s' with variables %s and %s",
@@ -321,7 +357,7 @@ class MqttValueTemplate:
             try:
                 rendered_payload = (
                     self._value_template.async_render_with_possible_json_value(
-                        payload, variables=values
+                        payload, variables=values, parse_json=False
                     )
                 )
             except TEMPLATE_ERRORS as exc:
@@ -347,7 +383,7 @@ class MqttValueTemplate:
         try:
             rendered_payload = (
                 self._value_template.async_render_with_possible_json_value(
-                    payload, default, variables=values
+                    payload, default, variables=values, parse_json=False
                 )
             )
         except TEMPLATE_ERRORS as exc:
@@ -406,6 +442,10 @@ class MqttData:
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
+    # The last payload processed for each discovered item
+    discovery_payloads: dict[tuple[str, str], ReceivePayloadType] = field(
+        default_factory=dict
+    )
     discovery_registry_hooks: dict[tuple[str, str], CALLBACK_TYPE] = field(
         default_factory=dict
     )
@@ -0,0 +1,143 @@
+"""Match MQTT topics against subscribed topic filters."""
+
+from __future__ import annotations
+
+from itertools import count
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+MULTI_LEVEL_WILDCARD = "#"
+SINGLE_LEVEL_WILDCARD = "+"
+
+
+class _TopicTrieNode(Generic[_T]):
+    """A level of the topic filters in the trie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        # The values of the topic filters ending at this level,
+        # mapped to the order they were added in
+        self.values: dict[_T, int] = {}
+
+
+class TopicTrie(Generic[_T]):
+    """Store values by topic filter and find the values matching a topic.
+
+    The filters are split into levels and stored in a prefix tree, so a
+    match only visits the levels which can match the topic, including the
+    + and # wildcards, instead of every filter. Values are returned in the
+    order they were added.
+
+    As in the MQTT specification, wildcards in the first level do not match
+    topics starting with $.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._counter = count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return self._size
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if any value is stored for the topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        if value not in node.values:
+            node.values[value] = next(self._counter)
+            self._size += 1
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value is not stored for the topic filter.
+        """
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.values[value]
+        self._size -= 1
+        # Prune the levels which no longer lead to any value
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def values(self) -> list[_T]:
+        """Return all values."""
+        found: list[dict[_T, int]] = []
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            if node.values:
+                found.append(node.values)
+            nodes.extend(node.children.values())
+        return _merge_values(found)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of the topic filters matching a topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        allow_wildcard_root = not topic.startswith("$")
+        found: list[dict[_T, int]] = []
+        nodes: list[tuple[_TopicTrieNode[_T], int]] = [(self._root, 0)]
+        while nodes:
+            node, index = nodes.pop()
+            children = node.children
+            allow_wildcard = allow_wildcard_root or index > 0
+            # A multi level wildcard also matches the parent level
+            if (
+                allow_wildcard
+                and (multi_level := children.get(MULTI_LEVEL_WILDCARD)) is not None
+                and multi_level.values
+            ):
+                found.append(multi_level.values)
+            if index == depth:
+                if node.values:
+                    found.append(node.values)
+                continue
+            if (child := children.get(levels[index])) is not None:
+                nodes.append((child, index + 1))
+            if (
+                allow_wildcard
+                and (single_level := children.get(SINGLE_LEVEL_WILDCARD)) is not None
+            ):
+                nodes.append((single_level, index + 1))
+        return _merge_values(found)
+
+
+def _merge_values(found: list[dict[_T, int]]) -> list[_T]:
+    """Merge the values of several nodes in the order they were added."""
+    if not found:
+        return []
+    if len(found) == 1:
+        return list(found[0])
+    return [
+        value
+        for value, _ in sorted(
+            (item for values in found for item in values.items()),
+            key=lambda item: item[1],
+        )
+    ]
@@ -51,6 +51,10 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_BULK_INSERT = False
+DEFAULT_ADAPTIVE_COMMIT = False
+DEFAULT_READ_POOL = False
+DEFAULT_READ_POOL_SIZE = 4
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
@@ -61,6 +65,11 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_ADAPTIVE_COMMIT = "adaptive_commit"
+CONF_READ_POOL = "read_pool"
+CONF_READ_POOL_SIZE = "read_pool_size"
+CONF_READ_DB_URL = "read_db_url"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -104,6 +113,17 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_ADAPTIVE_COMMIT, default=DEFAULT_ADAPTIVE_COMMIT
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_BULK_INSERT, default=DEFAULT_BULK_INSERT
+                    ): cv.boolean,
+                    vol.Optional(CONF_READ_POOL, default=DEFAULT_READ_POOL): cv.boolean,
+                    vol.Optional(
+                        CONF_READ_POOL_SIZE, default=DEFAULT_READ_POOL_SIZE
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(CONF_READ_DB_URL): vol.All(cv.string, validate_db_url),
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -141,11 +161,18 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    adaptive_commit = conf[CONF_ADAPTIVE_COMMIT]
+    bulk_insert = conf[CONF_BULK_INSERT]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
+    # Configuring a replica implies a read pool
+    read_db_url = conf.get(CONF_READ_DB_URL)
+    read_pool_size = (
+        conf[CONF_READ_POOL_SIZE] if conf[CONF_READ_POOL] or read_db_url else None
+    )
     exclude = conf[CONF_EXCLUDE]
     exclude_event_types: set[EventType[Any] | str] = set(
         exclude.get(CONF_EVENT_TYPES, [])
@@ -164,6 +191,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        bulk_insert=bulk_insert,
+        adaptive_commit=adaptive_commit,
+        read_pool_size=read_pool_size,
+        read_db_url=read_db_url,
     )
     instance.async_initialize()
     instance.async_register()
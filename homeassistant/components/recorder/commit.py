@@ -0,0 +1,89 @@
+"""Adaptive commit interval for the recorder."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .const import (
+    ADAPTIVE_COMMIT_BURST_BACKLOG,
+    ADAPTIVE_COMMIT_IDLE_BACKLOG,
+    ADAPTIVE_COMMIT_MAX_DUTY_CYCLE,
+    ADAPTIVE_COMMIT_MAX_INTERVAL,
+    ADAPTIVE_COMMIT_MIN_INTERVAL,
+)
+
+# Weight of the newest sample in the moving averages
+_SMOOTHING = 0.2
+
+
+class AdaptiveCommitInterval:
+    """Scale the commit interval with the backlog and commit latency.
+
+    Under light load the recorder commits often so history stays fresh.
+    When the backlog grows the interval is doubled until the backlog
+    shrinks again, which results in larger and rarer transactions that
+    have a much higher throughput. The interval never drops below the
+    time needed to commit divided by the maximum duty cycle so a slow
+    database is not kept busy committing all the time.
+
+    record_commit is called from the recorder thread and next_interval
+    from the event loop. Both only replace floats and ints so no lock
+    is needed.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the adaptive commit interval."""
+        self.interval = min(
+            max(interval, ADAPTIVE_COMMIT_MIN_INTERVAL), ADAPTIVE_COMMIT_MAX_INTERVAL
+        )
+        self.pending_rows = 0
+        self.commits = 0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+        self.average_batch_size = 0.0
+        self.average_commit_time = 0.0
+
+    def record_commit(self, duration: float) -> None:
+        """Record a commit of the pending rows that took duration seconds.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        rows = self.pending_rows
+        self.pending_rows = 0
+        self.last_batch_size = rows
+        self.max_batch_size = max(self.max_batch_size, rows)
+        if self.commits:
+            self.average_batch_size += _SMOOTHING * (rows - self.average_batch_size)
+            self.average_commit_time += _SMOOTHING * (
+                duration - self.average_commit_time
+            )
+        else:
+            self.average_batch_size = rows
+            self.average_commit_time = duration
+        self.commits += 1
+
+    def next_interval(self, backlog: int) -> float:
+        """Return the number of seconds until the next commit."""
+        interval = self.interval
+        if backlog >= ADAPTIVE_COMMIT_BURST_BACKLOG:
+            interval *= 2
+        elif backlog <= ADAPTIVE_COMMIT_IDLE_BACKLOG:
+            interval /= 2
+        interval = max(
+            interval, self.average_commit_time / ADAPTIVE_COMMIT_MAX_DUTY_CYCLE
+        )
+        self.interval = min(
+            max(interval, ADAPTIVE_COMMIT_MIN_INTERVAL), ADAPTIVE_COMMIT_MAX_INTERVAL
+        )
+        return self.interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the current interval and batch statistics."""
+        return {
+            "effective_commit_interval": round(self.interval, 2),
+            "last_commit_batch_size": self.last_batch_size,
+            "average_commit_batch_size": round(self.average_batch_size, 1),
+            "max_commit_batch_size": self.max_batch_size,
+            "average_commit_time": round(self.average_commit_time * 1000, 1),
+        }
@@ -49,11 +49,22 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 KEEPALIVE_TIME = 30
 
+# Bounds of the commit interval in seconds when adaptive commits are enabled
+ADAPTIVE_COMMIT_MIN_INTERVAL = 1
+ADAPTIVE_COMMIT_MAX_INTERVAL = 30
+# Backlog at or below which the interval is shortened to keep history fresh
+ADAPTIVE_COMMIT_IDLE_BACKLOG = 10
+# Backlog at or above which the interval is lengthened to batch more rows
+ADAPTIVE_COMMIT_BURST_BACKLOG = 1000
+# Maximum share of the time the recorder should spend committing
+ADAPTIVE_COMMIT_MAX_DUTY_CYCLE = 0.25
+
 STATISTICS_ROWS_SCHEMA_VERSION = 23
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+STATISTICS_ROLLUPS_SCHEMA_VERSION = 44
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
@@ -38,6 +38,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -49,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .commit import AdaptiveCommitInterval
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -88,15 +90,16 @@ from .migration import (
     EventsContextIDMigration,
     EventTypeIDMigration,
     StatesContextIDMigration,
+    StatisticsRollupMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .pool import POOL_SIZE, MutexPool, RecorderPool, RecorderReadPool
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import StatesBulkBuffer, StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -114,6 +117,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    StatisticsRollupMigrationTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -132,6 +136,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection_for_dialect,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -164,6 +169,32 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
 
+def _is_mysql_url(db_url: str) -> bool:
+    """Return if the database url is a MySQL or MariaDB url."""
+    return db_url.startswith(
+        (
+            MARIADB_URL_PREFIX,
+            MARIADB_PYMYSQL_URL_PREFIX,
+            MYSQLDB_URL_PREFIX,
+            MYSQLDB_PYMYSQL_URL_PREFIX,
+        )
+    )
+
+
+def _mysql_connect_args(db_url: str) -> dict[str, Any]:
+    """Return the connect args for a MySQL or MariaDB url."""
+    connect_args: dict[str, Any] = {"charset": "utf8mb4"}
+    if db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
+        # If they have configured MySQLDB but don't have
+        # the MySQLDB module installed this will throw
+        # an ImportError which we suppress here since
+        # sqlalchemy will give them a better error when
+        # it tried to import it below.
+        with contextlib.suppress(ImportError):
+            connect_args["conv"] = build_mysqldb_conv()
+    return connect_args
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -181,6 +212,10 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert: bool = False,
+        adaptive_commit: bool = False,
+        read_pool_size: int | None = None,
+        read_db_url: str | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -193,8 +228,19 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.bulk_insert = bulk_insert
+        # Adaptive commits only apply when commits are batched
+        self.adaptive_commit: AdaptiveCommitInterval | None = (
+            AdaptiveCommitInterval(commit_interval)
+            if adaptive_commit and commit_interval
+            else None
+        )
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
+        # Reads use a separate pool of read_pool_size connections
+        # to read_db_url, which may be a replica, when set
+        self.read_pool_size = read_pool_size
+        self.read_db_url = read_db_url or uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.database_engine: DatabaseEngine | None = None
@@ -207,6 +253,7 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        self.read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -222,6 +269,7 @@ class Recorder(threading.Thread):
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
+        self.states_bulk_buffer: StatesBulkBuffer | None = None
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
@@ -230,11 +278,13 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.statistics_rollups_active = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
@@ -282,10 +332,33 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for reading.
+
+        The session uses the read pool once it is set up. The recorder
+        thread always uses its own engine so it sees its own writes even
+        when the read pool points at a replica.
+        """
+        if self._get_read_session is None or threading.get_ident() == self.thread_id:
+            return self.get_session()
+        return self._get_read_session()
+
     def queue_task(self, task: RecorderTask | Event) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
 
+    def queue_statistics_rollups_rebuild(self) -> None:
+        """Compile the statistics rollups again after a time zone change.
+
+        Statistics are reduced from the hourly statistics until the
+        rollups have been compiled again. This call is thread-safe.
+        """
+        if not self.statistics_rollups_active:
+            return
+        _LOGGER.info("Time zone changed, compiling statistics rollups again")
+        self.statistics_rollups_active = False
+        self.queue_task(StatisticsRollupMigrationTask())
+
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
@@ -363,6 +436,22 @@ class Recorder(threading.Thread):
         ):
             self.queue_task(COMMIT_TASK)
 
+    @callback
+    def _async_adaptive_commit(self, now: datetime) -> None:
+        """Queue a commit and schedule the next one."""
+        self._async_commit(now)
+        self._async_schedule_adaptive_commit()
+
+    @callback
+    def _async_schedule_adaptive_commit(self) -> None:
+        """Schedule the next commit based on the backlog and commit latency."""
+        assert self.adaptive_commit is not None
+        self._commit_listener = async_call_later(
+            self.hass,
+            self.adaptive_commit.next_interval(self.backlog),
+            self._async_adaptive_commit,
+        )
+
     @callback
     def async_add_executor_job(
         self, target: Callable[..., T], *args: Any
@@ -660,7 +749,9 @@ class Recorder(threading.Thread):
             )
 
         # If the commit interval is not 0, we need to commit periodically
-        if self.commit_interval:
+        if self.adaptive_commit:
+            self._async_schedule_adaptive_commit()
+        elif self.commit_interval:
             self._commit_listener = async_track_time_interval(
                 self.hass,
                 self._async_commit,
@@ -779,6 +870,7 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        self._setup_read_connection()
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
@@ -829,6 +921,15 @@ class Recorder(threading.Thread):
                     ):
                         self.queue_task(EntityIDPostMigrationTask())
 
+            migrator = StatisticsRollupMigration(
+                session, schema_version, migration_changes
+            )
+            if migrator.needs_migrate():
+                self.queue_task(migrator.task())
+            else:
+                _LOGGER.debug("Activating statistics rollups as all data is migrated")
+                self.statistics_rollups_active = True
+
             if self.schema_version > LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION:
                 with contextlib.suppress(SQLAlchemyError):
                     # If the index of event_ids on the states table is still present
@@ -1029,9 +1130,14 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
         if event.event_type == EVENT_STATE_CHANGED:
-            self._process_state_changed_event_into_session(event)
+            if self.states_bulk_buffer is not None:
+                self._process_state_changed_event_into_bulk_buffer(event)
+            else:
+                self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
+        if self.adaptive_commit:
+            self.adaptive_commit.pending_rows += 1
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
@@ -1122,32 +1228,120 @@ class Recorder(threading.Thread):
             return
 
         # Map the entity_id to the StatesMeta table
-        if pending_states_meta := states_meta_manager.get_pending(entity_id):
-            dbstate.states_meta_rel = pending_states_meta
-        elif metadata_id := states_meta_manager.get(entity_id, session, True):
+        if not (
+            states_meta_ref := self._get_or_add_states_meta(
+                session, entity_id, entity_removed
+            )
+        ):
+            return
+        metadata_id, states_meta = states_meta_ref
+        if states_meta is not None:
+            dbstate.states_meta_rel = states_meta
+        else:
             dbstate.metadata_id = metadata_id
-        elif states_meta_manager.active and entity_removed:
+
+        # Map the event data to the StateAttributes table
+        dbstate.attributes = None
+        attributes_id, state_attributes = self._get_or_add_state_attributes(
+            session, shared_attrs_bytes
+        )
+        if state_attributes is not None:
+            dbstate.state_attributes = state_attributes
+        else:
+            dbstate.attributes_id = attributes_id
+
+        self._add_to_session(session, dbstate)
+
+    def _process_state_changed_event_into_bulk_buffer(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Process a state_changed event into the states bulk buffer."""
+        states_bulk_buffer = self.states_bulk_buffer
+        assert states_bulk_buffer is not None
+        assert self.event_session is not None
+        session = self.event_session
+        entity_removed = not event.data.get("new_state")
+        entity_id = event.data["entity_id"]
+        old_state = event.data["old_state"]
+
+        states_manager = self.states_manager
+        old_state_id: int | None = None
+        if (old_state_row := states_bulk_buffer.pop_pending(entity_id)) is not None:
+            if old_state:
+                states_bulk_buffer.set_last_reported(
+                    old_state_row, old_state.last_reported_timestamp
+                )
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            if old_state:
+                states_manager.update_pending_last_reported(
+                    old_state_id, old_state.last_reported_timestamp
+                )
+
+        if entity_id is None or not (
+            shared_attrs_bytes := self.state_attributes_manager.serialize_from_event(
+                event
+            )
+        ):
+            return
+
+        if not (
+            states_meta_ref := self._get_or_add_states_meta(
+                session, entity_id, entity_removed
+            )
+        ):
+            return
+        metadata_id, states_meta = states_meta_ref
+        attributes_id, state_attributes = self._get_or_add_state_attributes(
+            session, shared_attrs_bytes
+        )
+        row = states_bulk_buffer.append(
+            event,
+            None if self.states_meta_manager.active else entity_id,
+            metadata_id,
+            states_meta,
+            attributes_id,
+            state_attributes,
+            old_state_id,
+            old_state_row,
+        )
+        if not entity_removed:
+            states_bulk_buffer.add_pending(entity_id, row)
+        self._event_session_has_pending_writes = True
+
+    def _get_or_add_states_meta(
+        self, session: Session, entity_id: str, entity_removed: bool
+    ) -> tuple[int | None, StatesMeta | None] | None:
+        """Map an entity_id to its metadata_id or a pending StatesMeta.
+
+        Returns None if the state should not be recorded.
+        """
+        states_meta_manager = self.states_meta_manager
+        if pending_states_meta := states_meta_manager.get_pending(entity_id):
+            return None, pending_states_meta
+        if metadata_id := states_meta_manager.get(entity_id, session, True):
+            return metadata_id, None
+        if states_meta_manager.active and entity_removed:
             # If the entity was removed, we don't need to add it to the
             # StatesMeta table or record it in the pending commit
             # if it does not have a metadata_id allocated to it as
             # it either never existed or was just renamed.
-            return
-        else:
-            states_meta = StatesMeta(entity_id=entity_id)
-            states_meta_manager.add_pending(states_meta)
-            self._add_to_session(session, states_meta)
-            dbstate.states_meta_rel = states_meta
-
-        # Map the event data to the StateAttributes table
+            return None
+        states_meta = StatesMeta(entity_id=entity_id)
+        states_meta_manager.add_pending(states_meta)
+        self._add_to_session(session, states_meta)
+        return None, states_meta
+
+    def _get_or_add_state_attributes(
+        self, session: Session, shared_attrs_bytes: bytes
+    ) -> tuple[int | None, StateAttributes | None]:
+        """Map shared attributes to their attributes_id or a pending StateAttributes."""
+        state_attributes_manager = self.state_attributes_manager
         shared_attrs = shared_attrs_bytes.decode("utf-8")
-        dbstate.attributes = None
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
-            dbstate.state_attributes = pending_event_data
+            return None, pending_event_data
         # Matching attributes id found in the cache
-        elif (
-            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
-        ) or (
+        if (attributes_id := state_attributes_manager.get_from_cache(shared_attrs)) or (
             (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
             and (
                 attributes_id := state_attributes_manager.get(
@@ -1155,15 +1349,12 @@ class Recorder(threading.Thread):
                 )
             )
         ):
-            dbstate.attributes_id = attributes_id
-        else:
-            # No matching attributes found, save them in the DB
-            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
-            state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
-
-        self._add_to_session(session, dbstate)
+            return attributes_id, None
+        # No matching attributes found, save them in the DB
+        dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+        state_attributes_manager.add_pending(dbstate_attributes)
+        self._add_to_session(session, dbstate_attributes)
+        return None, dbstate_attributes
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1202,6 +1393,12 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        start_time = time.monotonic()
+
+        if states_bulk_buffer := self.states_bulk_buffer:
+            # Flush first so pending StatesMeta and StateAttributes have ids
+            session.flush()
+            states_bulk_buffer.write(session)
 
         if (
             pending_last_reported
@@ -1219,6 +1416,8 @@ class Recorder(threading.Thread):
                     ],
                 )
         session.commit()
+        if self.adaptive_commit:
+            self.adaptive_commit.record_commit(time.monotonic() - start_time)
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1226,6 +1425,8 @@ class Recorder(threading.Thread):
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
+        if states_bulk_buffer:
+            states_bulk_buffer.post_commit_pending(self.states_manager)
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
@@ -1248,10 +1449,13 @@ class Recorder(threading.Thread):
         self.recorder_runs_manager.reset()
         self._setup_recorder()
         self._setup_run()
+        self._setup_read_connection()
 
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        if self.states_bulk_buffer is not None:
+            self.states_bulk_buffer.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
@@ -1297,6 +1501,10 @@ class Recorder(threading.Thread):
         """Migrate entity_ids if needed."""
         return migration.migrate_entity_ids(self)
 
+    def _migrate_statistics_rollups(self, end_ts: float | None) -> float | None:
+        """Migrate statistics rollups if needed."""
+        return migration.migrate_statistics_rollups(self, end_ts)
+
     def _post_migrate_entity_ids(self) -> bool:
         """Post migrate entity_ids if needed."""
         return migration.post_migrate_entity_ids(self)
@@ -1411,23 +1619,8 @@ class Recorder(threading.Thread):
             kwargs["pool_reset_on_return"] = None
         elif self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
-        elif self.db_url.startswith(
-            (
-                MARIADB_URL_PREFIX,
-                MARIADB_PYMYSQL_URL_PREFIX,
-                MYSQLDB_URL_PREFIX,
-                MYSQLDB_PYMYSQL_URL_PREFIX,
-            )
-        ):
-            kwargs["connect_args"] = {"charset": "utf8mb4"}
-            if self.db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
-                # If they have configured MySQLDB but don't have
-                # the MySQLDB module installed this will throw
-                # an ImportError which we suppress here since
-                # sqlalchemy will give them a better error when
-                # it tried to import it below.
-                with contextlib.suppress(ImportError):
-                    kwargs["connect_args"]["conv"] = build_mysqldb_conv()
+        elif _is_mysql_url(self.db_url):
+            kwargs["connect_args"] = _mysql_connect_args(self.db_url)
 
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
@@ -1438,14 +1631,73 @@ class Recorder(threading.Thread):
 
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
+        self.states_bulk_buffer = None
+        if self.bulk_insert:
+            if self.engine.dialect.insert_executemany_returning:
+                self.states_bulk_buffer = StatesBulkBuffer()
+            else:
+                _LOGGER.warning(
+                    "The %s database does not support RETURNING for bulk"
+                    " inserts; states will be written one at a time",
+                    self.engine.dialect.name,
+                )
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_connection(self) -> None:
+        """Set up the read pool once the database is ready to use."""
+        if self.read_pool_size is None:
+            return
+        if self.read_db_url == SQLITE_URL_PREFIX or ":memory:" in self.read_db_url:
+            _LOGGER.warning(
+                "The read pool is not supported with in-memory SQLite databases"
+            )
+            return
+        kwargs: dict[str, Any] = {
+            "poolclass": RecorderReadPool,
+            "pool_size": self.read_pool_size,
+            "max_overflow": 0,
+            "pool_pre_ping": True,
+        }
+        if self.read_db_url.startswith(SQLITE_URL_PREFIX):
+            kwargs["connect_args"] = {"check_same_thread": False}
+        else:
+            kwargs["echo"] = False
+            if _is_mysql_url(self.read_db_url):
+                kwargs["connect_args"] = _mysql_connect_args(self.read_db_url)
+        try:
+            self.read_engine = create_engine(self.read_db_url, **kwargs, future=True)
+        except (SQLAlchemyError, ImportError):
+            _LOGGER.exception(
+                "Error setting up the read pool, reads will use the recorder pool"
+            )
+            return
+        sqlalchemy_event.listen(
+            self.read_engine, "connect", self._setup_read_only_connection
+        )
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self.read_engine, future=True)
+        )
+        _LOGGER.debug("Connected to recorder read database")
+
+    def _setup_read_only_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific read only connection settings."""
+        assert self.read_engine is not None
+        setup_read_only_connection_for_dialect(
+            self, self.read_engine.dialect.name, dbapi_connection
+        )
+
     def _close_connection(self) -> None:
         """Close the connection."""
+        self._get_read_session = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
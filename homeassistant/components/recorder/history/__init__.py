@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
@@ -16,8 +23,10 @@ from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columnar as _modern_get_significant_states_columnar,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states as _modern_stream_significant_states,
 )
 
 # These are the APIs of this package
@@ -27,8 +36,10 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columnar",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states",
 ]
 
 
@@ -91,17 +102,32 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    resolution: float | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    Downsampling to resolution is not supported by the legacy schema and
+    raises NotImplementedError.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
+        _raise_if_downsampled(resolution)
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states as _legacy_get_significant_states,
         )
 
-        _target = _legacy_get_significant_states
-    else:
-        _target = _modern_get_significant_states
-    return _target(
+        return _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_significant_states(
         hass,
         start_time,
         end_time,
@@ -112,9 +138,104 @@ def get_significant_states(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        resolution,
     )
 
 
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    resolution: float | None = None,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return the significant states of each entity as columns.
+
+    The legacy schema converts compressed states to columns and does
+    not support downsampling to resolution, which raises NotImplementedError.
+    """
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_columnar(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            resolution,
+        )
+    _raise_if_downsampled(resolution)
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    states = cast(
+        dict[str, list[dict[str, Any]]],
+        _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+    return {
+        entity_id: _compressed_states_to_columns(compressed_states)
+        for entity_id, compressed_states in states.items()
+    }
+
+
+def _raise_if_downsampled(resolution: float | None) -> None:
+    """Raise if downsampling is requested from the legacy schema."""
+    if resolution:
+        raise NotImplementedError("Downsampling is not supported by the legacy schema")
+
+
+def _compressed_states_to_columns(
+    compressed_states: list[dict[str, Any]],
+) -> dict[str, list[Any]]:
+    """Convert the compressed states of an entity to columns."""
+    last_changed_log: list[list[Any]] = []
+    attributes_log: list[list[Any]] = []
+    prev_attributes: dict[str, Any] | None = None
+    for idx, compressed_state in enumerate(compressed_states):
+        if COMPRESSED_STATE_LAST_CHANGED in compressed_state:
+            last_changed_log.append(
+                [idx, compressed_state[COMPRESSED_STATE_LAST_CHANGED]]
+            )
+        if (
+            attributes := compressed_state.get(COMPRESSED_STATE_ATTRIBUTES)
+        ) is not None and attributes != prev_attributes:
+            prev_attributes = attributes
+            attributes_log.append([idx, attributes])
+    columns: dict[str, list[Any]] = {
+        COMPRESSED_STATE_STATE: [
+            compressed_state[COMPRESSED_STATE_STATE]
+            for compressed_state in compressed_states
+        ],
+        COMPRESSED_STATE_LAST_UPDATED: [
+            compressed_state[COMPRESSED_STATE_LAST_UPDATED]
+            for compressed_state in compressed_states
+        ],
+    }
+    if last_changed_log:
+        columns[COMPRESSED_STATE_LAST_CHANGED] = last_changed_log
+    if attributes_log:
+        columns[COMPRESSED_STATE_ATTRIBUTES] = attributes_log
+    return columns
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -127,17 +248,33 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    resolution: float | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    Downsampling to resolution is not supported by the legacy schema and
+    raises NotImplementedError.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
+        _raise_if_downsampled(resolution)
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states_with_session as _legacy_get_significant_states_with_session,
         )
 
-        _target = _legacy_get_significant_states_with_session
-    else:
-        _target = _modern_get_significant_states_with_session
-    return _target(
+        return _legacy_get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_significant_states_with_session(
         hass,
         session,
         start_time,
@@ -149,6 +286,54 @@ def get_significant_states_with_session(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        resolution,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+) -> Generator[tuple[str, list[dict[str, Any]]], None, None]:
+    """Yield the significant states of each entity in chunks.
+
+    The legacy schema does not support streaming so all states of
+    an entity are yielded as a single chunk.
+    """
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        states = cast(
+            dict[str, list[dict[str, Any]]],
+            _legacy_get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                False,
+                no_attributes,
+                True,
+            ),
+        )
+        yield from states.items()
+        return
+    yield from _modern_stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        no_attributes,
     )
 
 
@@ -2,6 +2,14 @@
 
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
+MIN_KEY = "min"
+MAX_KEY = "max"
+LAST_KEY = "last"
+# Key of the min, max and last log of downsampled columnar states
+MIN_MAX_KEY = "min_max"
+
+# Number of rows fetched and converted at a time by stream_significant_states
+EXPORT_CHUNK_SIZE = 1000
 
 SIGNIFICANT_DOMAINS = {
     "climate",
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import groupby, islice
+import math
 from operator import itemgetter
 from typing import Any, cast
 
@@ -17,12 +18,19 @@ from sqlalchemy import (
     lambda_stmt,
     literal,
     select,
+    tuple_,
     union_all,
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -37,9 +45,15 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
+    EXPORT_CHUNK_SIZE,
     LAST_CHANGED_KEY,
+    LAST_KEY,
+    MAX_KEY,
+    MIN_KEY,
+    MIN_MAX_KEY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
     STATE_KEY,
@@ -117,6 +131,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    resolution: float | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -132,6 +147,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            resolution,
         )
 
 
@@ -213,6 +229,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    resolution: float | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -224,13 +241,15 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    resolution is an optional number of seconds to downsample minimal
+    responses to, see _downsample_minimal_states.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
-    metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
     if not (
         entity_id_to_metadata_id := instance.states_meta_manager.get_many(
@@ -238,7 +257,265 @@ def get_significant_states_with_session(
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
         return {}
-    metadata_ids = possible_metadata_ids
+    stmt, start_time_ts = _significant_states_lambda_stmt(
+        hass,
+        start_time,
+        end_time,
+        entity_id_to_metadata_id,
+        possible_metadata_ids,
+        include_start_time_state,
+        significant_changes_only,
+        no_attributes,
+    )
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+        resolution=resolution,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+) -> Generator[tuple[str, list[dict[str, Any]]], None, None]:
+    """Yield the significant states of each entity in chunks.
+
+    Unlike get_significant_states the states of each entity are paged
+    through EXPORT_CHUNK_SIZE rows at a time by their last_updated_ts and
+    state_id, so memory use does not grow with the number of rows. The entities are
+    yielded one after another and the states of an entity can span
+    multiple chunks.
+
+    Each chunk is read with its own session which is closed before the
+    chunk is yielded, so the generator holds no database resources while
+    it is suspended and can be advanced from any database executor thread.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    instance = recorder.get_instance(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        entity_id_to_metadata_id = instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    if not metadata_id_to_entity_id:
+        return
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    chunk_size = EXPORT_CHUNK_SIZE
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    for metadata_id in sorted(metadata_id_to_entity_id):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        significant_metadata_ids = (
+            [metadata_id]
+            if significant_changes_only
+            and split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
+            else []
+        )
+        after_ts = start_time_ts
+        after_state_id: int | None = None
+        include_start_state = include_start_time_state
+        while True:
+            rows: list[Row] = []
+            page: list[Row] = []
+            with session_scope(hass=hass, read_only=True) as session:
+                if include_start_state:
+                    rows = list(
+                        session.execute(
+                            _stream_start_time_state_stmt(
+                                cast(float, run_start_ts),
+                                start_time_ts,
+                                metadata_id,
+                                significant_changes_only,
+                                no_attributes,
+                            )
+                        ).all()
+                    )
+                if (limit := chunk_size - len(rows)) > 0:
+                    page = list(
+                        session.execute(
+                            _stream_significant_states_stmt(
+                                after_ts,
+                                after_state_id,
+                                end_time_ts,
+                                metadata_id,
+                                bool(significant_metadata_ids),
+                                significant_changes_only,
+                                no_attributes,
+                            ).limit(limit)
+                        ).all()
+                    )
+            rows.extend(page)
+            attr_cache: dict[str, dict[str, Any]] = {}
+            chunk = [
+                row_to_compressed_state(
+                    row,
+                    attr_cache,
+                    start_time_ts if include_start_time_state else None,
+                    entity_id,
+                    row[state_idx],
+                    row[last_updated_ts_idx],
+                    no_attributes,
+                )
+                for row in rows
+            ]
+            if chunk:
+                yield entity_id, chunk
+            include_start_state = False
+            if limit > 0 and len(page) < limit:
+                break
+            if page:
+                after_ts = page[-1][last_updated_ts_idx]
+                after_state_id = page[-1].state_id
+
+
+def _stream_start_time_state_stmt(
+    run_start_ts: float,
+    start_time_ts: float,
+    metadata_id: int,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> Select:
+    """Query the state of an entity at the start time for streaming."""
+    include_last_changed = not significant_changes_only
+    return _select_from_subquery(
+        _get_start_time_state_stmt(
+            run_start_ts,
+            start_time_ts,
+            metadata_id,
+            [metadata_id],
+            no_attributes,
+            include_last_changed,
+        ).subquery(),
+        no_attributes,
+        include_last_changed,
+        False,
+    )
+
+
+def _stream_significant_states_stmt(
+    after_ts: float,
+    after_state_id: int | None,
+    end_time_ts: float | None,
+    metadata_id: int,
+    in_significant_domain: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> Select:
+    """Query the significant states of an entity after a keyset position.
+
+    The rows are ordered by last_updated_ts and state_id so rows sharing
+    a last_updated_ts are not lost at a page boundary.
+    """
+    stmt = _stmt_and_join_attributes(
+        no_attributes, not significant_changes_only, False
+    ).add_columns(States.state_id)
+    if significant_changes_only and not in_significant_domain:
+        stmt = stmt.filter(
+            (States.last_changed_ts == States.last_updated_ts)
+            | States.last_changed_ts.is_(None)
+        )
+    stmt = stmt.filter(States.metadata_id == metadata_id)
+    if after_state_id is None:
+        stmt = stmt.filter(States.last_updated_ts > after_ts)
+    else:
+        stmt = stmt.filter(
+            tuple_(States.last_updated_ts, States.state_id)
+            > tuple_(literal(after_ts), literal(after_state_id))
+        )
+    if end_time_ts:
+        stmt = stmt.filter(States.last_updated_ts < end_time_ts)
+    if not no_attributes:
+        stmt = stmt.outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+    return stmt.order_by(States.last_updated_ts, States.state_id)
+
+
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    resolution: float | None = None,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return the significant states of each entity as columns.
+
+    The states are selected like get_significant_states selects them
+    but they are converted to columns directly from the rows, see
+    _sorted_states_to_columns.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        instance = recorder.get_instance(hass)
+        if not (
+            entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+                entity_ids, session, False
+            )
+        ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+            return {}
+        stmt, start_time_ts = _significant_states_lambda_stmt(
+            hass,
+            start_time,
+            end_time,
+            entity_id_to_metadata_id,
+            metadata_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+        return _sorted_states_to_columns(
+            execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            not significant_changes_only,
+            no_attributes,
+            resolution,
+        )
+
+
+def _significant_states_lambda_stmt(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    metadata_ids: list[int],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, float | None]:
+    """Return the significant states statement and the start time timestamp.
+
+    The start time timestamp is None if the start time state is not included.
+    """
+    metadata_ids_in_significant_domains: list[int] = []
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
             metadata_id
@@ -275,15 +552,7 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
-        entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
-    )
+    return stmt, start_time_ts if include_start_time_state else None
 
 
 def get_full_significant_states_with_session(
@@ -680,6 +949,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    resolution: float | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -779,6 +1049,19 @@ def _sorted_states_to_dict(
         #
         # With minimal response we do not care about attribute
         # changes so we can filter out duplicate states
+        if resolution:
+            ent_results.extend(
+                _downsample_minimal_states(
+                    group,
+                    resolution,
+                    prev_state,
+                    attr_state,
+                    attr_time,
+                    compressed_state_format,
+                )
+            )
+            continue
+
         if compressed_state_format:
             # Compressed state format uses the timestamp directly
             ent_results.extend(
@@ -808,3 +1091,224 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _downsample_minimal_states(
+    rows: Iterator[Row],
+    resolution: float,
+    prev_state: str | None,
+    attr_state: str,
+    attr_time: str,
+    compressed_state_format: bool,
+) -> Iterator[dict[str, Any]]:
+    """Reduce the rows of an entity to one minimal state per time bucket.
+
+    Rows are reduced while they are streamed from the database so the
+    raw rows are never held in memory. The numeric states in a bucket of
+    resolution seconds are replaced by their mean at the time of the first
+    state in the bucket, along with the min, max and last value of the
+    bucket. Buckets with a single state are returned as they are. Non
+    numeric states, like unavailable, end the current bucket and are
+    returned as they are so gaps in the graphs are kept.
+    """
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    _utc_from_timestamp = dt_util.utc_from_timestamp
+    bucket = count = 0
+    total = minimum = maximum = last = first_ts = 0.0
+    first_state = ""
+
+    def _bucket_state() -> dict[str, Any] | None:
+        """Return the minimal state of the current bucket."""
+        nonlocal prev_state
+        if count == 1:
+            if first_state == prev_state:
+                return None
+            state = first_state
+        else:
+            state = str(total / count)
+        prev_state = state
+        minimal_state: dict[str, Any] = {
+            attr_state: state,
+            attr_time: first_ts
+            if compressed_state_format
+            else _utc_from_timestamp(first_ts).isoformat(),
+        }
+        if count > 1:
+            minimal_state[MIN_KEY] = minimum
+            minimal_state[MAX_KEY] = maximum
+            minimal_state[LAST_KEY] = last
+        return minimal_state
+
+    for row in rows:
+        state: str = row[state_idx]
+        last_updated_ts: float = row[last_updated_ts_idx]
+        try:
+            value = float(state)
+        except (TypeError, ValueError):
+            value = math.nan
+        if not math.isfinite(value):
+            if count and (minimal_state := _bucket_state()):
+                yield minimal_state
+            count = 0
+            if state != prev_state:
+                prev_state = state
+                yield {
+                    attr_state: state,
+                    attr_time: last_updated_ts
+                    if compressed_state_format
+                    else _utc_from_timestamp(last_updated_ts).isoformat(),
+                }
+            continue
+        row_bucket = int(last_updated_ts // resolution)
+        if count and row_bucket != bucket:
+            if minimal_state := _bucket_state():
+                yield minimal_state
+            count = 0
+        if not count:
+            bucket = row_bucket
+            first_ts = last_updated_ts
+            first_state = state
+            total = minimum = maximum = last = value
+            count = 1
+            continue
+        count += 1
+        total += value
+        last = value
+        if value < minimum:
+            minimum = value
+        elif value > maximum:
+            maximum = value
+
+    if count and (minimal_state := _bucket_state()):
+        yield minimal_state
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    include_last_changed: bool,
+    no_attributes: bool,
+    resolution: float | None,
+) -> dict[str, dict[str, list[Any]]]:
+    """Convert SQL results into columns.
+
+    The states of each entity are returned as parallel lists of states
+    and last_updated timestamps. The other fields are returned as logs
+    of [index, value] entries which are only added when the value is set:
+
+    - last_changed when it differs from last_updated
+    - attributes when they differ from the attributes of the previous state
+    - [index, min, max, last] of states which are the mean of a downsampled
+      bucket
+
+    States must be sorted by entity_id and last_updated. The minimal
+    response rules of _sorted_states_to_dict apply.
+    """
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    # The optional columns follow the fields in _FIELD_MAP
+    last_changed_ts_idx = len(_FIELD_MAP)
+    attributes_idx = last_changed_ts_idx + include_last_changed
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    result: dict[str, dict[str, list[Any]]] = {}
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        minimal = (
+            minimal_response
+            and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        )
+        states_column: list[str] = []
+        last_updated_column: list[float | None] = []
+        last_changed_log: list[list[Any]] = []
+        attributes_log: list[list[Any]] = []
+        attr_cache: dict[str, dict[str, Any]] = {}
+        prev_source: Any = None
+        # With minimal response only the first state is converted with all
+        # its fields, the other states are appended below
+        for row in islice(group, 1) if minimal else group:
+            idx = len(states_column)
+            states_column.append(row[state_idx])
+            last_updated_column.append(
+                last_updated_ts := row[last_updated_ts_idx] or start_time_ts
+            )
+            if (
+                include_last_changed
+                and (last_changed_ts := row[last_changed_ts_idx])
+                and last_changed_ts != last_updated_ts
+            ):
+                last_changed_log.append([idx, last_changed_ts])
+            if no_attributes:
+                continue
+            source = row[attributes_idx]
+            if not idx or source != prev_source:
+                prev_source = source
+                attributes_log.append(
+                    [idx, decode_attributes_from_source(source, attr_cache)]
+                )
+        columns: dict[str, list[Any]] = {
+            COMPRESSED_STATE_STATE: states_column,
+            COMPRESSED_STATE_LAST_UPDATED: last_updated_column,
+        }
+        if last_changed_log:
+            columns[COMPRESSED_STATE_LAST_CHANGED] = last_changed_log
+        if not no_attributes:
+            columns[COMPRESSED_STATE_ATTRIBUTES] = attributes_log
+        if minimal and states_column:
+            _append_minimal_states_to_columns(
+                columns, group, states_column[0], resolution
+            )
+        result[entity_id] = columns
+    # Keep the order of the requested entity ids
+    return {
+        entity_id: result[entity_id] for entity_id in entity_ids if entity_id in result
+    }
+
+
+def _append_minimal_states_to_columns(
+    columns: dict[str, list[Any]],
+    rows: Iterator[Row],
+    prev_state: str,
+    resolution: float | None,
+) -> None:
+    """Append the states which changed the state to the columns."""
+    states_column = columns[COMPRESSED_STATE_STATE]
+    last_updated_column = columns[COMPRESSED_STATE_LAST_UPDATED]
+    if resolution:
+        min_max_log: list[list[Any]] = []
+        for minimal_state in _downsample_minimal_states(
+            rows,
+            resolution,
+            prev_state,
+            COMPRESSED_STATE_STATE,
+            COMPRESSED_STATE_LAST_UPDATED,
+            True,
+        ):
+            if MIN_KEY in minimal_state:
+                min_max_log.append(
+                    [
+                        len(states_column),
+                        minimal_state[MIN_KEY],
+                        minimal_state[MAX_KEY],
+                        minimal_state[LAST_KEY],
+                    ]
+                )
+            states_column.append(minimal_state[COMPRESSED_STATE_STATE])
+            last_updated_column.append(minimal_state[COMPRESSED_STATE_LAST_UPDATED])
+        if min_max_log:
+            columns[MIN_MAX_KEY] = min_max_log
+        return
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    for row in rows:
+        if (state := row[state_idx]) != prev_state:
+            prev_state = state
+            states_column.append(state)
+            last_updated_column.append(row[last_updated_ts_idx])
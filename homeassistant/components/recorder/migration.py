@@ -52,6 +52,7 @@ from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -85,6 +86,7 @@ from .queries import (
     find_entity_ids_to_migrate,
     find_event_type_to_migrate,
     find_events_context_ids_to_migrate,
+    find_oldest_statistics_start_ts,
     find_states_context_ids_to_migrate,
     find_unmigrated_short_term_statistics_rows,
     find_unmigrated_statistics_rows,
@@ -92,11 +94,17 @@ from .queries import (
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
+    has_statistics_to_rollup,
     has_used_states_event_ids,
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import get_start_time
+from .statistics import (
+    STATISTICS_ROLLUP_TABLES,
+    compile_statistics_rollups,
+    get_start_time,
+    reduce_month_ts_factory,
+)
 from .tasks import (
     CommitTask,
     EntityIDMigrationTask,
@@ -105,6 +113,7 @@ from .tasks import (
     PostSchemaMigrationTask,
     RecorderTask,
     StatesContextIDMigrationTask,
+    StatisticsRollupMigrationTask,
     StatisticsTimestampMigrationCleanupTask,
 )
 from .util import (
@@ -1089,6 +1098,10 @@ def _apply_update(  # noqa: C901
             "states",
             [f"last_reported_ts {_column_types.timestamp_type}"],
         )
+    elif new_version == 44:
+        # The statistics_daily and statistics_monthly tables are created by
+        # create_all, they are filled by the StatisticsRollupMigration
+        pass
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -1751,6 +1764,37 @@ def cleanup_legacy_states_event_ids(instance: Recorder) -> bool:
     return True
 
 
+def migrate_statistics_rollups(
+    instance: Recorder, end_ts: float | None
+) -> float | None:
+    """Compile the daily and monthly statistics rollups of one month.
+
+    The months are compiled from the newest to the oldest, starting with
+    the current month when end_ts is None. Returns the start of the
+    compiled month, which is the end of the next month to compile, or
+    None when there are no older hourly statistics.
+    """
+    _, month_start_end = reduce_month_ts_factory()
+    if end_ts is None:
+        end_ts = month_start_end(time())[1]
+    with session_scope(session=instance.get_session()) as session:
+        oldest_start_ts = session.execute(find_oldest_statistics_start_ts()).scalar()
+        if oldest_start_ts is None or oldest_start_ts >= end_ts:
+            # Remove rollups left over from a previous time zone
+            for table in STATISTICS_ROLLUP_TABLES.values():
+                session.query(table).filter(table.start_ts < end_ts).delete(
+                    synchronize_session=False
+                )
+            _mark_migration_done(session, StatisticsRollupMigration)
+            _LOGGER.debug("Migrating statistics rollups: done")
+            return None
+        start_ts = month_start_end(end_ts - 1)[0]
+        compile_statistics_rollups(session, start_ts, end_ts - 1)
+
+    _LOGGER.debug("Migrating statistics rollups: compiled month starting %s", start_ts)
+    return start_ts
+
+
 def _initialize_database(session: Session) -> bool:
     """Initialize a new database.
 
@@ -1885,6 +1929,18 @@ class EntityIDMigration(BaseRunTimeMigration):
         return has_entity_ids_to_migrate()
 
 
+class StatisticsRollupMigration(BaseRunTimeMigration):
+    """Migration to compile the daily and monthly statistics rollups."""
+
+    required_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION
+    migration_id = "statistics_rollups"
+    task = StatisticsRollupMigrationTask
+
+    def needs_migrate_query(self) -> StatementLambdaElement:
+        """Check if there are hourly statistics to compile rollups for."""
+        return has_statistics_to_rollup()
+
+
 def _mark_migration_done(
     session: Session, migration: type[BaseRunTimeMigration]
 ) -> None:
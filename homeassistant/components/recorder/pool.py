@@ -2,6 +2,7 @@
 
 import logging
 import threading
+import time
 import traceback
 from typing import Any
 
@@ -9,6 +10,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.pool import (
     ConnectionPoolEntry,
     NullPool,
+    QueuePool,
     SingletonThreadPool,
     StaticPool,
 )
@@ -96,6 +98,56 @@ class RecorderPool(SingletonThreadPool, NullPool):  # type: ignore[misc]
         return NullPool._create_connection(self)
 
 
+class RecorderReadPool(QueuePool):
+    """A bounded pool of read only connections.
+
+    The connections are shared by all threads which read from the
+    database so reads never wait for the connection of the recorder
+    thread. Callers wait for a free connection when all connections are
+    checked out, how often and how long is tracked for system health.
+    """
+
+    def __init__(self, *args: Any, **kw: Any) -> None:
+        """Create the pool."""
+        super().__init__(*args, **kw)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.max_checked_out = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        check_loop(self._do_get_read_connection, strict=True, advise_msg=ADVISE_MSG)
+        return self._do_get_read_connection()
+
+    def _do_get_read_connection(self) -> ConnectionPoolEntry:
+        if self.checkedout() >= self.size():
+            start = time.monotonic()
+            try:
+                record = super()._do_get()
+            finally:
+                with self._stats_lock:
+                    self.waits += 1
+                    self.wait_time += time.monotonic() - start
+        else:
+            record = super()._do_get()
+        with self._stats_lock:
+            self.checkouts += 1
+            self.max_checked_out = max(self.max_checked_out, self.checkedout())
+        return record
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the size and usage of the pool."""
+        return {
+            "read_pool_size": self.size(),
+            "read_pool_checked_out": self.checkedout(),
+            "read_pool_max_checked_out": self.max_checked_out,
+            "read_pool_checkouts": self.checkouts,
+            "read_pool_waits": self.waits,
+            "read_pool_wait_time": round(self.wait_time * 1000, 1),
+        }
+
+
 class MutexPool(StaticPool):
     """A pool which prevents concurrent accesses from multiple threads.
 
@@ -58,6 +58,8 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -124,6 +126,73 @@ QUERY_STATISTICS_SUMMARY_SUM = (
     .label("rownum"),
 )
 
+QUERY_STATISTICS_DAILY_ROLLUP_SUMMARY_MEAN = (
+    Statistics.metadata_id,
+    func.avg(Statistics.mean),
+    func.min(Statistics.min),
+    func.max(Statistics.max),
+    func.count(Statistics.mean),
+)
+
+QUERY_STATISTICS_DAILY_ROLLUP_SUMMARY_SUM = (
+    Statistics.metadata_id,
+    Statistics.start_ts,
+    Statistics.last_reset_ts,
+    Statistics.state,
+    Statistics.sum,
+    func.row_number()
+    .over(
+        partition_by=Statistics.metadata_id,
+        order_by=Statistics.start_ts.desc(),
+    )
+    .label("rownum"),
+)
+
+QUERY_STATISTICS_MONTHLY_ROLLUP_SUMMARY_MEAN = (
+    StatisticsDaily.metadata_id,
+    func.sum(StatisticsDaily.mean * StatisticsDaily.hours)
+    / func.nullif(func.sum(StatisticsDaily.hours), 0),
+    func.min(StatisticsDaily.min),
+    func.max(StatisticsDaily.max),
+    func.coalesce(func.sum(StatisticsDaily.hours), 0),
+)
+
+QUERY_STATISTICS_MONTHLY_ROLLUP_SUMMARY_SUM = (
+    StatisticsDaily.metadata_id,
+    StatisticsDaily.start_ts,
+    StatisticsDaily.last_reset_ts,
+    StatisticsDaily.state,
+    StatisticsDaily.sum,
+    func.row_number()
+    .over(
+        partition_by=StatisticsDaily.metadata_id,
+        order_by=StatisticsDaily.start_ts.desc(),
+    )
+    .label("rownum"),
+)
+
+STATISTICS_ROLLUP_TABLES: dict[str, type[StatisticsDaily | StatisticsMonthly]] = {
+    "day": StatisticsDaily,
+    "month": StatisticsMonthly,
+}
+
+# The daily rollups are compiled from the hourly statistics and the monthly
+# rollups from the daily rollups, with the columns to select from the source
+_STATISTICS_ROLLUP_SOURCES: dict[
+    type[StatisticsDaily | StatisticsMonthly],
+    tuple[type[Statistics | StatisticsDaily], Select, Select],
+] = {
+    StatisticsDaily: (
+        Statistics,
+        select(*QUERY_STATISTICS_DAILY_ROLLUP_SUMMARY_MEAN),
+        select(*QUERY_STATISTICS_DAILY_ROLLUP_SUMMARY_SUM),
+    ),
+    StatisticsMonthly: (
+        StatisticsDaily,
+        select(*QUERY_STATISTICS_MONTHLY_ROLLUP_SUMMARY_MEAN),
+        select(*QUERY_STATISTICS_MONTHLY_ROLLUP_SUMMARY_SUM),
+    ),
+}
 
 STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
     **{unit: DataRateConverter for unit in DataRateConverter.VALID_UNITS},
@@ -439,6 +508,154 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    if summary:
+        # The rollups are compiled from the hourly statistics
+        session.flush()
+        compile_statistics_rollups(session, start_time_ts, start_time_ts)
+
+
+def _compile_statistics_rollup_summary_mean_stmt(
+    source: type[Statistics | StatisticsDaily],
+    columns: Select,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_id: int | None,
+) -> StatementLambdaElement:
+    """Generate the summary mean statement for statistics rollups."""
+    stmt = lambda_stmt(
+        lambda: columns.filter(source.start_ts >= start_time_ts).filter(
+            source.start_ts < end_time_ts
+        )
+    )
+    if metadata_id is not None:
+        stmt += lambda q: q.filter(source.metadata_id == metadata_id)
+    stmt += lambda q: q.group_by(source.metadata_id).order_by(source.metadata_id)
+    return stmt
+
+
+def _compile_statistics_rollup_last_sum_stmt(
+    source: type[Statistics | StatisticsDaily],
+    columns: Select,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_id: int | None,
+) -> StatementLambdaElement:
+    """Generate the last sum statement for statistics rollups."""
+    if metadata_id is None:
+        return lambda_stmt(
+            lambda: select(
+                subquery := (
+                    columns.filter(source.start_ts >= start_time_ts)
+                    .filter(source.start_ts < end_time_ts)
+                    .subquery()
+                )
+            )
+            .filter(subquery.c.rownum == 1)
+            .order_by(subquery.c.metadata_id)
+        )
+    return lambda_stmt(
+        lambda: select(
+            subquery := (
+                columns.filter(source.start_ts >= start_time_ts)
+                .filter(source.start_ts < end_time_ts)
+                .filter(source.metadata_id == metadata_id)
+                .subquery()
+            )
+        ).filter(subquery.c.rownum == 1)
+    )
+
+
+def _compile_statistics_rollup(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_id: int | None,
+) -> None:
+    """Compile a rollup of the statistics for one day or month.
+
+    This will summarize the statistics of the period the same way
+    _reduce_statistics does, a day from the hourly statistics and a month
+    from the daily rollups so only one row per day is read:
+    - average, min, max is computed by a database query, the average of a
+      month is weighted by the number of hours of each day
+    - last_reset, state and sum are taken from the last entry
+    """
+    source, mean_columns, sum_columns = _STATISTICS_ROLLUP_SOURCES[table]
+    summary: dict[int, StatisticDataTimestamp] = {}
+    hours: dict[int, int] = {}
+    stmt = _compile_statistics_rollup_summary_mean_stmt(
+        source, mean_columns, start_time_ts, end_time_ts, metadata_id
+    )
+    for stat in execute_stmt_lambda_element(session, stmt):
+        stat_metadata_id, _mean, _min, _max, _hours = stat
+        summary[stat_metadata_id] = {
+            "start_ts": start_time_ts,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+        hours[stat_metadata_id] = _hours
+
+    # Every statistic with rows in the period is in the summary
+    stmt = _compile_statistics_rollup_last_sum_stmt(
+        source, sum_columns, start_time_ts, end_time_ts, metadata_id
+    )
+    for stat in execute_stmt_lambda_element(session, stmt):
+        stat_metadata_id, _, last_reset_ts, state, _sum, _ = stat
+        summary[stat_metadata_id].update(
+            {"last_reset_ts": last_reset_ts, "state": state, "sum": _sum}
+        )
+
+    # Replace the rollups of the period, there are no rollups left for
+    # statistics which no longer have any rows in the period
+    query = session.query(table).filter(
+        table.start_ts >= start_time_ts, table.start_ts < end_time_ts
+    )
+    if metadata_id is not None:
+        query = query.filter(table.metadata_id == metadata_id)
+    query.delete(synchronize_session=False)
+    for stat_metadata_id, summary_item in summary.items():
+        rollup = table.from_stats_ts(stat_metadata_id, summary_item)
+        rollup.hours = hours[stat_metadata_id]
+        session.add(rollup)
+
+
+def _statistics_rollup_periods() -> (
+    list[
+        tuple[
+            type[StatisticsDaily | StatisticsMonthly],
+            Callable[[float], tuple[float, float]],
+        ]
+    ]
+):
+    """Return the rollup tables and functions to find their period start end."""
+    return [
+        (StatisticsDaily, reduce_day_ts_factory()[1]),
+        (StatisticsMonthly, reduce_month_ts_factory()[1]),
+    ]
+
+
+def compile_statistics_rollups(
+    session: Session,
+    first_start_ts: float,
+    last_start_ts: float,
+    metadata_id: int | None = None,
+) -> None:
+    """Compile the daily and monthly rollups of hourly statistics.
+
+    The rollups of all periods containing hourly statistics which start
+    between first_start_ts and last_start_ts are compiled again, either
+    for all statistics or only for metadata_id. The daily rollups are
+    compiled first since the monthly rollups are compiled from them.
+    """
+    for table, period_start_end in _statistics_rollup_periods():
+        start_ts, end_ts = period_start_end(first_start_ts)
+        while start_ts <= last_start_ts:
+            _compile_statistics_rollup(session, table, start_ts, end_ts, metadata_id)
+            start_ts, end_ts = period_start_end(end_ts)
+        session.flush()
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -630,6 +847,30 @@ def _adjust_sum_statistics(
         )
 
 
+def _adjust_sum_statistics_rollups(
+    session: Session,
+    metadata_id: int,
+    start_time: datetime,
+    adj: float,
+) -> None:
+    """Adjust statistics rollups in the database.
+
+    The rollups of the periods after the one containing start_time are
+    adjusted like the hourly statistics, the rollups of the period
+    containing start_time are compiled again.
+    """
+    start_time_ts = start_time.timestamp()
+    for table, period_start_end in _statistics_rollup_periods():
+        _adjust_sum_statistics(
+            session,
+            table,
+            metadata_id,
+            dt_util.utc_from_timestamp(period_start_end(start_time_ts)[1]),
+            adj,
+        )
+    compile_statistics_rollups(session, start_time_ts, start_time_ts, metadata_id)
+
+
 def _insert_statistics(
     session: Session,
     table: type[StatisticsBase],
@@ -1642,6 +1883,64 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_rollups_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return daily or monthly statistics from the rollup tables.
+
+    Returns None if the rollups were compiled with another time zone,
+    the caller has to reduce the hourly statistics instead until the
+    rollups have been compiled again.
+    """
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+
+    if not stats:
+        return {}
+
+    result = _sorted_statistics_to_dict(
+        hass,
+        session,
+        stats,
+        statistic_ids,
+        metadata,
+        True,
+        table,
+        start_time,
+        units,
+        types,
+    )
+
+    period_start_end = (
+        reduce_day_ts_factory()[1]
+        if table is StatisticsDaily
+        else reduce_month_ts_factory()[1]
+    )
+    for rows in result.values():
+        for row in rows:
+            start, end = period_start_end(row["start"])
+            if start != row["start"]:
+                get_instance(hass).queue_statistics_rollups_rebuild()
+                return None
+            # Days and months do not have a fixed duration
+            row["end"] = end
+
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1712,6 +2011,27 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
+    rollup_table = STATISTICS_ROLLUP_TABLES.get(period)
+    if rollup_table and get_instance(hass).statistics_rollups_active:
+        result = _statistics_rollups_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            rollup_table,
+            units,
+            types,
+        )
+        if result is not None:
+            if "change" in _types:
+                _augment_result_with_change(
+                    hass, session, start_time, units, _types, table, metadata, result
+                )
+            return result
+
     stmt = _generate_statistics_during_period_stmt(
         start_time, end_time, metadata_ids, table, types
     )
@@ -2267,13 +2587,20 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    start_timestamps: list[float] = []
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        start_timestamps.append(stat["start"].timestamp())
 
     if table != StatisticsShortTerm:
+        if start_timestamps:
+            session.flush()
+            compile_statistics_rollups(
+                session, min(start_timestamps), max(start_timestamps), metadata_id
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2403,6 +2730,13 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _adjust_sum_statistics_rollups(
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0),
+            sum_adjustment,
+        )
+
     return True
 
 
@@ -2463,6 +2797,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
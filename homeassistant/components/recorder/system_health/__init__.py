@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant, callback
 from .. import get_instance
 from ..const import SupportedDialect
 from ..core import Recorder
+from ..pool import RecorderReadPool
 from ..util import session_scope
 from .mysql import db_size_bytes as mysql_db_size_bytes
 from .postgresql import db_size_bytes as postgresql_db_size_bytes
@@ -72,4 +73,12 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    commit_stats: dict[str, Any] = {}
+    if adaptive_commit := instance.adaptive_commit:
+        commit_stats = adaptive_commit.as_dict()
+    read_pool_stats: dict[str, Any] = {}
+    if (read_engine := instance.read_engine) and isinstance(
+        read_pool := read_engine.pool, RecorderReadPool
+    ):
+        read_pool_stats = read_pool.as_dict()
+    return db_runs | db_stats | db_engine_info | commit_stats | read_pool_stats
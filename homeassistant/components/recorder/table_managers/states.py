@@ -2,7 +2,38 @@
 
 from __future__ import annotations
 
-from ..db_schema import States
+from typing import Any, cast
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, EventStateChangedData
+
+from ..db_schema import (
+    EVENT_ORIGIN_TO_IDX,
+    StateAttributes,
+    States,
+    StatesMeta,
+    ulid_to_bytes_or_none,
+    uuid_hex_to_bytes_or_none,
+)
+
+# Columns written by the bulk insert path. Every parameter set
+# passed to executemany must have the same keys.
+BULK_INSERT_COLUMNS = (
+    "entity_id",
+    "state",
+    "last_updated_ts",
+    "last_changed_ts",
+    "last_reported_ts",
+    "origin_idx",
+    "context_id_bin",
+    "context_user_id_bin",
+    "context_parent_id_bin",
+    "metadata_id",
+    "attributes_id",
+    "old_state_id",
+)
 
 
 class StatesManager:
@@ -45,6 +76,14 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_committed(self, entity_id: str, state_id: int) -> None:
+        """Add a committed state.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_committed_id[entity_id] = state_id
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -102,3 +141,194 @@ class StatesManager:
         last_committed_ids = self._last_committed_id
         for entity_id in purged_entity_ids:
             last_committed_ids.pop(entity_id, None)
+
+
+class StatesBulkBuffer:
+    """Columnar buffer of pending States rows.
+
+    Instead of creating an ORM object for each state_changed event and
+    relying on the unit of work to flush them, the rows are collected
+    into one list per column and written with a single executemany
+    INSERT ... RETURNING per commit.
+
+    Rows that link to a pending row in the same buffer via old_state_id
+    can only be written after the row they link to has been assigned a
+    state_id. Rows are therefore written in waves where wave N contains
+    the N-th buffered change for each entity.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the states bulk buffer."""
+        self._columns: dict[str, list[Any]] = {
+            column: [] for column in BULK_INSERT_COLUMNS
+        }
+        self._states_meta: list[StatesMeta | None] = []
+        self._state_attributes: list[StateAttributes | None] = []
+        self._old_state_row: list[int | None] = []
+        self._entity_ids: list[str] = []
+        self._state_ids: list[int] = []
+        self._pending: dict[str, int] = {}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return self._rows
+
+    def pop_pending(self, entity_id: str) -> int | None:
+        """Pop the buffer row of a pending state for an entity_id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending.pop(entity_id, None)
+
+    def add_pending(self, entity_id: str, row: int) -> None:
+        """Mark a buffer row as the pending state for an entity_id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending[entity_id] = row
+
+    def set_last_reported(self, row: int, last_reported_timestamp: float) -> None:
+        """Update the last reported timestamp of a buffered row."""
+        self._columns["last_reported_ts"][row] = last_reported_timestamp
+
+    def append(
+        self,
+        event: Event[EventStateChangedData],
+        entity_id: str | None,
+        metadata_id: int | None,
+        states_meta: StatesMeta | None,
+        attributes_id: int | None,
+        state_attributes: StateAttributes | None,
+        old_state_id: int | None,
+        old_state_row: int | None,
+    ) -> int:
+        """Append a state_changed event to the buffer and return its row.
+
+        This mirrors States.from_event without creating an ORM object.
+        """
+        columns = self._columns
+        context = event.context
+        state = event.data["new_state"]
+        columns["entity_id"].append(entity_id)
+        # None state means the state was removed from the state machine
+        if state is None:
+            columns["state"].append(None)
+            columns["last_updated_ts"].append(event.time_fired_timestamp)
+            columns["last_changed_ts"].append(None)
+            columns["last_reported_ts"].append(None)
+        else:
+            last_updated = state.last_updated
+            columns["state"].append(state.state)
+            columns["last_updated_ts"].append(state.last_updated_timestamp)
+            columns["last_changed_ts"].append(
+                None
+                if last_updated == state.last_changed
+                else state.last_changed_timestamp
+            )
+            columns["last_reported_ts"].append(
+                None
+                if last_updated == state.last_reported
+                else state.last_reported_timestamp
+            )
+        columns["origin_idx"].append(EVENT_ORIGIN_TO_IDX.get(event.origin))
+        columns["context_id_bin"].append(ulid_to_bytes_or_none(context.id))
+        columns["context_user_id_bin"].append(
+            uuid_hex_to_bytes_or_none(context.user_id)
+        )
+        columns["context_parent_id_bin"].append(
+            ulid_to_bytes_or_none(context.parent_id)
+        )
+        columns["metadata_id"].append(metadata_id)
+        columns["attributes_id"].append(attributes_id)
+        columns["old_state_id"].append(old_state_id)
+        self._states_meta.append(states_meta)
+        self._state_attributes.append(state_attributes)
+        self._old_state_row.append(old_state_row)
+        self._entity_ids.append(event.data["entity_id"])
+        row = self._rows
+        self._rows += 1
+        return row
+
+    def write(self, session: Session) -> None:
+        """Write the buffered rows to the database.
+
+        The session must have been flushed before calling this so the
+        pending StatesMeta and StateAttributes rows have ids.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        columns = self._columns
+        metadata_ids = columns["metadata_id"]
+        attributes_ids = columns["attributes_id"]
+        old_state_ids = columns["old_state_id"]
+        for row, states_meta in enumerate(self._states_meta):
+            if states_meta is not None:
+                metadata_ids[row] = states_meta.metadata_id
+        for row, state_attributes in enumerate(self._state_attributes):
+            if state_attributes is not None:
+                attributes_ids[row] = state_attributes.attributes_id
+
+        waves: list[list[int]] = []
+        entity_wave: dict[str, int] = {}
+        for row, entity_id in enumerate(self._entity_ids):
+            wave = entity_wave[entity_id] = entity_wave.get(entity_id, -1) + 1
+            if wave == len(waves):
+                waves.append([])
+            waves[wave].append(row)
+
+        state_ids = self._state_ids = [0] * self._rows
+        entity_ids = columns["entity_id"]
+        column_values = [(column, columns[column]) for column in BULK_INSERT_COLUMNS]
+        # Each entity appears at most once per wave so the returned rows
+        # can be matched back by metadata_id (or entity_id for legacy rows)
+        # which lets the database batch the rows in a single statement
+        # instead of falling back to one row at a time to preserve order.
+        stmt = insert(cast(Table, States.__table__)).returning(
+            States.state_id, States.metadata_id, States.entity_id
+        )
+        for rows in waves:
+            row_by_key: dict[tuple[int | None, str | None], int] = {}
+            for row in rows:
+                if (old_state_row := self._old_state_row[row]) is not None:
+                    old_state_ids[row] = state_ids[old_state_row]
+                row_by_key[(metadata_ids[row], entity_ids[row])] = row
+            result = session.execute(
+                stmt,
+                [
+                    {column: values[row] for column, values in column_values}
+                    for row in rows
+                ],
+            )
+            for state_id, metadata_id, entity_id in result:
+                state_ids[row_by_key[(metadata_id, entity_id)]] = state_id
+
+    def post_commit_pending(self, states_manager: StatesManager) -> None:
+        """Call after commit to load the state_id of the new rows into committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        state_ids = self._state_ids
+        for entity_id, row in self._pending.items():
+            states_manager.add_committed(entity_id, state_ids[row])
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all buffered rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for values in self._columns.values():
+            values.clear()
+        self._states_meta.clear()
+        self._state_attributes.clear()
+        self._old_state_row.clear()
+        self._entity_ids.clear()
+        self._state_ids = []
+        self._pending.clear()
+        self._rows = 0
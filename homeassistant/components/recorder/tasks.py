@@ -429,6 +429,28 @@ class EntityIDMigrationTask(RecorderTask):
             instance.queue_task(EntityIDPostMigrationTask())
 
 
+@dataclass(slots=True)
+class StatisticsRollupMigrationTask(RecorderTask):
+    """An object to insert into the recorder queue to compile statistics rollups.
+
+    The rollups are compiled one month at a time from the newest month
+    to the oldest, end_ts is the end of the next month to compile.
+    """
+
+    end_ts: float | None = None
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollup migration task."""
+        # pylint: disable-next=protected-access
+        if (end_ts := instance._migrate_statistics_rollups(self.end_ts)) is not None:
+            # Schedule a new migration task for the previous month
+            instance.queue_task(StatisticsRollupMigrationTask(end_ts))
+        else:
+            # All months have been compiled, the statistics queries can
+            # read the rollups instead of reducing hourly statistics
+            instance.statistics_rollups_active = True
+
+
 @dataclass(slots=True)
 class EntityIDPostMigrationTask(RecorderTask):
     """An object to insert into the recorder queue to cleanup after entity_ids migration."""
@@ -128,10 +128,12 @@ def session_scope(
 
     read_only is used to indicate that the session is only used for reading
     data and that no commit is required. It does not prevent the session
-    from writing and is not a security measure.
+    from writing and is not a security measure. Read only sessions created
+    from hass use the read pool when it is enabled.
     """
     if session is None and hass is not None:
-        session = get_instance(hass).get_session()
+        instance = get_instance(hass)
+        session = instance.get_read_session() if read_only else instance.get_session()
 
     if session is None:
         raise RuntimeError("Session required")
@@ -606,6 +608,25 @@ def setup_connection_for_dialect(
     )
 
 
+def setup_read_only_connection_for_dialect(
+    instance: Recorder,
+    dialect_name: str,
+    dbapi_connection: DBAPIConnection,
+) -> None:
+    """Execute statements needed for a read only dialect connection."""
+    setup_connection_for_dialect(instance, dialect_name, dbapi_connection, False)
+    if dialect_name == SupportedDialect.SQLITE:
+        execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+    elif dialect_name == SupportedDialect.MYSQL:
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        execute_on_connection(
+            dbapi_connection, "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"
+        )
+        # SET is transactional on PostgreSQL
+        dbapi_connection.commit()
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
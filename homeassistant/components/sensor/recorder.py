@@ -5,9 +5,11 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 import datetime
+from functools import cache
 import itertools
 import logging
 import math
+from types import ModuleType
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -72,6 +74,9 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Compile statistics with NumPy when it is installed and at least this many
+# sensors are compiled, for fewer sensors the overhead is not worth it
+NUMPY_ENGINE_MIN_SENSORS = 50
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -387,6 +392,97 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+@cache
+def _numpy_engine() -> ModuleType | None:
+    """Return the NumPy statistics engine or None if numpy is not installed."""
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        from . import recorder_numpy
+    except ImportError:
+        return None
+    return recorder_numpy
+
+
+def _compile_with_numpy(
+    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]],
+    wanted_statistics: dict[str, set[str]],
+    last_stats: dict[str, list[statistics.StatisticsRow]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> tuple[
+    dict[str, tuple[float, float, float]],
+    dict[str, tuple[float, float, list[int]]],
+]:
+    """Compile what can be vectorized with the NumPy engine.
+
+    Returns the mean, min and max of measurement sensors. For
+    total_increasing sensors which have been compiled before the state
+    of the last statistics, the growth of the sum and the indices of the
+    states which need to be logged are returned. The remaining
+    statistics are compiled in Python.
+    """
+    if len(to_process) < NUMPY_ENGINE_MIN_SENSORS or not (engine := _numpy_engine()):
+        return {}, {}
+    measurements: list[tuple[str, list[tuple[float, State]]]] = []
+    totals: list[tuple[str, float, list[tuple[float, State]]]] = []
+    for entity_id, _, state_class, valid_float_states in to_process:
+        wanted = wanted_statistics[entity_id]
+        if "mean" in wanted and "min" in wanted and "max" in wanted:
+            measurements.append((entity_id, valid_float_states))
+        if (
+            state_class == SensorStateClass.TOTAL_INCREASING
+            and "sum" in wanted
+            and entity_id in last_stats
+            and (old_state := last_stats[entity_id][0].get("state")) is not None
+        ):
+            totals.append((entity_id, old_state, valid_float_states))
+
+    mean_min_max = engine.time_weighted_mean_min_max(
+        [float_states for _, float_states in measurements], start, end
+    )
+    sums = engine.total_increasing_sums(
+        [float_states for _, _, float_states in totals],
+        [old_state for _, old_state, _ in totals],
+    )
+    return (
+        {
+            entity_id: result
+            for (entity_id, _), result in zip(measurements, mean_min_max, strict=True)
+        },
+        {
+            entity_id: (old_state, result[0], sorted(result[1] + result[2]))
+            for (entity_id, old_state, _), result in zip(totals, sums, strict=True)
+            if result is not None
+        },
+    )
+
+
+def _log_total_increasing_cycles(
+    hass: HomeAssistant,
+    entity_id: str,
+    valid_float_states: list[tuple[float, State]],
+    old_state: float,
+    events: list[int],
+) -> None:
+    """Log new cycles and warn about dips found by the NumPy engine."""
+    for idx in events:
+        fstate, state = valid_float_states[idx]
+        previous_fstate = valid_float_states[idx - 1][0] if idx else old_state
+        if 0.9 * previous_fstate <= fstate:
+            warn_dip(hass, entity_id, state, previous_fstate)
+            continue
+        _LOGGER.info(
+            (
+                "Detected new cycle for %s, value dropped from %s to %s, triggered"
+                " by state with last_updated set to %s"
+            ),
+            entity_id,
+            previous_fstate,
+            fstate,
+            state.last_updated.isoformat(),
+        )
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -467,6 +563,9 @@ def compile_statistics(  # noqa: C901
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
+    numpy_mean_min_max, numpy_sums = _compile_with_numpy(
+        to_process, wanted_statistics, last_stats, start, end
+    )
     for (  # pylint: disable=too-many-nested-blocks
         entity_id,
         statistics_unit,
@@ -510,19 +609,32 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+        if entity_id in numpy_mean_min_max:
+            stat["mean"], stat["min"], stat["max"] = numpy_mean_min_max[entity_id]
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
 
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
-        if "sum" in wanted_statistics[entity_id]:
+        if entity_id in numpy_sums:
+            old_state, growth, events = numpy_sums[entity_id]
+            _log_total_increasing_cycles(
+                hass, entity_id, valid_float_states, old_state, events
+            )
+            last_stat = last_stats[entity_id][0]
+            if last_reset := _timestamp_to_isoformat_or_none(last_stat["last_reset"]):
+                stat["last_reset"] = dt_util.parse_datetime(last_reset)
+            stat["sum"] = (last_stat.get("sum") or 0.0) + growth
+            stat["state"] = valid_float_states[-1][0]
+        elif "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0.0
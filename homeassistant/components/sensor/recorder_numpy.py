@@ -0,0 +1,137 @@
+"""NumPy engine for compiling sensor statistics.
+
+The functions in this module compile the statistics of many sensors at
+once. The states of all sensors are concatenated into flat arrays and
+the per sensor results are reduced with ufunc.reduceat at the offsets
+where each sensor starts. They match the pure Python implementation in
+recorder.py, which is used when numpy is not installed or when there
+are only a few sensors to compile.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import datetime
+
+import numpy as np
+
+from homeassistant.core import State
+
+
+def _flatten(
+    groups: Sequence[Sequence[tuple[float, State]]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the values, the start offsets and the end offsets of the groups."""
+    lengths = np.fromiter((len(group) for group in groups), np.intp, len(groups))
+    ends = np.cumsum(lengths)
+    values = np.fromiter(
+        (fstate for group in groups for fstate, _ in group), np.float64, int(ends[-1])
+    )
+    return values, ends - lengths, ends
+
+
+def time_weighted_mean_min_max(
+    groups: Sequence[Sequence[tuple[float, State]]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> list[tuple[float, float, float]]:
+    """Return the time weighted mean, min and max of each group of states.
+
+    Each group must contain at least one state and be ordered by
+    last_updated. The mean is weighted like _time_weighted_average.
+    """
+    if not groups:
+        return []
+    values, offsets, ends = _flatten(groups)
+    # Durations are calculated in whole microseconds like timedelta does,
+    # subtracting float timestamps would lose precision
+    start_us = round(start.timestamp() * 1e6)
+    end_us = round(end.timestamp() * 1e6)
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    timestamps = np.maximum(
+        np.rint(
+            np.fromiter(
+                (
+                    state.last_updated_timestamp
+                    for group in groups
+                    for _, state in group
+                ),
+                np.float64,
+                len(values),
+            )
+            * 1e6
+        ).astype(np.int64),
+        start_us,
+    )
+    # Each state is valid until the next state of the same sensor, the
+    # last state of each sensor is valid until the end of the period
+    valid_until = np.empty_like(timestamps)
+    valid_until[:-1] = timestamps[1:]
+    valid_until[ends - 1] = end_us
+    accumulated = np.add.reduceat(values * ((valid_until - timestamps) / 1e6), offsets)
+    # The period starts at the first state if there was no last known state
+    period = (end_us - timestamps[offsets]) / 1e6
+    means = np.divide(
+        accumulated, period, out=np.zeros_like(accumulated), where=period != 0
+    )
+    return list(
+        zip(
+            means.tolist(),
+            np.minimum.reduceat(values, offsets).tolist(),
+            np.maximum.reduceat(values, offsets).tolist(),
+            strict=True,
+        )
+    )
+
+
+def total_increasing_sums(
+    groups: Sequence[Sequence[tuple[float, State]]],
+    old_states: Sequence[float],
+) -> list[tuple[float, list[int], list[int]] | None]:
+    """Return how much the sum of each group of total_increasing states grew.
+
+    old_states holds the state of the last compiled statistics for each
+    group. A state less than 90% of the previous state is a new cycle.
+
+    For each group the growth of the sum is returned together with the
+    indices of the states which start a new cycle and the indices of the
+    states which dipped without starting a new cycle, so the caller can
+    log them. None is returned for groups with negative states, those
+    have to be compiled by the caller.
+    """
+    if not groups:
+        return []
+    values, offsets, ends = _flatten(groups)
+    previous = np.empty_like(values)
+    previous[1:] = values[:-1]
+    previous[offsets] = old_states
+    threshold = 0.9 * previous
+    resets = values < threshold
+    dips = (threshold <= values) & (values < previous)
+    negative = np.logical_or.reduceat(values < 0, offsets)
+    has_events = np.logical_or.reduceat(resets | dips, offsets)
+    # The sum grows by the last state before each new cycle plus the last
+    # state, minus the state the first cycle started from
+    growth = (
+        np.add.reduceat(np.where(resets, previous, 0.0), offsets)
+        + values[ends - 1]
+        - previous[offsets]
+    )
+    result: list[tuple[float, list[int], list[int]] | None] = []
+    for idx, offset in enumerate(offsets.tolist()):
+        if negative[idx]:
+            result.append(None)
+            continue
+        if not has_events[idx]:
+            result.append((float(growth[idx]), [], []))
+            continue
+        end = int(ends[idx])
+        result.append(
+            (
+                float(growth[idx]),
+                np.flatnonzero(resets[offset:end]).tolist(),
+                np.flatnonzero(dips[offset:end]).tolist(),
+            )
+        )
+    return result
@@ -17,6 +17,7 @@ from homeassistant.util.json import JsonValueType
 
 from .connection import ActiveConnection
 from .error import Disconnect
+from .messages import PendingStateDiffMessage
 
 if TYPE_CHECKING:
     from .http import WebSocketAdapter
@@ -53,7 +54,9 @@ class AuthPhase:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[bytes | str | dict[str, Any]], None],
+        send_message: Callable[
+            [bytes | str | dict[str, Any] | PendingStateDiffMessage], None
+        ],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
 import logging
+import sys
 from typing import Any, cast
 
 import voluptuous as vol
@@ -39,6 +41,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_get_template_render_stats,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -63,6 +66,8 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+# Number of states sized by get_states_memory_usage before yielding to the loop
+MEMORY_USAGE_CHUNK_SIZE = 250
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -80,6 +85,9 @@ def async_register_commands(
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
+    async_reg(hass, handle_get_states_memory_usage)
+    async_reg(hass, handle_get_template_cache_stats)
+    async_reg(hass, handle_get_template_render_stats)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
@@ -365,26 +373,122 @@ def _send_handle_get_states_response(
 
 @callback
 def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any] | Callable[[], str]], None],
+    send_message: Callable[
+        [str | bytes | dict[str, Any] | messages.PendingStateDiffMessage], None
+    ],
     entity_ids: set[str],
     user: User,
     message_id_as_bytes: bytes,
+    superseded_msg_id: int | None,
     event: Event[EventStateChangedData],
 ) -> None:
-    """Forward entity state changed events to websocket."""
+    """Forward entity state changed events to websocket.
+
+    When superseded_msg_id is set, a queued message of the entity is
+    replaced when the entity changes before it has been written.
+    """
     entity_id = event.data["entity_id"]
     if entity_ids and entity_id not in entity_ids:
         return
+    if not _user_can_read_entity(user, entity_id):
+        return
+    message = messages.cached_state_diff_message(message_id_as_bytes, event)
+    if superseded_msg_id is None:
+        send_message(message)
+    else:
+        send_message(
+            messages.PendingStateDiffMessage(superseded_msg_id, message, event)
+        )
+
+
+def _user_can_read_entity(user: User, entity_id: str) -> bool:
+    """Return if the user may read the state of an entity."""
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    return (
+        user.is_admin
+        or permissions.access_all_entities(POLICY_READ)
+        or permissions.check_entity(entity_id, POLICY_READ)
+    )
+
+
+class _CoalescingEntitiesSubscription:
+    """Forward the entity changes of a subscribe_entities subscription in batches.
+
+    The latest state of each changed entity is kept until the update
+    interval has passed since the previous message, and then all of
+    them are sent in a single message. When attributes is not None
+    only those attributes are sent.
+    """
+
+    __slots__ = (
+        "_attributes",
+        "_connection",
+        "_entity_ids",
+        "_interval",
+        "_known_states",
+        "_last_sent",
+        "_msg_id",
+        "_new_states",
+        "_timer",
+    )
+
+    def __init__(
+        self,
+        connection: ActiveConnection,
+        msg_id: int,
+        entity_ids: set[str],
+        attributes: list[str] | None,
+        interval: float,
+        states: list[State],
+    ) -> None:
+        """Initialize the subscription with the states sent to the client."""
+        self._connection = connection
+        self._msg_id = msg_id
+        self._entity_ids = entity_ids
+        self._attributes = attributes
+        self._interval = interval
+        self._known_states = {state.entity_id: state for state in states}
+        self._new_states: dict[str, State | None] = {}
+        self._last_sent = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Queue the new state of an entity and send it when it is due."""
+        entity_id = event.data["entity_id"]
+        if self._entity_ids and entity_id not in self._entity_ids:
+            return
+        if not _user_can_read_entity(self._connection.user, entity_id):
+            return
+        self._new_states[entity_id] = event.data["new_state"]
+        if self._timer is not None:
+            return
+        loop = self._connection.hass.loop
+        if (delay := self._last_sent + self._interval - loop.time()) > 0:
+            self._timer = loop.call_later(delay, self._async_send)
+        else:
+            self._async_send()
+
+    @callback
+    def _async_send(self) -> None:
+        """Send the changes since the previous message."""
+        self._timer = None
+        self._last_sent = self._connection.hass.loop.time()
+        new_states = self._new_states
+        self._new_states = {}
+        if event := messages.entities_diff_event(
+            self._known_states, new_states, self._attributes
+        ):
+            self._connection.send_message(messages.event_message(self._msg_id, event))
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the pending changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
 
 
 @callback
@@ -392,6 +496,11 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("attributes"): [cv.string],
+        vol.Optional("max_update_rate"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional("drop_superseded", default=False): cv.boolean,
     }
 )
 def handle_subscribe_entities(
@@ -399,42 +508,75 @@ def handle_subscribe_entities(
 ) -> None:
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
+    attributes: list[str] | None = msg.get("attributes")
+    max_update_rate: float | None = msg.get("max_update_rate")
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
+    if entity_ids:
+        states = [state for state in states if state.entity_id in entity_ids]
+    if attributes is None and max_update_rate is None:
+        message_id_as_bytes = str(msg["id"]).encode()
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                _forward_entity_changes,
+                connection.send_message,
+                entity_ids,
+                connection.user,
+                message_id_as_bytes,
+                msg["id"] if msg["drop_superseded"] else None,
+            ),
+        )
+    else:
+        subscription = _CoalescingEntitiesSubscription(
+            connection,
+            msg["id"],
             entity_ids,
-            connection.user,
-            message_id_as_bytes,
-        ),
-    )
+            attributes,
+            1 / max_update_rate if max_update_rate else 0,
+            states,
+        )
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, subscription.async_forward)
+
+        @callback
+        def _unsubscribe() -> None:
+            """Stop forwarding entity changes."""
+            unsub()
+            subscription.async_cancel()
+
+        connection.subscriptions[msg["id"]] = _unsubscribe
     connection.send_result(msg["id"])
 
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
-    try:
-        serialized_states = [
-            state.as_compressed_state_json
-            for state in states
-            if not entity_ids or state.entity_id in entity_ids
-        ]
-    except (ValueError, TypeError):
-        pass
-    else:
-        _send_handle_entities_init_response(connection, msg["id"], serialized_states)
-        return
+    if attributes is None:
+        try:
+            serialized_states = [state.as_compressed_state_json for state in states]
+        except (ValueError, TypeError):
+            pass
+        else:
+            _send_handle_entities_init_response(
+                connection, msg["id"], serialized_states
+            )
+            return
 
     serialized_states = []
     for state in states:
         try:
-            serialized_states.append(state.as_compressed_state_json)
+            serialized_states.append(
+                state.as_compressed_state_json
+                if attributes is None
+                else json_bytes(
+                    {
+                        state.entity_id: messages.compressed_state_with_attributes(
+                            state, attributes
+                        )
+                    }
+                )[1:-1]
+            )
         except (ValueError, TypeError):
             connection.logger.error(
                 "Unable to serialize to JSON. Bad data found at %s",
@@ -478,6 +620,90 @@ async def _async_get_all_descriptions_json(hass: HomeAssistant) -> bytes:
     return json_payload
 
 
+def _deep_getsizeof(obj: Any, seen: set[int]) -> int:
+    """Return the size of an object and the containers it references.
+
+    Objects that were already counted are skipped so keys and values
+    shared between states are only counted once.
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _deep_getsizeof(key, seen) + _deep_getsizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += _deep_getsizeof(item, seen)
+    elif isinstance(obj, (State, Context)):
+        # The origin event of a context references other states
+        # and is not owned by the state
+        size += sys.getsizeof(obj.__dict__)
+        for key, value in obj.__dict__.items():
+            if key != "origin_event":
+                size += _deep_getsizeof(value, seen)
+    return size
+
+
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "get_states_memory_usage"})
+@decorators.async_response
+async def handle_get_states_memory_usage(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle get states memory usage command.
+
+    The states are walked on the event loop since their attributes may be
+    changed while they are walked, yielding to the loop after every
+    MEMORY_USAGE_CHUNK_SIZE states.
+    """
+    seen: set[int] = set()
+    domains: dict[str, dict[str, int]] = {}
+    for idx, state in enumerate(hass.states.async_all()):
+        if idx and not idx % MEMORY_USAGE_CHUNK_SIZE:
+            await asyncio.sleep(0)
+        size = _deep_getsizeof(state, seen)
+        if (usage := domains.get(state.domain)) is None:
+            usage = domains[state.domain] = {"states": 0, "bytes": 0}
+        usage["states"] += 1
+        usage["bytes"] += size
+    for usage in domains.values():
+        usage["bytes_per_state"] = usage["bytes"] // usage["states"]
+    states = sum(usage["states"] for usage in domains.values())
+    total = sum(usage["bytes"] for usage in domains.values())
+    connection.send_result(
+        msg["id"],
+        {
+            "compact": hass.states.compact,
+            "states": states,
+            "bytes": total,
+            "bytes_per_state": total // states if states else 0,
+            "domains": domains,
+        },
+    )
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "get_template_cache_stats"})
+def handle_get_template_cache_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle get template cache stats command."""
+    connection.send_result(msg["id"], template.COMPILED_TEMPLATE_CACHE_STATS.as_dict())
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "get_template_render_stats"})
+def handle_get_template_render_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle get template render stats command."""
+    connection.send_result(msg["id"], async_get_template_render_stats(hass))
+
+
 @decorators.websocket_command({vol.Required("type"): "get_services"})
 @decorators.async_response
 async def handle_get_services(
@@ -51,3 +51,20 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_COMPRESS_MESSAGES = "compress_messages"
+
+# Preset dictionary of the deflate stream used by compress_messages. Clients
+# need the same dictionary to inflate the messages. The most common strings
+# are at the end where they can be referenced with the shortest distances.
+COMPRESS_MESSAGES_DICTIONARY: Final = (
+    b'"unit_of_measurement":"W","unit_of_measurement":"kWh",'
+    b'"unit_of_measurement":"\xc2\xb0C","device_class":"temperature",'
+    b'"device_class":"power","device_class":"energy","state_class":"measurement",'
+    b'"state_class":"total_increasing","icon":"mdi:","friendly_name":"'
+    b'"parent_id":null,"user_id":null,"-":{"a":["'
+    b'{"id":1,"type":"result","success":true,"result":null}'
+    b'"s":"unavailable","s":"on","s":"off","a":{},"c":"01'
+    b'{"type":"event","event":{"a":{"'
+    b'{"type":"event","event":{"c":{"sensor.'
+    b'"+":{"s":"","lc":1,"lu":1,"c":"01'
+)
@@ -9,6 +9,7 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 
@@ -22,6 +23,7 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESS_MESSAGES_DICTIONARY,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
@@ -31,7 +33,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import PendingStateDiffMessage, message_to_json_bytes
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -78,6 +80,8 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_compressor",
+        "_pending_messages",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -97,8 +101,11 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[bytes | None] = deque()
+        self._message_queue: deque[bytes | PendingStateDiffMessage | None] = deque()
+        # Queued messages which are replaced by newer messages with the same key
+        self._pending_messages: dict[tuple[int, str], PendingStateDiffMessage] = {}
         self._ready_future: asyncio.Future[None] | None = None
+        self._compressor: zlib._Compress | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -119,7 +126,9 @@ class WebSocketHandler:
         return "finished connection"
 
     async def _writer(
-        self, send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]]
+        self,
+        send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -130,6 +139,9 @@ class WebSocketHandler:
         debug = logger.debug
         is_enabled_for = logger.isEnabledFor
         logging_debug = logging.DEBUG
+        # When permessage-deflate was negotiated aiohttp already
+        # compresses the frames, so compress_messages is ignored
+        transport_compressed = bool(wsock.compress)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
@@ -142,17 +154,32 @@ class WebSocketHandler:
                 if (message := message_queue.popleft()) is None:
                     return
 
-                debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
+                if (
+                    isinstance(message, PendingStateDiffMessage)
+                    and (message := self._pop_pending_message(message)) is None
+                ):
+                    continue
+
+                debug_enabled = is_enabled_for(logging_debug)
+                connection = self._connection
+                compress = (
+                    connection is not None
+                    and connection.can_compress
+                    and not transport_compressed
+                )
 
                 if (
                     not messages_remaining
-                    or not (connection := self._connection)
+                    or connection is None
                     or not connection.can_coalesce
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
+                    if compress:
+                        await send_bytes_binary(self._compress(message))
+                    else:
+                        await send_bytes_text(message)
                     continue
 
                 messages: list[bytes] = [message]
@@ -160,13 +187,21 @@ class WebSocketHandler:
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
                         return
-                    messages.append(message)
                     messages_remaining -= 1
+                    if (
+                        isinstance(message, PendingStateDiffMessage)
+                        and (message := self._pop_pending_message(message)) is None
+                    ):
+                        continue
+                    messages.append(message)
 
                 coalesced_messages = b"".join((b"[", b",".join(messages), b"]"))
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                if compress:
+                    await send_bytes_binary(self._compress(coalesced_messages))
+                else:
+                    await send_bytes_text(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -177,6 +212,26 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    def _pop_pending_message(self, message: PendingStateDiffMessage) -> bytes | None:
+        """Return the bytes of a pending message that is about to be written."""
+        del self._pending_messages[message.key]
+        return message.as_bytes()
+
+    def _compress(self, message: bytes) -> bytes:
+        """Compress a message with the deflate stream of the connection.
+
+        The stream keeps its window between messages, so a message
+        which repeats parts of earlier messages only references them.
+        Like permessage-deflate, the trailing 0x00 0x00 0xff 0xff of
+        the sync flush is left out and has to be appended by the client
+        before inflating.
+        """
+        if (compressor := self._compressor) is None:
+            compressor = self._compressor = zlib.compressobj(
+                wbits=-zlib.MAX_WBITS, zdict=COMPRESS_MESSAGES_DICTIONARY
+            )
+        return (compressor.compress(message) + compressor.flush(zlib.Z_SYNC_FLUSH))[:-4]
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -185,10 +240,15 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | bytes | dict[str, Any] | PendingStateDiffMessage
+    ) -> None:
         """Queue sending a message to the client.
 
         Closes connection if the client is not reading the messages.
+        A PendingStateDiffMessage replaces the queued message of the
+        same subscription and entity, those messages are not counted
+        as they are bounded by the number of entities.
 
         Async friendly.
         """
@@ -201,9 +261,14 @@ class WebSocketHandler:
             message = message_to_json_bytes(message)
         elif isinstance(message, str):
             message = message.encode("utf-8")
+        elif type(message) is PendingStateDiffMessage and (
+            pending := self._pending_messages.get(message.key)
+        ):
+            pending.replace(message)
+            return
 
         message_queue = self._message_queue
-        queue_size_before_add = len(message_queue)
+        queue_size_before_add = len(message_queue) - len(self._pending_messages)
         if queue_size_before_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
@@ -218,6 +283,8 @@ class WebSocketHandler:
             self._cancel()
             return
 
+        if type(message) is PendingStateDiffMessage:
+            self._pending_messages[message.key] = message
         message_queue.append(message)
         ready_future = self._ready_future
         if ready_future and not ready_future.done():
@@ -240,7 +307,7 @@ class WebSocketHandler:
         """Check that we are no longer above the write peak."""
         self._peak_checker_unsub = None
 
-        if len(self._message_queue) < PENDING_MSG_PEAK:
+        if len(self._message_queue) - len(self._pending_messages) < PENDING_MSG_PEAK:
             return
 
         self._logger.error(
@@ -300,6 +367,7 @@ class WebSocketHandler:
             assert writer is not None
 
         send_bytes_text = partial(writer.send, binary=False)
+        send_bytes_binary = partial(writer.send, binary=True)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -338,7 +406,9 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
-            self._writer_task = create_eager_task(self._writer(send_bytes_text))
+            self._writer_task = create_eager_task(
+                self._writer(send_bytes_text, send_bytes_binary)
+            )
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
 
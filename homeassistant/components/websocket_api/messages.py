@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection, Mapping
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -154,7 +155,7 @@ def cached_state_diff_message(
     """
     return b"".join(
         (
-            _partial_cached_state_diff_message(event)[:-1],
+            _partial_cached_state_diff_message(event),
             b',"id":',
             message_id_as_bytes,
             b"}",
@@ -162,10 +163,62 @@ def cached_state_diff_message(
     )
 
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=1)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
 
+    The event bus runs the subscribe_entities callbacks of all connections
+    for an event before the next event is fired, so only the last event
+    is cached. The closing brace is stripped once so the id can be
+    appended in cached_state_diff_message.
+    """
+    return _state_diff_message(event)[:-1]
+
+
+class PendingStateDiffMessage:
+    """A queued state diff message of an entity for a subscription.
+
+    When the entity changes again before the message has been written
+    to the client, the websocket writer replaces it with a single diff
+    from the state before the first change to the newest state.
+    """
+
+    __slots__ = ("key", "_message", "_msg_id", "_new_state", "_old_state")
+
+    def __init__(
+        self, msg_id: int, message: bytes, event: Event[EventStateChangedData]
+    ) -> None:
+        """Initialize the message of a state_changed event."""
+        self.key = (msg_id, event.data["entity_id"])
+        self._msg_id = msg_id
+        self._message: bytes | None = message
+        self._old_state = event.data["old_state"]
+        self._new_state = event.data["new_state"]
+
+    def replace(self, newer: PendingStateDiffMessage) -> None:
+        """Replace the message with a newer message of the same entity."""
+        self._message = None
+        self._new_state = newer._new_state
+
+    def as_bytes(self) -> bytes | None:
+        """Return the message or None if there is nothing to send."""
+        if self._message is not None:
+            return self._message
+        entity_id: str = self.key[1]
+        old_state = self._old_state
+        event = entities_diff_event(
+            {} if old_state is None else {entity_id: old_state},
+            {entity_id: self._new_state},
+            None,
+        )
+        if not event:
+            return None
+        return message_to_json_bytes(event_message(self._msg_id, event))
+
+
+def _state_diff_message(event: Event[EventStateChangedData]) -> bytes:
+    """Serialize the event to json.
+
     The message is constructed without the id which
     will be appended in cached_state_diff_message
     """
@@ -199,10 +252,78 @@ def _state_diff_event(event: Event[EventStateChangedData]) -> dict:
     return _state_diff(event_old_state, event_new_state)
 
 
+def compressed_state_with_attributes(
+    state: State, attributes: Collection[str]
+) -> dict[str, Any]:
+    """Build a compressed dict of a state for adds with only some attributes."""
+    state_attributes = state.attributes
+    return {
+        **state.as_compressed_state,
+        COMPRESSED_STATE_ATTRIBUTES: {
+            key: state_attributes[key] for key in attributes if key in state_attributes
+        },
+    }
+
+
+def entities_diff_event(
+    known_states: dict[str, State],
+    new_states: dict[str, State | None],
+    attributes: Collection[str] | None,
+) -> dict[str, Any]:
+    """Convert the latest states of many entities to the minimal version.
+
+    The diffs are made against known_states, which is updated with the
+    states that are included. When attributes is not None, only those
+    attributes are included and changes of an entity which only touch
+    last_updated, the context or other attributes are left out.
+    """
+    added: dict[str, Any] = {}
+    changed: dict[str, Any] = {}
+    removed: list[str] = []
+    for entity_id, new_state in new_states.items():
+        old_state = known_states.get(entity_id)
+        if new_state is None:
+            if old_state is not None:
+                del known_states[entity_id]
+                removed.append(entity_id)
+            continue
+        if old_state is None:
+            added[entity_id] = (
+                new_state.as_compressed_state
+                if attributes is None
+                else compressed_state_with_attributes(new_state, attributes)
+            )
+        else:
+            diff = _state_diff(old_state, new_state, attributes)[ENTITY_EVENT_CHANGE][
+                entity_id
+            ]
+            additions = diff[STATE_DIFF_ADDITIONS]
+            if attributes is not None and not (
+                STATE_DIFF_REMOVALS in diff
+                or COMPRESSED_STATE_STATE in additions
+                or COMPRESSED_STATE_LAST_CHANGED in additions
+                or COMPRESSED_STATE_ATTRIBUTES in additions
+            ):
+                continue
+            changed[entity_id] = diff
+        known_states[entity_id] = new_state
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    return event
+
+
 def _state_diff(
-    old_state: State, new_state: State
+    old_state: State, new_state: State, attributes: Collection[str] | None = None
 ) -> dict[str, dict[str, dict[str, dict[str, str | list[str]]]]]:
-    """Create a diff dict that can be used to overlay changes."""
+    """Create a diff dict that can be used to overlay changes.
+
+    When attributes is not None, only those attributes are compared.
+    """
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -225,9 +346,16 @@ def _state_diff(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
-        new_attributes := new_state.attributes
-    ):
+    old_attributes: Mapping[str, Any] = old_state.attributes
+    new_attributes: Mapping[str, Any] = new_state.attributes
+    if attributes is not None:
+        old_attributes = {
+            key: old_attributes[key] for key in attributes if key in old_attributes
+        }
+        new_attributes = {
+            key: new_attributes[key] for key in attributes if key in new_attributes
+        }
+    if old_attributes != new_attributes:
         for key, value in new_attributes.items():
             if old_attributes.get(key) != value:
                 additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[key] = value
@@ -34,6 +34,7 @@ from .const import (
     CONF_ALLOWLIST_EXTERNAL_URLS,
     CONF_AUTH_MFA_MODULES,
     CONF_AUTH_PROVIDERS,
+    CONF_COMPACT_STATES,
     CONF_COUNTRY,
     CONF_CURRENCY,
     CONF_CUSTOMIZE,
@@ -393,6 +394,7 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_COUNTRY): cv.country,
             vol.Optional(CONF_LANGUAGE): cv.language,
             vol.Optional(CONF_DEBUG): cv.boolean,
+            vol.Optional(CONF_COMPACT_STATES): cv.boolean,
         }
     ),
     _filter_bad_internal_external_urls,
@@ -904,6 +906,9 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
     if config.get(CONF_DEBUG):
         hac.debug = True
 
+    if config.get(CONF_COMPACT_STATES):
+        hass.states.async_set_compact(True)
+
     _raise_issue_if_legacy_templates(hass, config.get(CONF_LEGACY_TEMPLATES))
     _raise_issue_if_historic_currency(hass, hass.config.currency)
     _raise_issue_if_no_country(hass, hass.config.country)
@@ -22,6 +22,7 @@ from contextlib import suppress
 from dataclasses import dataclass
 import datetime
 import enum
+import fnmatch
 import functools
 from functools import cached_property
 import inspect
@@ -45,6 +46,7 @@ from typing import (
     overload,
 )
 from urllib.parse import urlparse
+import weakref
 
 from typing_extensions import TypeVar
 import voluptuous as vol
@@ -205,6 +207,8 @@ _OBJECT_ID = r"(?!_)[\da-z_]+(?<!_)"
 _DOMAIN = r"(?!.+__)" + _OBJECT_ID
 VALID_DOMAIN = re.compile(r"^" + _DOMAIN + r"$")
 VALID_ENTITY_ID = re.compile(r"^" + _DOMAIN + r"\." + _OBJECT_ID + r"$")
+# Characters that make a pattern a glob
+_GLOB_MAGIC = re.compile(r"[*?[]")
 
 
 @functools.lru_cache(64)
@@ -1437,13 +1441,27 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_dispatch",
+        "_hass",
+        "_listeners",
+        "_match_all_dispatch",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[EventType[Any] | str, list[_FilterableJobType[Any]]] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Immutable snapshot of the listeners to call for each event type
+        # which is built on first fire and dropped when listeners change
+        self._dispatch: dict[
+            EventType[Any] | str, tuple[_FilterableJobType[Any], ...]
+        ] = {}
+        # Snapshot shared by the event types without listeners of their own
+        self._match_all_dispatch: tuple[_FilterableJobType[Any], ...] | None = None
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1522,16 +1540,8 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
-        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
-        if event_type == EVENT_STATE_CHANGED:
-            aliased_listeners = self._listeners.get(EVENT_STATE_REPORTED, EMPTY_LIST)
-        else:
-            aliased_listeners = EMPTY_LIST
-        listeners = listeners + match_all_listeners + aliased_listeners
+        if (listeners := self._dispatch.get(event_type)) is None:
+            listeners = self._async_build_dispatch(event_type)
         if not listeners:
             return
 
@@ -1560,6 +1570,44 @@ class EventBus:
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def _async_build_dispatch(
+        self, event_type: EventType[Any] | str
+    ) -> tuple[_FilterableJobType[Any], ...]:
+        """Build the snapshot of listeners to call for an event type.
+
+        Only event types with listeners of their own are cached, as any
+        event type can be fired through the API. The other event types share
+        the snapshot of the MATCH_ALL listeners.
+        """
+        listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_type == EVENT_STATE_CHANGED:
+            aliased_listeners = self._listeners.get(EVENT_STATE_REPORTED, EMPTY_LIST)
+        else:
+            aliased_listeners = EMPTY_LIST
+        if event_type in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            match_all_listeners = EMPTY_LIST
+        elif not listeners and not aliased_listeners:
+            if (dispatch := self._match_all_dispatch) is None:
+                dispatch = self._match_all_dispatch = tuple(self._match_all_listeners)
+            return dispatch
+        else:
+            match_all_listeners = self._match_all_listeners
+        dispatch = (*listeners, *match_all_listeners, *aliased_listeners)
+        self._dispatch[event_type] = dispatch
+        return dispatch
+
+    @callback
+    def _async_invalidate_dispatch(self, event_type: EventType[Any] | str) -> None:
+        """Drop the snapshots that include listeners of an event type."""
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+            self._match_all_dispatch = None
+            return
+        self._dispatch.pop(event_type, None)
+        if event_type == EVENT_STATE_REPORTED:
+            self._dispatch.pop(EVENT_STATE_CHANGED, None)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1635,6 +1683,7 @@ class EventBus:
         filterable_job: _FilterableJobType[_DataT],
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_invalidate_dispatch(event_type)
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
@@ -1716,6 +1765,7 @@ class EventBus:
         """
         try:
             self._listeners[event_type].remove(filterable_job)
+            self._async_invalidate_dispatch(event_type)
 
             # delete event_type list if empty
             if not self._listeners[event_type] and event_type != MATCH_ALL:
@@ -1984,17 +2034,110 @@ class State:
         )
 
 
+# Attribute key layouts shared by all compact states, most entities of a
+# platform have the same attributes so only a handful of tuples are kept.
+# The table is cleared when it is full to drop the layouts no longer used.
+_COMPACT_ATTRIBUTE_KEYS: dict[tuple[str, ...], tuple[str, ...]] = {}
+_COMPACT_ATTRIBUTE_KEYS_MAX = 4096
+# The uncached implementations of the cached State properties
+_STATE_AS_DICT: Callable[[State], dict[str, Any]] = State.__dict__["_as_dict"].func
+_STATE_AS_COMPRESSED_STATE: Callable[[State], CompressedState] = State.__dict__[
+    "as_compressed_state"
+].func
+
+
+def _dead_attributes_ref() -> ReadOnlyDict[str, Any] | None:
+    """Return None like a weak reference to a collected object."""
+    return None
+
+
+class CompactState(State):
+    """State that stores its attributes as a key tuple and a value tuple.
+
+    The key tuple is interned and shared between all states with the same
+    attribute layout. The state only keeps a weak reference to the
+    attributes ReadOnlyDict, so it is shared while something holds it and
+    is otherwise created again on access, which trades some CPU time on
+    access for a smaller resident size. The dict representations are not
+    cached either, only the serialized JSON forms are.
+    """
+
+    _attribute_keys: tuple[str, ...]
+    _attribute_values: tuple[Any, ...]
+    # A weak reference to the attributes view, or _dead_attributes_ref
+    _attributes_ref: Callable[[], ReadOnlyDict[str, Any] | None]
+
+    @property
+    def attributes(self) -> ReadOnlyDict[str, Any]:
+        """Return a read only view of the attributes."""
+        if (attributes := self._attributes_ref()) is None:
+            attributes = ReadOnlyDict(
+                zip(self._attribute_keys, self._attribute_values, strict=False)
+            )
+            self._attributes_ref = weakref.ref(attributes)
+        return attributes
+
+    @attributes.setter
+    def attributes(self, attributes: Mapping[str, Any]) -> None:
+        """Store the attributes as interned keys and values."""
+        keys = tuple(attributes)
+        if (interned := _COMPACT_ATTRIBUTE_KEYS.get(keys)) is None:
+            if len(_COMPACT_ATTRIBUTE_KEYS) >= _COMPACT_ATTRIBUTE_KEYS_MAX:
+                _COMPACT_ATTRIBUTE_KEYS.clear()
+            interned = _COMPACT_ATTRIBUTE_KEYS[keys] = keys
+        self._attribute_keys = interned
+        self._attribute_values = tuple(attributes.values())
+        # Share the view with the state it was taken from, which keeps the
+        # attributes of both states identical
+        if type(attributes) is ReadOnlyDict:
+            self._attributes_ref = weakref.ref(attributes)
+        else:
+            self._attributes_ref = _dead_attributes_ref
+
+    @property
+    def _as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the State."""
+        return _STATE_AS_DICT(self)
+
+    @property
+    def as_compressed_state(self) -> CompressedState:
+        """Build a compressed dict of a state for adds."""
+        return _STATE_AS_COMPRESSED_STATE(self)
+
+
+def _glob_index_keys(pattern: str) -> tuple[str | None, str | None]:
+    """Return the literal domain and object id suffix of an entity glob.
+
+    The suffix is the part of the object id after the last underscore and
+    is only returned if every entity id matching the glob must have it.
+    """
+    domain_pattern, dot, _ = pattern.partition(".")
+    domain = domain_pattern if dot and not _GLOB_MAGIC.search(domain_pattern) else None
+    if "[" in pattern:
+        return domain, None
+    tail = pattern[max(pattern.rfind("*"), pattern.rfind("?")) + 1 :]
+    # Object ids can not contain a dot so a tail with a dot
+    # contains the whole object id
+    if "." in tail:
+        return domain, tail.rpartition(".")[2].rpartition("_")[2]
+    if "_" in tail:
+        return domain, tail.rpartition("_")[2]
+    return domain, None
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
-    Maintains an additional index:
+    Maintains additional indexes:
     - domain -> dict[str, State]
+    - object id suffix after the last underscore -> dict[str, None]
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._suffix_index: defaultdict[str, dict[str, None]] = defaultdict(dict)
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2002,6 +2145,8 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
+        if key not in self.data:
+            self._suffix_index[entry.object_id.rpartition("_")[2]][key] = None
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
 
@@ -2009,8 +2154,44 @@ class States(UserDict[str, State]):
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
+        suffix = entry.object_id.rpartition("_")[2]
+        suffix_entity_ids = self._suffix_index[suffix]
+        del suffix_entity_ids[key]
+        if not suffix_entity_ids:
+            del self._suffix_index[suffix]
         super().__delitem__(key)
 
+    def glob_entity_ids(self, pattern: str) -> list[str]:
+        """Get all entity_ids matching a glob.
+
+        Only the entity_ids of the literal domain or with the literal
+        object id suffix of the glob are matched against it.
+        """
+        if not _GLOB_MAGIC.search(pattern):
+            return [pattern] if pattern in self.data else []
+        domain, suffix = _glob_index_keys(pattern)
+        candidates: Iterable[str]
+        if suffix is not None:
+            if suffix not in self._suffix_index:
+                return []
+            candidates = self._suffix_index[suffix]
+            if domain is not None:
+                prefix = f"{domain}."
+                candidates = [
+                    entity_id
+                    for entity_id in candidates
+                    if entity_id.startswith(prefix)
+                ]
+        elif domain is not None:
+            candidates = self.domain_entity_ids(domain)
+        else:
+            candidates = self.data
+        return [
+            entity_id
+            for entity_id in candidates
+            if fnmatch.fnmatchcase(entity_id, pattern)
+        ]
+
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
         # Avoid polluting _domain_index with non-existing domains
@@ -2029,7 +2210,14 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_state_class",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2040,6 +2228,23 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._state_class: type[State] = State
+
+    @property
+    def compact(self) -> bool:
+        """Return if new states are stored in the compact format."""
+        return self._state_class is CompactState
+
+    @callback
+    def async_set_compact(self, compact: bool) -> None:
+        """Set if new states are stored in the compact format.
+
+        States that are already in the state machine keep their format
+        until they are replaced.
+
+        This method must be run in the event loop.
+        """
+        self._state_class = CompactState if compact else State
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2085,6 +2290,23 @@ class StateMachine:
             len(self._states.domain_entity_ids(domain)) for domain in domain_filter
         )
 
+    @callback
+    def async_entity_ids_glob(self, patterns: str | Iterable[str]) -> list[str]:
+        """List the entity ids that match one or more globs.
+
+        The globs are resolved with the domain and object id suffix
+        indexes so only the entity ids that can match are checked.
+
+        This method must be run in the event loop.
+        """
+        if isinstance(patterns, str):
+            return self._states.glob_entity_ids(patterns)
+
+        entity_ids: dict[str, None] = {}
+        for pattern in patterns:
+            entity_ids.update(dict.fromkeys(self._states.glob_entity_ids(pattern)))
+        return list(entity_ids)
+
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
         """Create a list of all states."""
         return run_callback_threadsafe(
@@ -2294,7 +2516,7 @@ class StateMachine:
 
         # This is intentionally called with positional only arguments for performance
         # reasons
-        state = State(
+        state = self._state_class(
             entity_id,
             new_state,
             attributes,
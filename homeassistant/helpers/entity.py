@@ -78,6 +78,7 @@ timer = time.time
 
 if TYPE_CHECKING:
     from .entity_platform import EntityPlatform
+    from .entity_values import EntityValues
 
 _T = TypeVar("_T")
 
@@ -240,6 +241,10 @@ class EntityPlatformState(Enum):
 
 _SENTINEL = object()
 
+# Key of the set of changed cached properties in the instance dict, the
+# _attr_ setters and deleters only track changes if the set exists
+_CACHED_PROPERTIES_CHANGED = "_cached_properties_changed"
+
 
 class EntityDescription(metaclass=FrozenOrThawed, frozen_or_thawed=True):
     """A class that describes Home Assistant entities."""
@@ -289,6 +294,9 @@ class CachedProperties(type):
       data, which will be stored in an attribute prefixed with __attr_
     - The _attr_-property setter will invalidate the @cached_property by calling
       delattr on it
+    - If the instance has a set stored as _cached_properties_changed in its
+      __dict__, the _attr_-property setter and deleter add the name of the
+      property to it
     """
 
     def __new__(
@@ -335,6 +343,8 @@ class CachedProperties(type):
                 o.__dict__.pop(name, None)
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
+                if (changed := o.__dict__.get(_CACHED_PROPERTIES_CHANGED)) is not None:
+                    changed.add(name)
 
             return _deleter
 
@@ -353,6 +363,8 @@ class CachedProperties(type):
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                if (changed := o.__dict__.get(_CACHED_PROPERTIES_CHANGED)) is not None:
+                    changed.add(name)
 
             return _setter
 
@@ -525,6 +537,27 @@ class Entity(
     _state_info: StateInfo = None  # type: ignore[assignment]
     _is_custom_component: bool = False
 
+    # Reuse the attributes of the previous state write when only properties in
+    # _state_only_properties have been set through their _attr_ since. Only for
+    # entities with attributes derived from _attr_ fields, other changes are not
+    # noticed, e.g. modifying the dict in _attr_extra_state_attributes in place
+    # or overriding properties which are not cached.
+    _cache_state_attributes: bool = False
+    # Cached properties which change the state but not the attributes
+    _state_only_properties: frozenset[str] = frozenset({"state"})
+    # The attributes of the previous state write and what they depend on
+    # besides the cached properties, set if _cache_state_attributes is True
+    __state_attributes_cache: (
+        tuple[
+            er.RegistryEntry | None,
+            dr.DeviceEntry | None,
+            EntityValues | None,
+            bool,
+            Mapping[str, Any],
+        ]
+        | None
+    ) = None
+
     __capabilities_updated_at: deque[float]
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
@@ -1133,6 +1166,9 @@ class Entity(
                 )
             return
 
+        if self._cache_state_attributes and self.__async_write_cached_attributes():
+            return
+
         state_calculate_start = timer()
         state, attr, capabilities, shadowed_attr = self.__async_calculate_state()
         time_now = timer()
@@ -1198,6 +1234,59 @@ class Entity(
         ):
             attr.update(custom)
 
+        if not self.__async_set_state(state, attr, time_now):
+            self.__state_attributes_cache = None
+            return
+
+        if self._cache_state_attributes and (
+            written_state := hass.states.get(entity_id)
+        ):
+            self.__dict__[_CACHED_PROPERTIES_CHANGED] = set()
+            self.__state_attributes_cache = (
+                entry,
+                self.device_entry,
+                customize,
+                self.available,
+                written_state.attributes,
+            )
+
+    def __async_write_cached_attributes(self) -> bool:
+        """Write the state with the attributes of the previous state write.
+
+        Returns False if the attributes may have changed since the previous
+        state write and have to be calculated.
+        """
+        if (cache := self.__state_attributes_cache) is None or not self.__dict__[
+            _CACHED_PROPERTIES_CHANGED
+        ] <= self._state_only_properties:
+            return False
+        hass = self.hass
+        entry, device_entry, customize, available, attributes = cache
+        if (
+            entry is not self.registry_entry
+            or device_entry is not self.device_entry
+            or customize is not hass.data.get(DATA_CUSTOMIZE)
+            or available != self.available
+            or (old_state := hass.states.get(self.entity_id)) is None
+            # The state was written by someone else
+            or old_state.attributes is not attributes
+        ):
+            return False
+
+        self.__dict__[_CACHED_PROPERTIES_CHANGED].clear()
+        if not self.__async_set_state(
+            self._stringify_state(available), attributes, timer()
+        ):
+            self.__state_attributes_cache = None
+        return True
+
+    def __async_set_state(
+        self, state: str, attr: Mapping[str, Any], time_now: float
+    ) -> bool:
+        """Set the state in the state machine.
+
+        Returns False if the state was invalid and unknown was set instead.
+        """
         if (
             self._context_set is not None
             and time_now - self._context_set > CONTEXT_RECENT_TIME_SECONDS
@@ -1205,9 +1294,10 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        hass = self.hass
         try:
             hass.states.async_set(
-                entity_id,
+                self.entity_id,
                 state,
                 attr,
                 self.force_update,
@@ -1217,11 +1307,15 @@ class Entity(
             )
         except InvalidStateError:
             _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
+                "Failed to set state for %s, fall back to %s",
+                self.entity_id,
+                STATE_UNKNOWN,
             )
             hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
+                self.entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
+            return False
+        return True
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
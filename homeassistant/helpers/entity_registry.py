@@ -10,7 +10,7 @@ timer.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Container, Hashable, KeysView, Mapping
+from collections.abc import Callable, Container, Hashable, KeysView, Mapping, Sequence
 from datetime import datetime, timedelta
 from enum import StrEnum
 from functools import cached_property
@@ -678,6 +678,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -878,7 +879,17 @@ class EntityRegistry(BaseRegistry):
         )
         self.entities[entity_id] = entry
         _LOGGER.info("Registered new %s.%s entity: %s", domain, platform, entity_id)
-        self.async_schedule_save()
+        changes: list[tuple[Sequence[str | Mapping[str, Any]], Any]] = [
+            (("entities", {"id": entry.id}), entry.as_storage_fragment)
+        ]
+        if deleted_entity is not None:
+            changes.append(
+                (
+                    ("deleted_entities", {"id": deleted_entity.id}),
+                    storage.JOURNAL_REMOVE,
+                )
+            )
+        self.async_schedule_save_changes(changes)
 
         self.hass.bus.async_fire_internal(
             EVENT_ENTITY_REGISTRY_UPDATED,
@@ -898,7 +909,14 @@ class EntityRegistry(BaseRegistry):
         key = (entity.domain, entity.platform, entity.unique_id)
         # If the entity does not belong to a config entry, mark it as orphaned
         orphaned_timestamp = None if config_entry_id else time.time()
-        self.deleted_entities[key] = DeletedRegistryEntry(
+        changes: list[tuple[Sequence[str | Mapping[str, Any]], Any]] = [
+            (("entities", {"id": entity.id}), storage.JOURNAL_REMOVE)
+        ]
+        if (replaced := self.deleted_entities.get(key)) is not None:
+            changes.append(
+                (("deleted_entities", {"id": replaced.id}), storage.JOURNAL_REMOVE)
+            )
+        deleted_entity = self.deleted_entities[key] = DeletedRegistryEntry(
             config_entry_id=config_entry_id,
             entity_id=entity_id,
             id=entity.id,
@@ -906,13 +924,19 @@ class EntityRegistry(BaseRegistry):
             platform=entity.platform,
             unique_id=entity.unique_id,
         )
+        changes.append(
+            (
+                ("deleted_entities", {"id": deleted_entity.id}),
+                deleted_entity.as_storage_fragment,
+            )
+        )
         self.hass.bus.async_fire_internal(
             EVENT_ENTITY_REGISTRY_UPDATED,
             _EventEntityRegistryUpdatedData_CreateRemove(
                 action="remove", entity_id=entity_id
             ),
         )
-        self.async_schedule_save()
+        self.async_schedule_save_changes(changes)
 
     @callback
     def async_device_modified(
@@ -1091,7 +1115,9 @@ class EntityRegistry(BaseRegistry):
 
         new = self.entities[entity_id] = attr.evolve(old, **new_values)
 
-        self.async_schedule_save()
+        self.async_schedule_save_changes(
+            [(("entities", {"id": new.id}), new.as_storage_fragment)]
+        )
 
         data: _EventEntityRegistryUpdatedData_Update = {
             "action": "update",
@@ -1344,10 +1370,17 @@ class EntityRegistry(BaseRegistry):
             if config_entry_id != deleted_entity.config_entry_id:
                 continue
             # Add a time stamp when the deleted entity became orphaned
-            self.deleted_entities[key] = attr.evolve(
+            deleted_entity = self.deleted_entities[key] = attr.evolve(
                 deleted_entity, orphaned_timestamp=now_time, config_entry_id=None
             )
-            self.async_schedule_save()
+            self.async_schedule_save_changes(
+                [
+                    (
+                        ("deleted_entities", {"id": deleted_entity.id}),
+                        deleted_entity.as_storage_fragment,
+                    )
+                ]
+            )
 
     @callback
     def async_purge_expired_orphaned_entities(self) -> None:
@@ -1363,7 +1396,14 @@ class EntityRegistry(BaseRegistry):
 
             if orphaned_timestamp + ORPHANED_ENTITY_KEEP_SECONDS < now_time:
                 self.deleted_entities.pop(key)
-                self.async_schedule_save()
+                self.async_schedule_save_changes(
+                    [
+                        (
+                            ("deleted_entities", {"id": deleted_entity.id}),
+                            storage.JOURNAL_REMOVE,
+                        )
+                    ]
+                )
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
@@ -9,7 +9,7 @@ import re
 import voluptuous as vol
 
 from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
-from homeassistant.core import split_entity_id
+from homeassistant.core import StateMachine, callback, split_entity_id
 
 from . import config_validation as cv
 
@@ -57,6 +57,33 @@ class EntityFilter:
             bool(self._exclude_eg and self._exclude_eg.match(entity_id))
         )
 
+    @callback
+    def async_filter_entity_ids(self, states: StateMachine) -> list[str]:
+        """Return the entity ids in the state machine that pass the filter.
+
+        If the filter has includes, only the included entities, the entities
+        of the included domains and the entities matching the include globs
+        can pass so only those are checked instead of all entities.
+
+        This method must be run in the event loop.
+        """
+        if not (self._include_e or self._include_d or self._include_eg):
+            candidates = states.async_entity_ids()
+        else:
+            candidates = [
+                entity_id for entity_id in self._include_e if states.get(entity_id)
+            ]
+            candidates.extend(states.async_entity_ids(self._include_d))
+            if self._include_eg:
+                candidates.extend(
+                    states.async_entity_ids_glob(self.config[CONF_INCLUDE_ENTITY_GLOBS])
+                )
+        return [
+            entity_id
+            for entity_id in dict.fromkeys(candidates)
+            if self._filter(entity_id)
+        ]
+
     def get_filter(self) -> Callable[[str], bool]:
         """Return the filter function."""
         return self._filter
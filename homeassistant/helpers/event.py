@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Callable, Coroutine, Hashable, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
@@ -51,6 +51,12 @@ from .entity_registry import (
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
+from .template_dependencies import (
+    TemplateDependencies,
+    async_analyze_template,
+    async_render_to_info_with_dependencies,
+    template_uses_variables,
+)
 from .typing import TemplateVarsType
 
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
@@ -68,6 +74,8 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+TRACK_TEMPLATE_RENDER_SCHEDULER = "track_template_render_scheduler"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -157,6 +165,24 @@ class TrackTemplateResult:
     result: Any
 
 
+@dataclass(slots=True)
+class TemplateRenderStats:
+    """Class for render statistics of a tracked template.
+
+    renders
+        The number of times the template was rendered.
+    shared
+        The number of times the render of another template with the same
+        source was used instead of rendering the template.
+    render_time
+        The total time spent rendering the template in seconds.
+    """
+
+    renders: int = 0
+    shared: int = 0
+    render_time: float = 0.0
+
+
 def threaded_listener_factory(
     async_factory: Callable[Concatenate[HomeAssistant, _P], Any],
 ) -> Callable[Concatenate[HomeAssistant, _P], CALLBACK_TYPE]:
@@ -928,6 +954,7 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: TrackTemplateResultListener,
         has_super_template: bool = False,
+        batch_renders: bool = False,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
@@ -937,11 +964,18 @@ class TrackTemplateResultInfo:
             track_template_.template.hass = hass
         self._track_templates = track_templates
         self._has_super_template = has_super_template
+        self._batch_renders = batch_renders
 
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        self._dependencies: dict[Template, TemplateDependencies | None] = {}
+        self._render_keys: dict[Template, Hashable | None] = {}
+        self._scheduler = _async_get_template_render_scheduler(hass)
+        self.render_stats: defaultdict[Template, TemplateRenderStats] = defaultdict(
+            TemplateRenderStats
+        )
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
@@ -961,9 +995,8 @@ class TrackTemplateResultInfo:
         # Render the super template first
         if super_template is not None:
             template = super_template.template
-            variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._async_render_to_info(
+                super_template, strict, log_fn
             )
 
             # If the super template did not render to True, don't update other templates
@@ -982,9 +1015,8 @@ class TrackTemplateResultInfo:
             if block_render or track_template_ == super_template:
                 continue
             template = track_template_.template
-            variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._async_render_to_info(
+                track_template_, strict, log_fn
             )
 
             if info.exception:
@@ -997,9 +1029,13 @@ class TrackTemplateResultInfo:
                 else:
                     log_fn(logging.ERROR, str(info.exception))
 
+        action: Callable[[Event[EventStateChangedData]], None] = self._refresh
+        if self._batch_renders:
+            action = self._async_schedule_refresh
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass, _render_infos_to_track_states(self._info.values()), action
         )
+        self._scheduler.trackers.add(self)
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1011,6 +1047,71 @@ class TrackTemplateResultInfo:
             block_render,
         )
 
+    @callback
+    def _async_render_to_info(
+        self,
+        track_template_: TrackTemplate,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+        render_cache: dict[Hashable, RenderInfo] | None = None,
+    ) -> RenderInfo:
+        """Render a template and find out which states it depends on.
+
+        When the dependencies can be derived from the template source they
+        are only analyzed once and the renders skip collecting them.
+
+        render_cache holds the renders of a batch, templates which render
+        the same way share a single render.
+        """
+        template = track_template_.template
+        variables = track_template_.variables
+        stats = self.render_stats[template]
+        render_key = None
+        if render_cache is not None:
+            render_key = self._async_render_key(track_template_)
+            if render_key is not None and (info := render_cache.get(render_key)):
+                stats.shared += 1
+                return info
+
+        if template in self._dependencies:
+            dependencies = self._dependencies[template]
+        else:
+            dependencies = self._dependencies[template] = async_analyze_template(
+                template, variables
+            )
+        start = time.perf_counter()
+        if dependencies is None:
+            info = template.async_render_to_info(
+                variables, strict=strict, log_fn=log_fn
+            )
+        else:
+            info = async_render_to_info_with_dependencies(
+                template, dependencies, variables, strict=strict, log_fn=log_fn
+            )
+        stats.renders += 1
+        stats.render_time += time.perf_counter() - start
+
+        if render_key is not None:
+            assert render_cache is not None
+            render_cache[render_key] = info
+        return info
+
+    @callback
+    def _async_render_key(self, track_template_: TrackTemplate) -> Hashable | None:
+        """Return a key which is the same for templates rendering the same way.
+
+        Returns None if the render can not be shared with other templates.
+        """
+        template = track_template_.template
+        if template in self._render_keys:
+            return self._render_keys[template]
+        render_key: Hashable | None = None
+        if not template_uses_variables(template, track_template_.variables):
+            # pylint: disable-next=protected-access
+            render_key = (template.template, template._strict, template._log_fn)
+        self._render_keys[template] = render_key
+        return render_key
+
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
         """State changes that will cause a re-render."""
@@ -1055,6 +1156,7 @@ class TrackTemplateResultInfo:
         """Cancel the listener."""
         assert self._track_state_changes
         self._track_state_changes.async_remove()
+        self._scheduler.async_remove(self)
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
@@ -1069,6 +1171,7 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        render_cache: dict[Hashable, RenderInfo] | None = None,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -1108,8 +1211,8 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._async_render_to_info(
+            track_template_, render_cache=render_cache
         )
 
         try:
@@ -1154,6 +1257,18 @@ class TrackTemplateResultInfo:
 
         return True
 
+    @callback
+    def _async_schedule_refresh(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule the templates the state change triggers to refresh."""
+        entity_id = event.data["entity_id"]
+        for track_template_ in self._track_templates:
+            if (
+                info := self._info.get(track_template_.template)
+            ) is not None and _event_triggers_rerender(event, info):
+                self._scheduler.async_schedule(
+                    self, track_template_, event, entity_id in info.entities
+                )
+
     @callback
     def _refresh(
         self,
@@ -1173,6 +1288,22 @@ class TrackTemplateResultInfo:
         replayed is True if the event is being replayed because the
         rate limit was hit.
         """
+        event, updates = self._async_render_updates(event, track_templates, replayed)
+        self._async_dispatch_updates(event, updates)
+
+    @callback
+    def _async_render_updates(
+        self,
+        event: Event[EventStateChangedData] | None,
+        track_templates: Iterable[TrackTemplate] | None = None,
+        replayed: bool | None = False,
+        render_cache: dict[Hashable, RenderInfo] | None = None,
+    ) -> tuple[Event[EventStateChangedData] | None, list[TrackTemplateResult]]:
+        """Re-render the templates and return the event and the changed results.
+
+        The event is None if the super template forced all templates to
+        re-render.
+        """
         updates: list[TrackTemplateResult] = []
         info_changed = False
         now = event.time_fired_timestamp if not replayed and event else time.time()
@@ -1184,7 +1315,9 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template, now, event, render_cache
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1215,7 +1348,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, render_cache
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -1242,12 +1377,21 @@ class TrackTemplateResultInfo:
                 block_updates,
             )
 
-        if not updates:
-            return
-
         for track_result in updates:
             self._last_result[track_result.template] = track_result.result
 
+        return event, updates
+
+    @callback
+    def _async_dispatch_updates(
+        self,
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        """Call the action with the changed results."""
+        if not updates:
+            return
+
         self.hass.async_run_hass_job(self._job, event, updates)
 
 
@@ -1270,6 +1414,125 @@ TrackTemplateResultListener = Callable[
 """
 
 
+class _TemplateRenderScheduler:
+    """Batch the re-renders of tracked templates which opt in to batching.
+
+    Templates triggered during an event loop iteration are rendered together
+    in a task started in the next iteration. Each template is rendered once,
+    however many state changes triggered it. All templates are rendered
+    before any action is called, so the states do not change during the
+    batch and templates which render the same way share a single render.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.trackers: set[TrackTemplateResultInfo] = set()
+        self._pending: dict[
+            TrackTemplateResultInfo,
+            dict[int, tuple[TrackTemplate, Event[EventStateChangedData], bool]],
+        ] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_schedule(
+        self,
+        tracker: TrackTemplateResultInfo,
+        track_template_: TrackTemplate,
+        event: Event[EventStateChangedData],
+        referenced: bool,
+    ) -> None:
+        """Schedule a template to re-render for a state change.
+
+        referenced is True if the template references the entity which
+        changed, those state changes are not rate limited and are kept
+        over later state changes which would be.
+        """
+        if (pending := self._pending.get(tracker)) is None:
+            pending = self._pending[tracker] = {}
+        key = id(track_template_)
+        if referenced or (scheduled := pending.get(key)) is None or not scheduled[2]:
+            pending[key] = (track_template_, event, referenced)
+        if self._task is None:
+            # The task is not started eagerly so the state changes of the
+            # current iteration are batched, it is tracked so waiting for
+            # hass to be done includes the renders
+            self._task = self.hass.async_create_task_internal(
+                self._async_render_pending(),
+                "track template render batch",
+                eager_start=False,
+            )
+
+    @callback
+    def async_remove(self, tracker: TrackTemplateResultInfo) -> None:
+        """Stop scheduling the templates of a tracker."""
+        self.trackers.discard(tracker)
+        self._pending.pop(tracker, None)
+
+    async def _async_render_pending(self) -> None:
+        """Render the scheduled templates and call the actions."""
+        self._task = None
+        pending = self._pending
+        self._pending = {}
+        render_cache: dict[Hashable, RenderInfo] = {}
+        results: list[
+            tuple[
+                TrackTemplateResultInfo,
+                Event[EventStateChangedData] | None,
+                list[TrackTemplateResult],
+            ]
+        ] = []
+        for tracker, scheduled in pending.items():
+            # Templates triggered by the same state change refresh together
+            by_event: dict[
+                int, tuple[Event[EventStateChangedData], list[TrackTemplate]]
+            ] = {}
+            for track_template_, event, _ in scheduled.values():
+                if (event_templates := by_event.get(id(event))) is None:
+                    event_templates = by_event[id(event)] = (event, [])
+                event_templates[1].append(track_template_)
+            for event, track_templates in by_event.values():
+                # pylint: disable-next=protected-access
+                refreshed_event, updates = tracker._async_render_updates(
+                    event, track_templates, render_cache=render_cache
+                )
+                results.append((tracker, refreshed_event, updates))
+
+        for tracker, refreshed_event, updates in results:
+            # An action may have removed the tracker
+            if tracker in self.trackers:
+                # pylint: disable-next=protected-access
+                tracker._async_dispatch_updates(refreshed_event, updates)
+
+
+@callback
+def _async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRenderScheduler:
+    """Return the template render scheduler."""
+    if (scheduler := hass.data.get(TRACK_TEMPLATE_RENDER_SCHEDULER)) is None:
+        scheduler = hass.data[TRACK_TEMPLATE_RENDER_SCHEDULER] = (
+            _TemplateRenderScheduler(hass)
+        )
+    return scheduler
+
+
+@callback
+def async_get_template_render_stats(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the render statistics of the tracked templates.
+
+    The statistics of templates with the same source are combined.
+    """
+    combined: defaultdict[str, TemplateRenderStats] = defaultdict(TemplateRenderStats)
+    for tracker in _async_get_template_render_scheduler(hass).trackers:
+        for template, stats in tracker.render_stats.items():
+            template_stats = combined[template.template]
+            template_stats.renders += stats.renders
+            template_stats.shared += stats.shared
+            template_stats.render_time += stats.render_time
+    return [{"template": source, **asdict(stats)} for source, stats in combined.items()]
+
+
 @callback
 @bind_hass
 def async_track_template_result(
@@ -1279,6 +1542,7 @@ def async_track_template_result(
     strict: bool = False,
     log_fn: Callable[[int, str], None] | None = None,
     has_super_template: bool = False,
+    batch_renders: bool = False,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1310,13 +1574,21 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    batch_renders
+        When set to True, the templates are re-rendered for state changes in
+        a batch in the next event loop iteration instead of immediately. Only
+        the result after the last state change of an iteration is passed to
+        the action, so this must not be used when every change of the result
+        needs to be seen, like for triggers.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, batch_renders
+    )
     tracker.async_setup(strict=strict, log_fn=log_fn)
     return tracker
 
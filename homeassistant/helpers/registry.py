@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict
-from collections.abc import Mapping, Sequence, ValuesView
+from collections.abc import Iterable, Mapping, Sequence, ValuesView
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -74,10 +74,27 @@ class BaseRegistry(ABC, Generic[_StoreDataT]):
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the registry."""
+        self._store.async_delay_save(self._data_to_save, self._async_save_delay())
+
+    @callback
+    def async_schedule_save_changes(
+        self, changes: Iterable[tuple[Sequence[str | Mapping[str, Any]], Any]]
+    ) -> None:
+        """Schedule saving changes to the registry.
+
+        When the store is in journal mode only the changes are written, see
+        Store.async_delay_save_changes.
+        """
+        self._store.async_delay_save_changes(
+            self._data_to_save, changes, self._async_save_delay()
+        )
+
+    @callback
+    def _async_save_delay(self) -> float:
+        """Return the delay before saving the registry."""
         # Schedule the save past startup to avoid writing
         # the file while the system is starting.
-        delay = SAVE_DELAY if self.hass.state is CoreState.running else SAVE_DELAY_LONG
-        self._store.async_delay_save(self._data_to_save, delay)
+        return SAVE_DELAY if self.hass.state is CoreState.running else SAVE_DELAY_LONG
 
     @callback
     @abstractmethod
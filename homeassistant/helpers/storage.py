@@ -8,7 +8,7 @@ from contextlib import suppress
 from copy import deepcopy
 from functools import cached_property
 import inspect
-from json import JSONDecodeError, JSONEncoder
+from json import JSONDecodeError, JSONEncoder, dumps
 import logging
 import os
 from pathlib import Path
@@ -47,6 +47,12 @@ STORAGE_MANAGER = "storage_manager"
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# Compact the journal into a full snapshot once it holds this many records
+JOURNAL_MAX_RECORDS = 1000
+# The value of a change which removes the value at its path
+JOURNAL_REMOVE = object()
+
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
 
@@ -242,6 +248,7 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
         """Initialize storage class."""
         self.version = version
@@ -259,12 +266,27 @@ class Store(Generic[_T]):
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        # Records of the changes which have not been written yet
+        self._journal_records: list[dict[str, Any]] = []
+        # The generation of the snapshot on disk, None if it is unknown
+        self._journal_generation: int | None = None
+        # The number of records in the journal on disk
+        self._journal_size = 0
+        # The next write has to be a full snapshot
+        self._journal_compact = False
+        self._journal_data_func: Callable[[], _T] | None = None
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self):
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -314,6 +336,7 @@ class Store(Generic[_T]):
             exists, data = cache
             if not exists:
                 return None
+            await self._async_load_journal(data)
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -375,6 +398,7 @@ class Store(Generic[_T]):
 
             if data == {}:
                 return None
+            await self._async_load_journal(data)
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -409,8 +433,68 @@ class Store(Generic[_T]):
 
         return stored
 
+    async def _async_load_journal(self, data: dict[str, Any]) -> None:
+        """Apply the journal to the data loaded from the snapshot."""
+        if not self._journal:
+            return
+        generation = data.pop("journal_generation", 0)
+        applied, complete = await self.hass.async_add_executor_job(
+            self._load_journal, data["data"], generation
+        )
+        self._journal_generation = generation
+        self._journal_size = applied
+        if not complete:
+            # Appending after an incomplete record would lose the new records
+            self._journal_compact = True
+
+    def _load_journal(self, data: dict[str, Any], generation: int) -> tuple[int, bool]:
+        """Apply the records of the journal to the data.
+
+        Returns the number of records applied and if the journal was complete,
+        which is not the case if a write was interrupted.
+        """
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return 0, True
+
+        try:
+            header = json_util.json_loads_object(lines[0])
+        except (IndexError, *json_util.JSON_DECODE_EXCEPTIONS):
+            header = {}
+        if header.get("journal_generation") != generation:
+            # The snapshot was written after the journal, so it already
+            # contains its changes. The journal is replaced on the next write.
+            _LOGGER.debug("Ignoring outdated journal for %s", self.key)
+            return 0, True
+
+        applied = 0
+        for line in lines[1:]:
+            try:
+                _apply_journal_record(data, json_util.json_loads_object(line))
+            except (
+                *json_util.JSON_DECODE_EXCEPTIONS,
+                AttributeError,
+                KeyError,
+                TypeError,
+                ValueError,
+            ):
+                _LOGGER.warning(
+                    "Ignoring incomplete journal record for %s at %s; "
+                    "This may indicate an unclean shutdown; "
+                    "%s changes were recovered",
+                    self.key,
+                    self.journal_path,
+                    applied,
+                )
+                return applied, False
+            applied += 1
+        return applied, True
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
+        self._journal_compact = True
         self._data = {
             "version": self.version,
             "minor_version": self.minor_version,
@@ -431,6 +515,45 @@ class Store(Generic[_T]):
         delay: float = 0,
     ) -> None:
         """Save data with an optional delay."""
+        self._journal_compact = True
+        self._async_delay_save(data_func, delay)
+
+    @callback
+    def async_delay_save_changes(
+        self,
+        data_func: Callable[[], _T],
+        changes: Iterable[tuple[Sequence[str | Mapping[str, Any]], Any]],
+        delay: float = 0,
+    ) -> None:
+        """Save changes to the data with an optional delay.
+
+        Each change sets the value at a path of keys in the data, or removes
+        it if the value is JOURNAL_REMOVE. A key can also be a mapping of a
+        single key and value, which selects the item of a list that has that
+        value, like {"id": entry_id}. Setting an item that is not in the list
+        appends it. When the store is in journal mode, the
+        changes are appended to the journal instead of writing all data, and
+        the data returned by data_func is only written when the journal is
+        compacted. Otherwise this is the same as async_delay_save.
+        """
+        if not self._journal:
+            self.async_delay_save(data_func, delay)
+            return
+
+        for path, value in changes:
+            record: dict[str, Any] = {"path": list(path)}
+            if value is not JOURNAL_REMOVE:
+                record["value"] = value
+            self._journal_records.append(record)
+        self._async_delay_save(data_func, delay)
+
+    @callback
+    def _async_delay_save(
+        self,
+        data_func: Callable[[], _T],
+        delay: float,
+    ) -> None:
+        """Schedule a delayed write of the data."""
         self._data = {
             "version": self.version,
             "minor_version": self.minor_version,
@@ -506,6 +629,21 @@ class Store(Generic[_T]):
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if self._journal:
+            # Compact the journal into a full snapshot when stopping, this
+            # also writes changes which were lost by a failed write
+            if (
+                self._data is None
+                and (self._journal_size or self._journal_compact)
+                and self._journal_data_func is not None
+            ):
+                self._data = {
+                    "version": self.version,
+                    "minor_version": self.minor_version,
+                    "key": self.key,
+                    "data_func": self._journal_data_func,
+                }
+            self._journal_compact = True
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -521,14 +659,106 @@ class Store(Generic[_T]):
 
             data = self._data
             self._data = None
+            records = self._journal_records
+            self._journal_records = []
 
             if self._read_only:
                 return
 
             try:
-                await self._async_write_data(self.path, data)
+                if self._journal:
+                    await self._async_write_journal(data, records)
+                else:
+                    await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
+                if self._journal:
+                    # The records are gone, the next write or the final
+                    # write has to be a snapshot
+                    self._journal_compact = True
+                    self._async_ensure_final_write_listener()
+
+    async def _async_write_journal(
+        self, data: dict, records: list[dict[str, Any]]
+    ) -> None:
+        """Append the records to the journal or compact it into a snapshot."""
+        if "data_func" in data:
+            self._journal_data_func = data["data_func"]
+
+        if (
+            records
+            and not self._journal_compact
+            and self._journal_generation is not None
+            and self._journal_size + len(records) < JOURNAL_MAX_RECORDS
+        ):
+            await self._async_append_journal(records)
+            self._journal_size += len(records)
+            self._async_ensure_final_write_listener()
+            return
+
+        # Clear the flag before writing so a save requested while the
+        # snapshot is written makes the next write a snapshot again
+        self._journal_compact = False
+        generation = (self._journal_generation or 0) + 1
+        data["journal_generation"] = generation
+        try:
+            await self._async_write_data(self.path, data)
+            await self.hass.async_add_executor_job(self._remove_journal)
+        except BaseException:
+            self._journal_compact = True
+            raise
+        self._journal_generation = generation
+        self._journal_size = 0
+
+    async def _async_append_journal(self, records: list[dict[str, Any]]) -> None:
+        """Append the records to the journal."""
+        # A new journal starts with the generation of the snapshot it applies to
+        generation = None if self._journal_size else self._journal_generation
+        await self.hass.async_add_executor_job(
+            self._append_journal, records, generation
+        )
+
+    def _append_journal(
+        self, records: list[dict[str, Any]], generation: int | None
+    ) -> None:
+        """Append records to the journal, or start a new one for a generation."""
+        lines = [self._journal_dumps(record) for record in records]
+        flags = os.O_WRONLY | os.O_CREAT
+        if generation is None:
+            flags |= os.O_APPEND
+        else:
+            flags |= os.O_TRUNC
+            lines.insert(0, self._journal_dumps({"journal_generation": generation}))
+
+        _LOGGER.debug(
+            "Appending %s records for %s to %s",
+            len(records),
+            self.key,
+            self.journal_path,
+        )
+        try:
+            fd = os.open(self.journal_path, flags, 0o600 if self._private else 0o644)
+            with os.fdopen(fd, "wb") as fdesc:
+                fdesc.write(b"".join(line + b"\n" for line in lines))
+        except OSError as err:
+            _LOGGER.exception("Appending to journal failed: %s", self.journal_path)
+            raise WriteError(err) from err
+
+    def _journal_dumps(self, record: dict[str, Any]) -> bytes:
+        """Serialize a journal record to a single line."""
+        try:
+            if self._encoder and self._encoder is not json_helper.JSONEncoder:
+                return dumps(record, cls=self._encoder).encode()
+            return json_helper.json_bytes(record)
+        except json_util.JSON_ENCODE_EXCEPTIONS as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize journal record for {self.key}: {err}"
+            ) from err
+
+    def _remove_journal(self) -> None:
+        """Remove the journal."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
@@ -558,6 +788,55 @@ class Store(Generic[_T]):
         self._manager.async_invalidate(self.key)
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        self._journal_records = []
+        self._journal_generation = None
+        self._journal_size = 0
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            await self.hass.async_add_executor_job(self._remove_journal)
+
+
+def _apply_journal_record(data: dict[str, Any], record: dict[str, Any]) -> None:
+    """Apply a journal record to the data."""
+    path: list[str | dict[str, Any]] = record["path"]
+    container: Any = data
+    for key, child_key in zip(path, path[1:], strict=False):
+        container = _journal_child(
+            container, key, [] if isinstance(child_key, dict) else {}
+        )
+    key = path[-1]
+    if isinstance(key, dict):
+        index = _journal_item_index(container, key)
+        if "value" in record:
+            if index is None:
+                container.append(record["value"])
+            else:
+                container[index] = record["value"]
+        elif index is not None:
+            del container[index]
+    elif "value" in record:
+        container[key] = record["value"]
+    else:
+        container.pop(key, None)
+
+
+def _journal_child(
+    container: Any, key: str | dict[str, Any], default: dict | list
+) -> Any:
+    """Return the child of a container in a journal path."""
+    if not isinstance(key, dict):
+        return container.setdefault(key, default)
+    if (index := _journal_item_index(container, key)) is None:
+        raise KeyError(key)
+    return container[index]
+
+
+def _journal_item_index(items: list[Any], key: dict[str, Any]) -> int | None:
+    """Return the index of the list item selected by a journal path key."""
+    ((item_key, item_value),) = key.items()
+    for index, item in enumerate(items):
+        if item.get(item_key) == item_value:
+            return index
+    return None
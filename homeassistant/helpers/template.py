@@ -161,10 +161,23 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+#
+# COMPILED_TEMPLATE_CACHE_SIZE is the number of compiled templates kept
+# by CACHED_COMPILED_TEMPLATES. The compiled code does not depend on the
+# hass instance, only on the filters and tests of the environment, so it
+# is shared by all environments of the same flavor. This avoids compiling
+# the same template string again for every automation, template entity
+# and websocket render that uses it.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
+CACHED_COMPILED_TEMPLATES: LRU[tuple[str, str], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -190,6 +203,43 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
     return template_state
 
 
+class CompiledTemplateCacheStats:
+    """Hits and misses of the compiled template caches.
+
+    environment_hits are hits of the template cache of an environment,
+    shared_hits are hits of CACHED_COMPILED_TEMPLATES after the template
+    was not in the cache of the environment.
+    """
+
+    __slots__ = ("environment_hits", "shared_hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.environment_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dict."""
+        hits = self.environment_hits + self.shared_hits
+        lookups = hits + self.misses
+        shared_lookups = self.shared_hits + self.misses
+        return {
+            "environment_hits": self.environment_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "shared_hit_rate": (
+                self.shared_hits / shared_lookups if shared_lookups else 0.0
+            ),
+            "size": len(CACHED_COMPILED_TEMPLATES),
+            "max_size": CACHED_COMPILED_TEMPLATES.get_size(),
+        }
+
+
+COMPILED_TEMPLATE_CACHE_STATS = CompiledTemplateCacheStats()
+
+
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
 
@@ -204,6 +254,9 @@ def async_setup(hass: HomeAssistant) -> bool:
             current_size = lru.get_size()
             if new_size > current_size:
                 lru.set_size(new_size)
+        _LOGGER.debug(
+            "Compiled template cache: %s", COMPILED_TEMPLATE_CACHE_STATS.as_dict()
+        )
 
     from .event import (  # pylint: disable=import-outside-toplevel
         async_track_time_interval,
@@ -743,10 +796,13 @@ class Template:
         error_value: Any = _SENTINEL,
         variables: dict[str, Any] | None = None,
         parse_result: bool = False,
+        parse_json: bool = True,
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too. When parse_json is False
+        the value is not parsed, the caller passes value_json in variables
+        if it has already parsed the value.
 
         This method must be run in the event loop.
         """
@@ -760,8 +816,9 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        with suppress(*JSON_DECODE_EXCEPTIONS):
-            variables["value_json"] = json_loads(value)
+        if parse_json:
+            with suppress(*JSON_DECODE_EXCEPTIONS):
+                variables["value_json"] = json_loads(value)
 
         try:
             render_result = _render_with_context(
@@ -2719,6 +2776,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # Environments of the same flavor have the same filters and tests
+        # and share the compiled code in CACHED_COMPILED_TEMPLATES
+        self.flavor: str
+        if hass is None:
+            self.flavor = "no_hass"
+        elif limited:
+            self.flavor = "limited"
+        elif strict:
+            self.flavor = "strict"
+        else:
+            self.flavor = "normal"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
@@ -3068,9 +3136,21 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
+        if (cached := self.template_cache.get(source)) is not None:
+            COMPILED_TEMPLATE_CACHE_STATS.environment_hits += 1
+            return cached
+
+        if not isinstance(source, str):
             cached = self.template_cache[source] = super().compile(source)
+            return cached
 
+        key = (source, self.flavor)
+        if (cached := CACHED_COMPILED_TEMPLATES.get(key)) is not None:
+            COMPILED_TEMPLATE_CACHE_STATS.shared_hits += 1
+        else:
+            COMPILED_TEMPLATE_CACHE_STATS.misses += 1
+            cached = CACHED_COMPILED_TEMPLATES[key] = super().compile(source)
+        self.template_cache[source] = cached
         return cached
 
 
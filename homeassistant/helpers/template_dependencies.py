@@ -0,0 +1,487 @@
+"""Static dependency analysis of templates.
+
+RenderInfo collects the entities and domains a template depends on while
+it renders. The analysis in this module derives the same information from
+the Jinja AST without rendering, for the templates where it can be proven.
+
+The analysis only succeeds when every access to the state machine is
+unconditional, so the dependencies are the same on every render. Access
+inside if blocks, conditional expressions, the right side of and/or and
+loop bodies, as well as macros, imports and functions which look up
+states dynamically, like expand, make the analysis fail and the template
+has to be rendered with collection instead.
+
+Templates which iterate over all states but only keep some domains, like
+states | selectattr('domain', 'eq', 'sensor'), depend on those domains
+only. The collection at render time can not know that and listens for
+all state changes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any
+
+import jinja2
+from jinja2 import nodes
+
+from homeassistant.core import State, callback, valid_domain, valid_entity_id
+from homeassistant.exceptions import TemplateError
+
+from .template import (
+    _RESERVED_NAMES,
+    EVAL_CACHE_SIZE,
+    RenderInfo,
+    Template,
+    TemplateEnvironment,
+    TemplateStateBase,
+)
+from .typing import TemplateVarsType
+
+# Functions, filters and tests which look up the entity id passed as
+# the first argument
+_ENTITY_FUNCTIONS = {
+    "has_value",
+    "is_state",
+    "is_state_attr",
+    "state_attr",
+    "state_translated",
+    "states",
+}
+# Functions and filters which record the current time is used
+_TIME_FUNCTIONS = {
+    "now",
+    "relative_time",
+    "time_since",
+    "time_until",
+    "today_at",
+    "utcnow",
+}
+# Functions and filters which look up states dynamically
+_DYNAMIC_FUNCTIONS = {"closest", "distance", "expand"}
+_SPECIAL_NAMES = _ENTITY_FUNCTIONS | _TIME_FUNCTIONS | _DYNAMIC_FUNCTIONS
+
+# Filters which take the name of another filter or test as argument
+_HIGHER_ORDER_FILTERS = {"map", "reject", "rejectattr", "select", "selectattr"}
+# Filters which only use the number of states of a domain
+_LENGTH_FILTERS = {"count", "length"}
+_EQUALITY_TESTS = {"==", "eq", "equalto"}
+
+_UNSUPPORTED_NODES = (
+    nodes.Block,
+    nodes.CallBlock,
+    nodes.Extends,
+    nodes.FromImport,
+    nodes.Import,
+    nodes.Include,
+    nodes.Macro,
+)
+
+# The parser does not depend on the hass instance
+_PARSE_ENV = TemplateEnvironment(None)
+
+_PLAIN_TYPES = (str, int, float, date, datetime, time, timedelta)
+_MAX_VARIABLE_DEPTH = 8
+
+
+@dataclass(slots=True, frozen=True)
+class TemplateDependencies:
+    """The state machine dependencies of a template."""
+
+    entities: frozenset[str]
+    domains: frozenset[str]
+    domains_lifecycle: frozenset[str]
+    has_time: bool
+
+
+@dataclass(slots=True, frozen=True)
+class _SourceDependencies:
+    """The dependencies of a template source before variables are known."""
+
+    dependencies: TemplateDependencies
+    # Names which are not assigned by the template and are not special
+    names: frozenset[str]
+    # The names which are only loaded conditionally
+    conditional_names: frozenset[str]
+
+
+class _UnprovableError(Exception):
+    """The dependencies of the template can not be proven."""
+
+
+class _DependencyVisitor:
+    """Walk the AST of a template and collect its dependencies."""
+
+    def __init__(self, local_names: set[str]) -> None:
+        """Initialize the visitor."""
+        self.local_names = local_names
+        self.entities: set[str] = set()
+        self.domains: set[str] = set()
+        self.domains_lifecycle: set[str] = set()
+        self.has_time = False
+        self.names: set[str] = set()
+        self.conditional_names: set[str] = set()
+
+    def visit(self, node: nodes.Node, conditional: bool) -> None:
+        """Visit a node."""
+        if isinstance(node, _UNSUPPORTED_NODES):
+            raise _UnprovableError
+        if isinstance(node, nodes.Name):
+            self._visit_name(node, conditional)
+        elif isinstance(node, (nodes.Getattr, nodes.Getitem)):
+            self._visit_lookup(node, conditional)
+        elif isinstance(node, nodes.Call):
+            self._visit_call(node, conditional)
+        elif isinstance(node, nodes.Filter):
+            self._visit_filter(node, conditional)
+        elif isinstance(node, nodes.Test):
+            self._visit_test(node, conditional)
+        elif isinstance(node, nodes.If):
+            self.visit(node.test, conditional)
+            self._visit_all((*node.body, *node.elif_, *node.else_), True)
+        elif isinstance(node, nodes.CondExpr):
+            self.visit(node.test, conditional)
+            self.visit(node.expr1, True)
+            if node.expr2 is not None:
+                self.visit(node.expr2, True)
+        elif isinstance(node, (nodes.And, nodes.Or)):
+            self.visit(node.left, conditional)
+            self.visit(node.right, True)
+        elif isinstance(node, nodes.For):
+            self.visit(node.target, conditional)
+            self.visit(node.iter, conditional)
+            self._visit_all((*node.body, *node.else_), True)
+            if node.test is not None:
+                self.visit(node.test, True)
+        else:
+            self._visit_all(node.iter_child_nodes(), conditional)
+
+    def _visit_all(self, children: Iterable[nodes.Node], conditional: bool) -> None:
+        """Visit nodes."""
+        for child in children:
+            self.visit(child, conditional)
+
+    def _require_unconditional(self, conditional: bool) -> None:
+        """Fail if a dependency is only used conditionally."""
+        if conditional:
+            raise _UnprovableError
+
+    def _is_special_name(self, node: nodes.Node, names: set[str]) -> bool:
+        """Return if the node loads one of the special names."""
+        return (
+            isinstance(node, nodes.Name)
+            and node.ctx == "load"
+            and node.name in names
+            and node.name not in self.local_names
+        )
+
+    def _visit_name(self, node: nodes.Name, conditional: bool) -> None:
+        """Visit a name which is not part of a supported pattern."""
+        name = node.name
+        if node.ctx != "load" or name in self.local_names:
+            return
+        if name in _TIME_FUNCTIONS:
+            self._require_unconditional(conditional)
+            self.has_time = True
+            return
+        if name in _SPECIAL_NAMES:
+            # All states or a function which is not called with an entity id
+            raise _UnprovableError
+        self.names.add(name)
+        if conditional:
+            self.conditional_names.add(name)
+
+    def _resolve_states_lookup(self, node: nodes.Node) -> str | None:
+        """Return the domain or entity id of a lookup on states."""
+        if isinstance(node, nodes.Getattr):
+            key, parent = node.attr, node.node
+        elif (
+            isinstance(node, nodes.Getitem)
+            and isinstance(node.arg, nodes.Const)
+            and isinstance(node.arg.value, str)
+        ):
+            key, parent = node.arg.value, node.node
+        else:
+            return None
+        if self._is_special_name(parent, {"states"}):
+            return key
+        domain = self._resolve_states_lookup(parent)
+        if domain is not None and "." not in domain:
+            return f"{domain}.{key}"
+        return None
+
+    def _add_lookup(self, key: str, conditional: bool, lifecycle: bool) -> None:
+        """Add the domain or entity id a lookup on states depends on."""
+        if "." in key:
+            if not valid_entity_id(key):
+                raise _UnprovableError
+            self._add_entity(key)
+            return
+        if key in _RESERVED_NAMES or not valid_domain(key):
+            raise _UnprovableError
+        self._require_unconditional(conditional)
+        if lifecycle:
+            self.domains_lifecycle.add(key)
+        else:
+            self.domains.add(key)
+
+    def _add_entity(self, entity_id: Any) -> None:
+        """Add an entity id passed as a constant."""
+        if not isinstance(entity_id, str):
+            raise _UnprovableError
+        self.entities.add(entity_id)
+
+    def _visit_lookup(
+        self, node: nodes.Getattr | nodes.Getitem, conditional: bool
+    ) -> None:
+        """Visit a lookup which may be states.domain or states.domain.object."""
+        if (key := self._resolve_states_lookup(node)) is None:
+            self._visit_all(node.iter_child_nodes(), conditional)
+            return
+        # Entity lookups are only collected when they are used, collecting
+        # them unconditionally listens for more than the render would
+        if "." in key:
+            self._require_unconditional(conditional)
+        self._add_lookup(key, conditional, False)
+
+    def _visit_entity_function(
+        self, node: nodes.Call | nodes.Filter | nodes.Test, conditional: bool
+    ) -> None:
+        """Visit the arguments of a function called with an entity id."""
+        self._require_unconditional(conditional)
+        if node.dyn_args is not None or node.dyn_kwargs is not None:
+            raise _UnprovableError
+        self._visit_all(
+            (*node.args, *(keyword.value for keyword in node.kwargs)), conditional
+        )
+
+    def _visit_call(self, node: nodes.Call, conditional: bool) -> None:
+        """Visit a call."""
+        if not self._is_special_name(node.node, _ENTITY_FUNCTIONS):
+            self._visit_all(node.iter_child_nodes(), conditional)
+            return
+        if not node.args or not isinstance(entity_id := node.args[0], nodes.Const):
+            raise _UnprovableError
+        self._add_entity(entity_id.value)
+        self._visit_entity_function(node, conditional)
+
+    def _visit_filter(self, node: nodes.Filter, conditional: bool) -> None:
+        """Visit a filter."""
+        name = node.name
+        if name in _ENTITY_FUNCTIONS:
+            if not isinstance(node.node, nodes.Const):
+                raise _UnprovableError
+            self._add_entity(node.node.value)
+            self._visit_entity_function(node, conditional)
+            return
+        if name in _TIME_FUNCTIONS:
+            self._require_unconditional(conditional)
+            self.has_time = True
+        elif name in _DYNAMIC_FUNCTIONS or (
+            name in _HIGHER_ORDER_FILTERS
+            and any(
+                isinstance(arg, nodes.Const) and arg.value in _SPECIAL_NAMES
+                for arg in node.args
+            )
+        ):
+            raise _UnprovableError
+
+        if (
+            name in _LENGTH_FILTERS
+            and node.node is not None
+            and (key := self._resolve_states_lookup(node.node)) is not None
+            and "." not in key
+        ):
+            self._add_lookup(key, conditional, True)
+            self._visit_all(node.args, conditional)
+            return
+
+        if (
+            name == "selectattr"
+            and node.node is not None
+            and self._is_special_name(node.node, {"states"})
+        ):
+            self._require_unconditional(conditional)
+            for domain in _selected_domains(node):
+                self._add_lookup(domain, conditional, False)
+            return
+
+        self._visit_all(node.iter_child_nodes(), conditional)
+
+    def _visit_test(self, node: nodes.Test, conditional: bool) -> None:
+        """Visit a test."""
+        if node.name not in _ENTITY_FUNCTIONS:
+            self._visit_all(node.iter_child_nodes(), conditional)
+            return
+        if not isinstance(node.node, nodes.Const):
+            raise _UnprovableError
+        self._add_entity(node.node.value)
+        self._visit_entity_function(node, conditional)
+
+
+def _selected_domains(node: nodes.Filter) -> list[str]:
+    """Return the domains selected by states | selectattr('domain', ...)."""
+    if node.kwargs or node.dyn_args is not None or node.dyn_kwargs is not None:
+        raise _UnprovableError
+    match node.args:
+        case [
+            nodes.Const(value="domain"),
+            nodes.Const(value=test),
+            nodes.Const(value=str(domain)),
+        ] if test in _EQUALITY_TESTS:
+            return [domain]
+        case [
+            nodes.Const(value="domain"),
+            nodes.Const(value="in"),
+            nodes.List(items=items)
+            | nodes.Tuple(items=items),
+        ]:
+            domains = [
+                item.value
+                for item in items
+                if isinstance(item, nodes.Const) and isinstance(item.value, str)
+            ]
+            if len(domains) == len(items):
+                return domains
+    raise _UnprovableError
+
+
+@lru_cache(maxsize=EVAL_CACHE_SIZE)
+def _analyze_source(source: str) -> _SourceDependencies | None:
+    """Analyze the dependencies of a template source."""
+    try:
+        ast = _PARSE_ENV.parse(source)
+    except jinja2.TemplateSyntaxError:
+        return None
+
+    local_names = {
+        node.name for node in ast.find_all(nodes.Name) if node.ctx in ("store", "param")
+    }
+    if not local_names.isdisjoint(_SPECIAL_NAMES):
+        return None
+
+    visitor = _DependencyVisitor(local_names)
+    try:
+        visitor.visit(ast, False)
+    except _UnprovableError:
+        return None
+
+    return _SourceDependencies(
+        TemplateDependencies(
+            frozenset(visitor.entities),
+            frozenset(visitor.domains),
+            frozenset(visitor.domains_lifecycle),
+            visitor.has_time,
+        ),
+        frozenset(visitor.names),
+        frozenset(visitor.conditional_names),
+    )
+
+
+def _is_plain(value: Any, depth: int = _MAX_VARIABLE_DEPTH) -> bool:
+    """Return if a variable can not look up states when it is used."""
+    if value is None or isinstance(value, _PLAIN_TYPES):
+        return True
+    if isinstance(value, TemplateStateBase):
+        return False
+    if isinstance(value, State):
+        return True
+    if not depth:
+        return False
+    if isinstance(value, Mapping):
+        return all(_is_plain(item, depth - 1) for item in value.values())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(_is_plain(item, depth - 1) for item in value)
+    return False
+
+
+def async_analyze_template(
+    template: Template, variables: TemplateVarsType = None
+) -> TemplateDependencies | None:
+    """Return the dependencies of a template rendered with variables.
+
+    Returns None if the dependencies can not be proven, the template
+    has to be rendered with async_render_to_info then.
+    """
+    if template.is_static:
+        return None
+    try:
+        template.ensure_valid()
+    except TemplateError:
+        return None
+    if (source_dependencies := _analyze_source(template.template)) is None:
+        return None
+    dependencies = source_dependencies.dependencies
+    if not variables:
+        return dependencies
+    if not _SPECIAL_NAMES.isdisjoint(variables):
+        return None
+
+    entities: set[str] = set()
+    for name in source_dependencies.names:
+        if name not in variables:
+            continue
+        value = variables[name]
+        if isinstance(value, TemplateStateBase):
+            # Like this in template entities
+            if name in source_dependencies.conditional_names:
+                return None
+            entities.add(value.entity_id)
+        elif not _is_plain(value):
+            return None
+
+    if not entities:
+        return dependencies
+    return TemplateDependencies(
+        dependencies.entities | entities,
+        dependencies.domains,
+        dependencies.domains_lifecycle,
+        dependencies.has_time,
+    )
+
+
+def template_uses_variables(template: Template, variables: TemplateVarsType) -> bool:
+    """Return if rendering the template may use any of the variables.
+
+    Returns True if it can not be proven the variables are unused.
+    """
+    if not variables or template.is_static:
+        return False
+    if not _SPECIAL_NAMES.isdisjoint(variables):
+        return True
+    source_dependencies = _analyze_source(template.template)
+    return source_dependencies is None or not source_dependencies.names.isdisjoint(
+        variables
+    )
+
+
+@callback
+def async_render_to_info_with_dependencies(
+    template: Template,
+    dependencies: TemplateDependencies,
+    variables: TemplateVarsType = None,
+    strict: bool = False,
+    log_fn: Callable[[int, str], None] | None = None,
+) -> RenderInfo:
+    """Render the template and return the analyzed dependencies as render info.
+
+    The state machine accesses are not collected while rendering.
+    """
+    render_info = RenderInfo(template)
+    # pylint: disable=protected-access
+    try:
+        render_info._result = template.async_render(
+            variables, strict=strict, log_fn=log_fn
+        )
+    except TemplateError as ex:
+        render_info.exception = ex
+
+    render_info.entities = dependencies.entities
+    render_info.domains = dependencies.domains
+    render_info.domains_lifecycle = dependencies.domains_lifecycle
+    render_info.has_time = dependencies.has_time
+    render_info._freeze()
+    return render_info
@@ -28,17 +28,27 @@ _CallableT = TypeVar("_CallableT", bound=Callable)
 
 BENCHMARKS: dict[str, Callable] = {}
 
+# Database used by the recorder benchmarks, can be set with --db-url
+# to compare against a local PostgreSQL or MariaDB server.
+DB_URL = "sqlite://"
+
 
 def run(args):
     """Handle benchmark commandline script."""
+    global DB_URL  # noqa: PLW0603 # pylint: disable=global-statement
+
     # Disable logging
     logging.getLogger("homeassistant.core").setLevel(logging.CRITICAL)
 
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
     parser.add_argument("name", choices=BENCHMARKS)
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--db-url", default=DB_URL, help="Database used by the recorder benchmarks"
+    )
 
     args = parser.parse_args()
+    DB_URL = args.db_url
 
     bench = BENCHMARKS[args.name]
     print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
@@ -121,6 +131,68 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_with_listeners(hass):
+    """Fire 100k state changed events with 10, 100 and 1000 listeners.
+
+    Compares listeners that filter every event themselves with listeners
+    bucketed by entity_id through async_track_state_change_event.
+    """
+    events_to_fire = 10**5
+    total = 0.0
+    event_data = {
+        "entity_id": "light.kitchen_0",
+        "old_state": core.State("light.kitchen_0", "off"),
+        "new_state": core.State("light.kitchen_0", "on"),
+    }
+
+    for listener_count in (10, 100, 1000):
+        for bucketed in (False, True):
+            count = 0
+
+            @core.callback
+            def listener(_):
+                """Handle event."""
+                nonlocal count
+                count += 1
+
+            entity_ids = [f"light.kitchen_{idx}" for idx in range(listener_count)]
+            if bucketed:
+                unsubs = [
+                    async_track_state_change_event(hass, entity_id, listener)
+                    for entity_id in entity_ids
+                ]
+            else:
+                unsubs = [
+                    hass.bus.async_listen(
+                        EVENT_STATE_CHANGED,
+                        listener,
+                        event_filter=core.callback(
+                            lambda data, entity_id=entity_id: data["entity_id"]
+                            == entity_id
+                        ),
+                    )
+                    for entity_id in entity_ids
+                ]
+
+            start = timer()
+            for _ in range(events_to_fire):
+                hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+            await hass.async_block_till_done()
+            runtime = timer() - start
+
+            assert count == events_to_fire
+            print(
+                f"{listener_count} {'bucketed' if bucketed else 'filtered'}"
+                f" listeners: {events_to_fire / runtime:.0f} fires/sec"
+            )
+            for unsub in unsubs:
+                unsub()
+            total += runtime
+
+    return total
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -293,6 +365,44 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def filtering_state_machine(hass):
+    """Filter the entity ids of a large state machine 100 times."""
+    entities_filter = convert_include_exclude_filter(
+        {
+            "include": {
+                "domains": ["automation"],
+                "entity_globs": ["sensor.*_temperature", "binary_sensor.*_door"],
+                "entities": ["light.room_0"],
+            },
+            "exclude": {"domains": [], "entity_globs": [], "entities": []},
+        }
+    )
+    for i in range(5000):
+        hass.states.async_set(f"light.room_{i}", "on")
+        hass.states.async_set(f"sensor.room_{i}_power", "10")
+        if i % 50 == 0:
+            hass.states.async_set(f"sensor.room_{i}_temperature", "20")
+            hass.states.async_set(f"binary_sensor.room_{i}_door", "off")
+
+    start = timer()
+    for _ in range(100):
+        scanned = [
+            entity_id
+            for entity_id in hass.states.async_entity_ids()
+            if entities_filter(entity_id)
+        ]
+    print("Full scan:", timer() - start)
+
+    start = timer()
+    for _ in range(100):
+        indexed = entities_filter.async_filter_entity_ids(hass.states)
+    print("Indexed:", timer() - start)
+    assert sorted(scanned) == sorted(indexed)
+
+    return timer() - start
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
@@ -315,6 +425,219 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _recorder_states_insert(bulk_insert: bool) -> float:
+    """Write 100k state changes of 4000 entities to the states table."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+    from homeassistant.components.recorder.table_managers.states import (
+        StatesBulkBuffer,
+        StatesManager,
+    )
+
+    entities = 4000
+    state_changes = 10**5
+    commit_every = 1000
+
+    engine = create_engine(DB_URL)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        states_meta = [
+            StatesMeta(entity_id=f"sensor.bench_{i}") for i in range(entities)
+        ]
+        state_attributes = StateAttributes(shared_attrs="{}", hash=0)
+        session.add_all([*states_meta, state_attributes])
+        session.commit()
+        metadata_ids = [meta.metadata_id for meta in states_meta]
+        attributes_id = state_attributes.attributes_id
+
+    events: list[tuple[int, core.Event[core.EventStateChangedData]]] = []
+    old_states: list[core.State | None] = [None] * entities
+    for i in range(state_changes):
+        idx = i % entities
+        entity_id = f"sensor.bench_{idx}"
+        new_state = core.State(entity_id, str(i))
+        events.append(
+            (
+                idx,
+                core.Event[core.EventStateChangedData](
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_states[idx],
+                        "new_state": new_state,
+                    },
+                ),
+            )
+        )
+        old_states[idx] = new_state
+
+    states_manager = StatesManager()
+    start = timer()
+    with Session(engine) as session:
+        session.expire_on_commit = False
+        buffer = StatesBulkBuffer()
+        for count, (idx, event) in enumerate(events, 1):
+            entity_id = event.data["entity_id"]
+            if bulk_insert:
+                old_row = buffer.pop_pending(entity_id)
+                row = buffer.append(
+                    event,
+                    None,
+                    metadata_ids[idx],
+                    None,
+                    attributes_id,
+                    None,
+                    None
+                    if old_row is not None
+                    else states_manager.pop_committed(entity_id),
+                    old_row,
+                )
+                buffer.add_pending(entity_id, row)
+            else:
+                dbstate = States.from_event(event)
+                dbstate.entity_id = None
+                dbstate.metadata_id = metadata_ids[idx]
+                dbstate.attributes_id = attributes_id
+                if pending_state := states_manager.pop_pending(entity_id):
+                    dbstate.old_state = pending_state
+                else:
+                    dbstate.old_state_id = states_manager.pop_committed(entity_id)
+                states_manager.add_pending(entity_id, dbstate)
+                session.add(dbstate)
+            if count % commit_every == 0:
+                if bulk_insert:
+                    buffer.write(session)
+                session.commit()
+                states_manager.post_commit_pending()
+                buffer.post_commit_pending(states_manager)
+    runtime = timer() - start
+    engine.dispose()
+    print(f"{state_changes / runtime:.0f} rows/sec on {engine.dialect.name}")
+    return runtime
+
+
+@benchmark
+async def recorder_states_orm_insert(hass):
+    """Write 100k state changes through the ORM unit of work."""
+    return await hass.async_add_executor_job(_recorder_states_insert, False)
+
+
+@benchmark
+async def recorder_states_bulk_insert(hass):
+    """Write 100k state changes through the columnar bulk buffer."""
+    return await hass.async_add_executor_job(_recorder_states_insert, True)
+
+
+@benchmark
+async def websocket_subscribe_entities(hass):
+    """Fan out 10 seconds of 1000 state changes/sec to 50 subscribe_entities."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from homeassistant.auth.models import RefreshToken, User
+    from homeassistant.components.websocket_api import commands
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+    from homeassistant.components.websocket_api.const import DOMAIN
+    from homeassistant.components.websocket_api.http import WebSocketAdapter
+
+    connections = 50
+    entities = 1000
+    seconds = 10
+    sent = 0
+
+    @core.callback
+    def send_message(message):
+        """Count the messages sent to a connection."""
+        nonlocal sent
+        sent += 1
+
+    hass.data[DOMAIN] = {}
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    refresh_token = RefreshToken(user, None, timedelta(minutes=30))
+    for connection_id in range(connections):
+        connection = ActiveConnection(
+            WebSocketAdapter(logging.getLogger(__name__), {"connid": connection_id}),
+            hass,
+            send_message,
+            user,
+            refresh_token,
+        )
+        commands.handle_subscribe_entities(
+            hass,
+            connection,
+            {"id": 1, "type": "subscribe_entities", "drop_superseded": False},
+        )
+    sent = 0
+
+    start = timer()
+    for second in range(seconds):
+        for entity in range(entities):
+            hass.states.async_set(
+                f"sensor.benchmark_{entity}", second, {"unit_of_measurement": "W"}
+            )
+    runtime = timer() - start
+
+    assert sent == connections * entities * seconds
+    print(f"{entities * seconds / runtime:.0f} state changes/sec")
+    return runtime
+
+
+@benchmark
+async def mqtt_matching_subscriptions(hass):
+    """Match 200k messages on 50k topics against 5000 wildcard subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from functools import lru_cache
+
+    from paho.mqtt.matcher import MQTTMatcher
+
+    from homeassistant.components.mqtt.client import MATCHING_SUBSCRIPTIONS_CACHE_SIZE
+    from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+    devices = 2500
+    topics = [
+        f"zigbee2mqtt/device_{message % devices}/{message // devices}/state"
+        for message in range(50000)
+    ]
+    messages = [topics[message * 7919 % len(topics)] for message in range(200000)]
+    topic_filters = [
+        *(f"zigbee2mqtt/device_{device}/+/state" for device in range(devices)),
+        *(f"zigbee2mqtt/device_{device}/#" for device in range(devices)),
+    ]
+
+    def linear_matcher(topic_filter):
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = True
+        return lambda topic: next(matcher.iter_match(topic), False)
+
+    matchers = [linear_matcher(topic_filter) for topic_filter in topic_filters]
+    start = timer()
+    for topic in messages[:2000]:
+        linear = [matcher for matcher in matchers if matcher(topic)]
+    print(f"Linear scan: {2000 / (timer() - start):.0f} messages/sec")
+
+    trie = TopicTrie()
+    for topic_filter in topic_filters:
+        trie.add(topic_filter, topic_filter)
+    matching = lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)(trie.match)
+    start = timer()
+    for topic in messages:
+        matched = matching(topic)
+    runtime = timer() - start
+
+    assert len(linear) == len(matched) == 2
+    print(f"Topic trie: {len(messages) / runtime:.0f} messages/sec")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -1377,6 +1377,17 @@ def mock_storage(
             dump = _orjson_default_encoder
         data[store.key] = json_loads(dump(data_to_write))
 
+    async def mock_append_journal(
+        store: storage.Store, records: list[dict[str, Any]]
+    ) -> None:
+        """Mock version of append journal."""
+        _LOGGER.debug("Appending journal to %s: %s", store.key, records)
+        raise_contains_mocks(records)
+        for record in records:
+            storage._apply_journal_record(
+                data[store.key]["data"], json_loads(store._journal_dumps(record))
+            )
+
     async def mock_remove(store: storage.Store) -> None:
         """Remove data."""
         data.pop(store.key, None)
@@ -1392,6 +1403,11 @@ def mock_storage(
             side_effect=mock_write_data,
             autospec=True,
         ),
+        patch(
+            "homeassistant.helpers.storage.Store._async_append_journal",
+            side_effect=mock_append_journal,
+            autospec=True,
+        ),
         patch(
             "homeassistant.helpers.storage.Store.async_remove",
             side_effect=mock_remove,
@@ -3,7 +3,7 @@
 from datetime import timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -443,6 +443,97 @@ async def test_fetch_period_api_with_minimal_response(
     ).replace('"', "")
 
 
+async def test_history_export_api(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the history export view streams chunks of states."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+
+    for state in ("0", "50", "23"):
+        hass.states.async_set("sensor.power", state, {"attr": "any"})
+        await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.energy", "10", {"attr": "any"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    with patch("homeassistant.components.recorder.history.modern.EXPORT_CHUNK_SIZE", 2):
+        response = await client.get(
+            f"/api/history/export/{now.isoformat()}"
+            "?filter_entity_id=sensor.power,sensor.energy&no_attributes"
+        )
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == "application/x-ndjson"
+    chunks = [json.loads(line) for line in (await response.text()).splitlines()]
+    assert [
+        (chunk["entity_id"], [state["s"] for state in chunk["states"]])
+        for chunk in chunks
+    ] == [
+        ("sensor.power", ["0", "50"]),
+        ("sensor.power", ["23"]),
+        ("sensor.energy", ["10"]),
+    ]
+    assert "a" not in chunks[0]["states"][0]
+
+
+async def test_history_export_api_client_disconnect(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the history export view closes the stream when the client disconnects."""
+    closed = False
+
+    def _stream_significant_states(*args):
+        nonlocal closed
+        try:
+            yield "sensor.power", [{"s": "1"}]
+            yield "sensor.power", [{"s": "2"}]
+        finally:
+            closed = True
+
+    await async_setup_component(hass, "history", {})
+    client = await hass_client()
+    with (
+        patch(
+            "homeassistant.components.history.history.stream_significant_states",
+            _stream_significant_states,
+        ),
+        patch(
+            "homeassistant.components.history.web.StreamResponse.write",
+            side_effect=ConnectionResetError,
+        ),
+    ):
+        response = await client.get(
+            "/api/history/export/2024-01-01T00:00:00+00:00"
+            "?filter_entity_id=sensor.power"
+        )
+    assert response.status == HTTPStatus.OK
+    assert await response.read() == b""
+    assert closed
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/api/history/export/invalid?filter_entity_id=sensor.power",
+        "/api/history/export/2024-01-01T00:00:00+00:00",
+        "/api/history/export/2024-01-01T00:00:00+00:00?filter_entity_id=invalid",
+        "/api/history/export/2024-01-01T00:00:00+00:00"
+        "?filter_entity_id=sensor.power&end_time=invalid",
+    ],
+)
+async def test_history_export_api_invalid(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    path: str,
+) -> None:
+    """Test the history export view rejects invalid requests."""
+    await async_setup_component(hass, "history", {})
+    client = await hass_client()
+    response = await client.get(path)
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_fetch_period_api_with_no_timestamp(
     recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
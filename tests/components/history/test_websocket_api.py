@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -1908,3 +1909,272 @@ async def test_history_stream_historical_only_with_start_time_state_past(
         "id": 1,
         "type": "event",
     }
+
+
+@pytest.mark.parametrize(
+    ("downsample", "expected_states"),
+    [
+        ({"resolution": 60}, ["1", "3.0", "15.0"]),
+        ({"max_points": 1}, ["1", "9.0"]),
+    ],
+)
+async def test_history_during_period_downsampled(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    downsample: dict[str, Any],
+    expected_states: list[str],
+) -> None:
+    """Test history_during_period with a downsampled minimal response."""
+    # Start at a multiple of the resolution so the buckets are known
+    base = (dt_util.utcnow().timestamp() // 600 - 6) * 600
+    start_time = dt_util.utc_from_timestamp(base)
+    end_time = dt_util.utc_from_timestamp(base + 120)
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for offset, state in ((1, "1"), (2, "2"), (3, "4"), (61, "10"), (62, "20")):
+        hass.states.async_set("sensor.power", state, timestamp=base + offset)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    # The states were recorded with timestamps before the recorder run started
+    with patch(
+        "homeassistant.components.history.websocket_api.has_recorder_run_after",
+        return_value=True,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "entity_ids": ["sensor.power"],
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+                **downsample,
+            }
+        )
+        response = await client.receive_json()
+    assert response["success"]
+    assert [
+        state["s"] for state in response["result"]["sensor.power"]
+    ] == expected_states
+
+
+@pytest.mark.parametrize("command", ["history_during_period", "stream"])
+async def test_history_downsampling_requires_minimal_response(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    command: str,
+) -> None:
+    """Test downsampling is rejected if the response is not minimal."""
+    await async_setup_component(hass, "history", {})
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": f"history/{command}",
+            "start_time": dt_util.utcnow().isoformat(),
+            "entity_ids": ["sensor.power"],
+            "resolution": 60,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+@pytest.mark.parametrize("command", ["history_during_period", "stream"])
+async def test_history_downsampling_legacy_schema(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    command: str,
+) -> None:
+    """Test downsampling is rejected while the legacy schema is used."""
+    await async_setup_component(hass, "history", {})
+    client = await hass_ws_client()
+    with patch.object(recorder_mock.states_meta_manager, "active", False):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": f"history/{command}",
+                "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+                "entity_ids": ["sensor.power"],
+                "minimal_response": True,
+                "max_points": 10,
+            }
+        )
+        response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_supported"
+
+
+async def test_history_during_period_resolution_and_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test resolution and max_points can not be combined."""
+    await async_setup_component(hass, "history", {})
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": dt_util.utcnow().isoformat(),
+            "entity_ids": ["sensor.power"],
+            "resolution": 60,
+            "max_points": 100,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_history_during_period_columnar(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period with a columnar response."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    last_updated: list[float] = []
+    for state, attributes in (
+        ("on", {"any": "attr"}),
+        ("off", {"any": "attr"}),
+        ("off", {"any": "changed"}),
+        ("off", {"any": "again"}),
+        ("on", {"any": "attr"}),
+    ):
+        hass.states.async_set("sensor.test", state, attributes=attributes)
+        last_updated.append(hass.states.get("sensor.test").last_updated_timestamp)
+        await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.other", "1")
+    other_last_updated = hass.states.get("sensor.other").last_updated_timestamp
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "sensor.other"],
+            "significant_changes_only": False,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": {
+            "s": ["on", "off", "off", "off", "on"],
+            "lu": last_updated,
+            "lc": [[2, last_updated[1]], [3, last_updated[1]]],
+            "a": [
+                [0, {"any": "attr"}],
+                [2, {"any": "changed"}],
+                [3, {"any": "again"}],
+                [4, {"any": "attr"}],
+            ],
+        },
+        "sensor.other": {"s": ["1"], "lu": [other_last_updated], "a": [[0, {}]]},
+    }
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "significant_changes_only": False,
+            "minimal_response": True,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": {
+            "s": ["on", "off", "on"],
+            "lu": [last_updated[0], last_updated[1], last_updated[4]],
+            "a": [[0, {"any": "attr"}]],
+        },
+    }
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "no_attributes": True,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": {
+            "s": ["on", "off", "on"],
+            "lu": [last_updated[0], last_updated[1], last_updated[4]],
+        },
+    }
+
+
+async def test_history_stream_live_columnar(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream with a columnar response."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated_timestamp
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": now.isoformat(),
+            "significant_changes_only": False,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response["event"]["states"] == {
+        "sensor.one": {
+            "s": ["on"],
+            "lu": [sensor_one_last_updated],
+            "a": [[0, {"any": "attr"}]],
+        },
+    }
+
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    first_last_updated = hass.states.get("sensor.one").last_updated_timestamp
+    hass.states.async_set("sensor.one", "off", attributes={"diff": "attr"})
+    second_state = hass.states.get("sensor.one")
+    await async_recorder_block_till_done(hass)
+
+    response = await client.receive_json()
+    assert response["event"]["states"] == {
+        "sensor.one": {
+            "s": ["off", "off"],
+            "lu": [first_last_updated, second_state.last_updated_timestamp],
+            "lc": [[1, second_state.last_changed_timestamp]],
+            "a": [[0, {"any": "attr"}], [1, {"diff": "attr"}]],
+        },
+    }
@@ -1403,6 +1403,64 @@ async def test_logbook_entity_context_parent_id(
     assert json_dict[8]["context_user_id"] == "485cacf93ef84d25a99ced3126b921d2"
 
 
+async def test_logbook_context_started_before_period(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the logbook view links contexts started before the period."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    now = dt_util.utcnow()
+
+    context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    with freeze_time(now - timedelta(hours=2)):
+        hass.bus.async_fire(
+            EVENT_AUTOMATION_TRIGGERED,
+            {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+            context=context,
+        )
+        hass.states.async_set("light.kitchen", STATE_OFF)
+        await hass.async_block_till_done()
+
+    child_context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVDDD",
+        parent_id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    with freeze_time(now - timedelta(minutes=2)):
+        hass.states.async_set("light.kitchen", STATE_ON, context=child_context)
+        await hass.async_block_till_done()
+    with freeze_time(now - timedelta(minutes=1)):
+        hass.states.async_set("light.kitchen", STATE_OFF, context=context)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    start_time = now - timedelta(hours=1)
+    response = await client.get(f"/api/logbook/{start_time.isoformat()}")
+    assert response.status == HTTPStatus.OK
+    json_dict = await response.json()
+
+    assert len(json_dict) == 2
+    # The parent context was started by the automation
+    assert json_dict[0]["entity_id"] == "light.kitchen"
+    assert json_dict[0]["state"] == STATE_ON
+    assert json_dict[0]["context_event_type"] == EVENT_AUTOMATION_TRIGGERED
+    assert json_dict[0]["context_entity_id"] == "automation.alarm"
+    # The context was started by the automation
+    assert json_dict[1]["entity_id"] == "light.kitchen"
+    assert json_dict[1]["state"] == STATE_OFF
+    assert json_dict[1]["context_event_type"] == EVENT_AUTOMATION_TRIGGERED
+    assert json_dict[1]["context_entity_id"] == "automation.alarm"
+
+
 async def test_logbook_context_from_template(
     recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
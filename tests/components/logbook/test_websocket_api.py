@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Callable
 from datetime import timedelta
+from math import inf
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
@@ -26,12 +27,13 @@ from homeassistant.const import (
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
     STATE_OFF,
     STATE_ON,
 )
-from homeassistant.core import Event, HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, ServiceCall, State
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.setup import async_setup_component
@@ -296,6 +298,131 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_from_buffer(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events serves recent events from the buffer."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    logbook_config: logbook.LogbookConfig = hass.data[logbook.DOMAIN]
+    assert logbook_config.buffer is not None
+    logbook_config.buffer.max_entries = 3
+
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+        hass.states.async_set("light.kitchen", state)
+        await hass.async_block_till_done()
+    hass.states.async_set("sensor.power", "1", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    hass.states.async_set("sensor.power", "2", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    await async_wait_recording_done(hass)
+    # The first state change has been evicted from the buffer
+    last_event_time = hass.states.get("light.kitchen").last_updated - timedelta(
+        microseconds=1
+    )
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.logbook.processor.statement_for_request",
+        wraps=logbook.processor.statement_for_request,
+    ) as statement_for_request:
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.kitchen"],
+            }
+        )
+        response = await client.receive_json()
+        assert len(statement_for_request.mock_calls) == 1
+        assert [row["state"] for row in response["result"]] == [
+            STATE_ON,
+            STATE_OFF,
+            STATE_ON,
+            STATE_OFF,
+        ]
+
+        statement_for_request.reset_mock()
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "logbook/get_events",
+                "start_time": last_event_time.isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert len(statement_for_request.mock_calls) == 0
+        assert [row["state"] for row in response["result"]] == [STATE_OFF]
+
+
+async def test_get_events_from_buffer_matches_database(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test rows from the buffer are the same as rows from the database."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    now = dt_util.utcnow()
+
+    async def _turn_on(call: ServiceCall) -> None:
+        hass.states.async_set("light.kitchen", STATE_ON, context=call.context)
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.services.async_register("test", "turn_on", _turn_on)
+    await hass.services.async_call("test", "turn_on", blocking=True)
+    await async_wait_recording_done(hass)
+
+    logbook_config: logbook.LogbookConfig = hass.data[logbook.DOMAIN]
+    assert logbook_config.buffer is not None
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.logbook.processor.statement_for_request",
+        wraps=logbook.processor.statement_for_request,
+    ) as statement_for_request:
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.kitchen"],
+            }
+        )
+        buffer_response = await client.receive_json()
+        assert len(statement_for_request.mock_calls) == 0
+
+        logbook_config.buffer.covered_after = inf
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.kitchen"],
+            }
+        )
+        database_response = await client.receive_json()
+        assert len(statement_for_request.mock_calls) == 1
+
+    assert buffer_response["result"] == database_response["result"]
+    assert [
+        (
+            row["state"],
+            row.get("context_event_type"),
+            row.get("context_domain"),
+            row.get("context_service"),
+        )
+        for row in buffer_response["result"]
+    ] == [(STATE_ON, EVENT_CALL_SERVICE, "test", "turn_on")]
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
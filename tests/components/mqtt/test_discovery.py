@@ -3,6 +3,7 @@
 import asyncio
 import copy
 import json
+import logging
 from pathlib import Path
 import re
 from unittest.mock import AsyncMock, call, patch
@@ -15,7 +16,11 @@ from homeassistant.components.mqtt.abbreviations import (
     ABBREVIATIONS,
     DEVICE_ABBREVIATIONS,
 )
-from homeassistant.components.mqtt.discovery import async_start
+from homeassistant.components.mqtt.discovery import (
+    MQTT_DISCOVERY_NEW,
+    MQTTDiscoveryPayload,
+    async_start,
+)
 from homeassistant.const import (
     EVENT_STATE_CHANGED,
     STATE_ON,
@@ -26,6 +31,7 @@ from homeassistant.const import (
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
 
@@ -210,6 +216,87 @@ async def test_correct_config_discovery(
     assert ("binary_sensor", "bla") in hass.data["mqtt"].discovery_already_discovered
 
 
+async def test_discovery_batches_new_components(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test discovery messages received together are added in one batch."""
+    await mqtt_mock_entry()
+    batches: list[list[str]] = []
+
+    @callback
+    def _discovery_new(payloads: list[MQTTDiscoveryPayload]) -> None:
+        batches.append([payload["name"] for payload in payloads])
+
+    async_dispatcher_connect(
+        hass, MQTT_DISCOVERY_NEW.format("binary_sensor", "mqtt"), _discovery_new
+    )
+    for name in ("Beer", "Milk", "Wine"):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/binary_sensor/{name.lower()}/config",
+            json.dumps({"name": name, "state_topic": "test-topic"}),
+        )
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/water/config",
+        '{ "name": "Water", "state_topic": "test-topic", "device_class": "bad" }',
+    )
+    await hass.async_block_till_done()
+
+    assert batches == [["Beer", "Milk", "Wine", "Water"]]
+    assert hass.states.get("binary_sensor.beer") is not None
+    assert hass.states.get("binary_sensor.milk") is not None
+    assert hass.states.get("binary_sensor.wine") is not None
+    # An invalid config does not affect the others of the batch
+    assert hass.states.get("binary_sensor.water") is None
+    assert ("binary_sensor", "water") not in hass.data[
+        "mqtt"
+    ].discovery_already_discovered
+    assert "Error 'expected BinarySensorDeviceClass" in caplog.text
+
+
+async def test_discovery_ignores_unchanged_payload(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a discovery payload which was already processed is ignored."""
+    await mqtt_mock_entry()
+    caplog.set_level(logging.DEBUG)
+    payload = '{ "name": "Beer", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+    caplog.clear()
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert "Ignoring unchanged discovery payload for binary_sensor bla" in caplog.text
+    assert "Got update for entity with hash" not in caplog.text
+
+    caplog.clear()
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert "Ignoring unchanged discovery payload" not in caplog.text
+    state = hass.states.get("binary_sensor.beer")
+    assert state is not None
+    assert state.name == "Milk"
+
+    # Once removed, the same payload is discovered again
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is None
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+
 async def test_discovery_integration_info(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -426,6 +426,40 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+async def test_value_template_parses_payload_once(hass: HomeAssistant) -> None:
+    """Test templates rendering the same payload share the parsed JSON."""
+    mqtt.models._json_loads_payload.cache_clear()
+    payload = '{"temperature": 21.5, "humidity": 48}'
+    temperature_tpl = mqtt.MqttValueTemplate(
+        template.Template("{{ value_json.temperature }}"), hass=hass
+    )
+    humidity_tpl = mqtt.MqttValueTemplate(
+        template.Template("{{ value_json.humidity }}"), hass=hass
+    )
+    with (
+        patch(
+            "homeassistant.components.mqtt.models.json_loads",
+            wraps=mqtt.models.json_loads,
+        ) as json_loads_mock,
+        patch(
+            "homeassistant.helpers.template.json_loads",
+            wraps=template.json_loads,
+        ) as template_json_loads_mock,
+    ):
+        assert temperature_tpl.async_render_with_possible_json_value(payload) == "21.5"
+        assert humidity_tpl.async_render_with_possible_json_value(payload) == "48"
+        # An invalid payload is only parsed once as well
+        for tpl in (temperature_tpl, humidity_tpl):
+            assert (
+                tpl.async_render_with_possible_json_value("invalid", "default")
+                == "default"
+            )
+    assert json_loads_mock.call_count == 2
+    assert template_json_loads_mock.call_count == 0
+    with pytest.raises(ValueError):
+        mqtt.models.json_loads_payload("invalid")
+
+
 async def test_value_template_fails(hass: HomeAssistant) -> None:
     """Test the rendering of MQTT value template fails."""
     entity = MockEntity(entity_id="sensor.test")
@@ -984,6 +1018,27 @@ async def test_subscribe_topic(
         unsub()
 
 
+async def test_subscribe_decodes_payload_once(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test subscriptions with the same encoding share the decoded payload."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "+", record_calls, encoding=None)
+
+    async_fire_mqtt_message(hass, "test-topic", "test-payload")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 3
+    assert calls[0].payload == "test-payload"
+    assert calls[0].payload is calls[1].payload
+    assert calls[2].payload == b"test-payload"
+
+
 async def test_subscribe_topic_not_initialize(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
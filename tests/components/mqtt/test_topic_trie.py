@@ -0,0 +1,81 @@
+"""Test the MQTT topic trie."""
+
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("sport/tennis/player1", "sport/tennis/player1", True),
+        ("sport/tennis/player1", "sport/tennis/player2", False),
+        ("sport/tennis/+", "sport/tennis/player1", True),
+        ("sport/tennis/+", "sport/tennis/player1/ranking", False),
+        ("sport/tennis/+", "sport/tennis", False),
+        ("sport/+/player1", "sport/tennis/player1", True),
+        ("+/+", "/finance", True),
+        ("+", "/finance", False),
+        ("sport/#", "sport", True),
+        ("sport/#", "sport/tennis/player1/ranking", True),
+        ("sport/tennis/#", "sport/golf/player1", False),
+        ("#", "sport/tennis", True),
+        ("#", "$SYS/broker/uptime", False),
+        ("+/broker/uptime", "$SYS/broker/uptime", False),
+        ("$SYS/#", "$SYS/broker/uptime", True),
+        ("$SYS/+/uptime", "$SYS/broker/uptime", True),
+    ],
+)
+def test_match(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics against a topic filter."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add(topic_filter, "value")
+    assert trie.match(topic) == (["value"] if matches else [])
+
+
+def test_match_order() -> None:
+    """Test matching values are returned in the order they were added."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("home/+/state", "first")
+    trie.add("home/#", "second")
+    trie.add("home/kitchen/state", "third")
+    trie.add("home/+/state", "fourth")
+    trie.add("home/+/+", "fifth")
+
+    assert trie.match("home/kitchen/state") == [
+        "first",
+        "second",
+        "third",
+        "fourth",
+        "fifth",
+    ]
+    assert trie.match("home/hallway/state") == ["first", "second", "fourth", "fifth"]
+    assert trie.values() == ["first", "second", "third", "fourth", "fifth"]
+
+
+def test_add_remove() -> None:
+    """Test adding and removing values."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("home/+/state", "light")
+    trie.add("home/+/state", "light")
+    trie.add("home/+/state", "switch")
+    trie.add("home/#", "all")
+    assert len(trie) == 3
+    assert "home/+/state" in trie
+    assert "home/+" not in trie
+    assert "office/#" not in trie
+
+    trie.remove("home/+/state", "light")
+    assert trie.match("home/kitchen/state") == ["switch", "all"]
+    with pytest.raises(KeyError):
+        trie.remove("home/+/state", "light")
+    with pytest.raises(KeyError):
+        trie.remove("office/+/state", "light")
+
+    trie.remove("home/+/state", "switch")
+    assert "home/+/state" not in trie
+    trie.remove("home/#", "all")
+    assert len(trie) == 0
+    assert trie.match("home/kitchen/state") == []
+    # Levels which no longer lead to a value are pruned
+    assert not trie._root.children
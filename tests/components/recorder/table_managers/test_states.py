@@ -0,0 +1,87 @@
+"""Test the states table manager and bulk buffer."""
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import (
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+
+def _recorded_states(hass: HomeAssistant) -> list[tuple]:
+    """Return the recorded states with their old state and attributes."""
+    with session_scope(hass=hass, read_only=True) as session:
+        state_id_to_state = {}
+        rows = []
+        for db_state, db_state_attributes, states_meta in (
+            session.query(States, StateAttributes, StatesMeta)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.last_updated_ts)
+        ):
+            state_id_to_state[db_state.state_id] = db_state.state
+            rows.append(
+                (
+                    states_meta.entity_id,
+                    db_state.state,
+                    db_state_attributes.to_native() if db_state_attributes else None,
+                    db_state.old_state_id,
+                )
+            )
+        return [
+            (entity_id, state, attrs, state_id_to_state.get(old_state_id))
+            for entity_id, state, attrs, old_state_id in rows
+        ]
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [
+        {"commit_interval": 3600, "bulk_insert": False},
+        {"commit_interval": 3600, "bulk_insert": True},
+    ],
+)
+async def test_bulk_insert_matches_orm_path(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the bulk insert path links old states like the ORM path."""
+    assert (recorder_mock.states_bulk_buffer is not None) is recorder_mock.bulk_insert
+
+    # Several changes of the same entity in one commit
+    hass.states.async_set("sensor.power", "1", {"unit": "W"})
+    hass.states.async_set("sensor.power", "2", {"unit": "W"})
+    hass.states.async_set("sensor.power", "3", {"unit": "kW"})
+    hass.states.async_set("sensor.energy", "10", {"unit": "kWh"})
+    await async_wait_recording_done(hass)
+
+    # The next commit links to the committed states
+    hass.states.async_set("sensor.power", "4", {"unit": "kW"})
+    hass.states.async_set("sensor.energy", "11", {"unit": "kWh"})
+    hass.states.async_remove("sensor.energy")
+    hass.states.async_set("sensor.energy", "12", {"unit": "kWh"})
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("sensor.power", "5", {"unit": "kW"})
+    await async_wait_recording_done(hass)
+
+    assert _recorded_states(hass) == [
+        ("sensor.power", "1", {"unit": "W"}, None),
+        ("sensor.power", "2", {"unit": "W"}, "1"),
+        ("sensor.power", "3", {"unit": "kW"}, "2"),
+        ("sensor.energy", "10", {"unit": "kWh"}, None),
+        ("sensor.power", "4", {"unit": "kW"}, "3"),
+        ("sensor.energy", "11", {"unit": "kWh"}, "10"),
+        ("sensor.energy", None, {}, "11"),
+        ("sensor.energy", "12", {"unit": "kWh"}, None),
+        ("sensor.power", "5", {"unit": "kW"}, "4"),
+    ]
+    if recorder_mock.states_bulk_buffer is not None:
+        assert len(recorder_mock.states_bulk_buffer) == 0
@@ -0,0 +1,92 @@
+"""Test the recorder adaptive commit interval."""
+
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.commit import AdaptiveCommitInterval
+from homeassistant.components.recorder.const import (
+    ADAPTIVE_COMMIT_BURST_BACKLOG,
+    ADAPTIVE_COMMIT_MAX_INTERVAL,
+    ADAPTIVE_COMMIT_MIN_INTERVAL,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.common import async_fire_time_changed
+
+
+def test_interval_follows_backlog() -> None:
+    """Test the interval grows under burst load and shrinks when idle."""
+    adaptive = AdaptiveCommitInterval(5)
+    assert adaptive.interval == 5
+
+    assert adaptive.next_interval(0) == 2.5
+    assert adaptive.next_interval(0) == 1.25
+    assert adaptive.next_interval(0) == ADAPTIVE_COMMIT_MIN_INTERVAL
+
+    assert adaptive.next_interval(ADAPTIVE_COMMIT_BURST_BACKLOG) == 2
+    assert adaptive.next_interval(ADAPTIVE_COMMIT_BURST_BACKLOG) == 4
+    # Moderate load keeps the interval
+    assert adaptive.next_interval(ADAPTIVE_COMMIT_BURST_BACKLOG - 1) == 4
+    for _ in range(10):
+        adaptive.next_interval(ADAPTIVE_COMMIT_BURST_BACKLOG * 10)
+    assert adaptive.interval == ADAPTIVE_COMMIT_MAX_INTERVAL
+
+
+def test_interval_follows_commit_latency() -> None:
+    """Test a slow commit keeps the interval from shrinking."""
+    adaptive = AdaptiveCommitInterval(1)
+    adaptive.pending_rows = 100
+    adaptive.record_commit(2.0)
+    assert adaptive.next_interval(0) == 8
+    assert adaptive.as_dict() == {
+        "effective_commit_interval": 8,
+        "last_commit_batch_size": 100,
+        "average_commit_batch_size": 100,
+        "max_commit_batch_size": 100,
+        "average_commit_time": 2000,
+    }
+
+    adaptive.pending_rows = 50
+    adaptive.record_commit(0.0)
+    assert adaptive.pending_rows == 0
+    assert adaptive.as_dict() == {
+        "effective_commit_interval": 8,
+        "last_commit_batch_size": 50,
+        "average_commit_batch_size": 90,
+        "max_commit_batch_size": 100,
+        "average_commit_time": 1600,
+    }
+    assert adaptive.next_interval(0) == 6.4
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"commit_interval": 5, "adaptive_commit": True}]
+)
+async def test_adaptive_commit_schedules_commits(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the recorder commits on the adaptive schedule."""
+    adaptive = recorder_mock.adaptive_commit
+    assert adaptive is not None
+    await async_wait_recording_done(hass)
+    commits = adaptive.commits
+
+    hass.states.async_set("sensor.test", "1")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(recorder_mock.block_till_done)
+    assert adaptive.pending_rows == 1
+    assert adaptive.commits == commits
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=ADAPTIVE_COMMIT_MAX_INTERVAL)
+    )
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(recorder_mock.block_till_done)
+    assert adaptive.pending_rows == 0
+    assert adaptive.commits == commits + 1
+    assert adaptive.last_batch_size == 1
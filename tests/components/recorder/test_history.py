@@ -801,6 +801,160 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+@pytest.mark.parametrize("compressed_state_format", [False, True])
+async def test_get_significant_states_minimal_response_resolution(
+    recorder_mock: Recorder, hass: HomeAssistant, compressed_state_format: bool
+) -> None:
+    """Test minimal responses are downsampled to the resolution."""
+    # Start at a multiple of the resolution so the buckets are known
+    base = (dt_util.utcnow().timestamp() // 600 - 6) * 600
+    await async_recorder_block_till_done(hass)
+    for offset, state in (
+        (1, "1"),
+        (2, "2"),
+        (3, "3"),
+        (4, "4"),
+        (5, "5"),
+        (10, "unavailable"),
+        (61, "10"),
+        (62, "20"),
+        (130, "7"),
+    ):
+        hass.states.async_set("sensor.power", state, timestamp=base + offset)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        dt_util.utc_from_timestamp(base),
+        entity_ids=["sensor.power"],
+        significant_changes_only=False,
+        minimal_response=True,
+        no_attributes=True,
+        compressed_state_format=compressed_state_format,
+        resolution=60,
+    )
+
+    if compressed_state_format:
+        state_key, time_key = "s", "lu"
+
+        def _time(offset: float) -> float | str:
+            return base + offset
+    else:
+        state_key, time_key = "state", "last_changed"
+
+        def _time(offset: float) -> float | str:
+            return dt_util.utc_from_timestamp(base + offset).isoformat()
+
+    # The first state is a full state and is not downsampled
+    assert len(hist["sensor.power"]) == 5
+    assert hist["sensor.power"][1:] == [
+        {state_key: "3.5", time_key: _time(2), "min": 2.0, "max": 5.0, "last": 5.0},
+        {state_key: "unavailable", time_key: _time(10)},
+        {
+            state_key: "15.0",
+            time_key: _time(61),
+            "min": 10.0,
+            "max": 20.0,
+            "last": 20.0,
+        },
+        {state_key: "7", time_key: _time(130)},
+    ]
+
+
+async def test_stream_significant_states(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test streaming significant states matches get_significant_states."""
+    now = dt_util.utcnow()
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3", "4", "5"):
+        hass.states.async_set("sensor.power", state, {"unit": "W"})
+        hass.states.async_set("sensor.energy", state, {"unit": "kWh"})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    entity_ids = ["sensor.power", "sensor.energy", "sensor.missing"]
+    expected = history.get_significant_states(
+        hass, now, entity_ids=entity_ids, compressed_state_format=True
+    )
+    with patch.object(history.modern, "EXPORT_CHUNK_SIZE", 2):
+        chunks = list(history.stream_significant_states(hass, now, None, entity_ids))
+
+    assert [(entity_id, len(states)) for entity_id, states in chunks] == [
+        ("sensor.power", 2),
+        ("sensor.power", 2),
+        ("sensor.power", 1),
+        ("sensor.energy", 2),
+        ("sensor.energy", 2),
+        ("sensor.energy", 1),
+    ]
+    streamed: dict[str, list[dict]] = {}
+    for entity_id, states in chunks:
+        streamed.setdefault(entity_id, []).extend(states)
+    assert streamed == expected
+
+
+async def test_stream_significant_states_with_start_time_state(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test streaming pages through the states after the start time state."""
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "0")
+    await async_wait_recording_done(hass)
+    now = dt_util.utcnow()
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.power", state)
+        await async_wait_recording_done(hass)
+
+    entity_ids = ["sensor.power"]
+    expected = history.get_significant_states(
+        hass, now, entity_ids=entity_ids, compressed_state_format=True
+    )
+    with patch.object(history.modern, "EXPORT_CHUNK_SIZE", 1):
+        chunks = list(history.stream_significant_states(hass, now, None, entity_ids))
+
+    assert [states for _, states in chunks] == [
+        [state] for state in expected["sensor.power"]
+    ]
+    assert [state["s"] for _, states in chunks for state in states] == [
+        "0",
+        "1",
+        "2",
+        "3",
+    ]
+
+
+async def test_stream_significant_states_same_last_updated(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test streaming keeps states sharing a last_updated across pages."""
+    now = dt_util.utcnow()
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now + timedelta(seconds=1)):
+        for state in ("1", "2", "3", "4", "5"):
+            hass.states.async_set("sensor.power", state)
+        await async_wait_recording_done(hass)
+
+    entity_ids = ["sensor.power"]
+    expected = history.get_significant_states(
+        hass, now, entity_ids=entity_ids, compressed_state_format=True
+    )
+    with patch.object(history.modern, "EXPORT_CHUNK_SIZE", 2):
+        chunks = list(history.stream_significant_states(hass, now, None, entity_ids))
+
+    assert [len(states) for _, states in chunks] == [2, 2, 1]
+    assert [state["s"] for _, states in chunks for state in states] == [
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+    ]
+    assert [state for _, states in chunks for state in states] == expected[
+        "sensor.power"
+    ]
+
+
 def record_states(hass) -> tuple[datetime, datetime, dict[str, list[State]]]:
     """Record some test states.
 
@@ -13,6 +13,8 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import update
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -23,6 +25,9 @@ from homeassistant.components.recorder import (
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
+    CONF_READ_DB_URL,
+    CONF_READ_POOL,
+    CONF_READ_POOL_SIZE,
     CONFIG_SCHEMA,
     DOMAIN,
     SQLITE_URL_PREFIX,
@@ -2580,3 +2585,90 @@ def test_all_tables_use_default_table_args(hass: HomeAssistant) -> None:
     """Test that all tables use the default table args."""
     for table in db_schema.Base.metadata.tables.values():
         assert table.kwargs.items() >= db_schema._DEFAULT_TABLE_ARGS.items()
+
+
+@pytest.mark.parametrize("use_read_db_url", [False, True])
+async def test_read_pool(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+    use_read_db_url: bool,
+) -> None:
+    """Test read only sessions use the read pool once the database is ready."""
+    if recorder_db_url == "sqlite://":
+        # The read pool needs an on-disk database
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    config = {
+        CONF_DB_URL: recorder_db_url,
+        CONF_COMMIT_INTERVAL: 0,
+        CONF_READ_POOL_SIZE: 2,
+    }
+    if use_read_db_url:
+        # A replica is simulated with the same database
+        config[CONF_READ_DB_URL] = recorder_db_url
+    else:
+        config[CONF_READ_POOL] = True
+    instance = await async_setup_recorder_instance(hass, config)
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+
+    read_engine = instance.read_engine
+    assert read_engine is not None
+    assert isinstance(read_engine.pool, pool.RecorderReadPool)
+    assert read_engine.pool.size() == 2
+
+    def _read_states() -> int:
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.get_bind() is read_engine
+            return session.query(States).count()
+
+    def _write_states() -> None:
+        session = instance.get_read_session()
+        try:
+            session.execute(update(States).values(state="2"))
+        finally:
+            session.close()
+
+    def _recorder_thread_session_bind() -> Engine:
+        session = instance.get_read_session()
+        try:
+            return session.get_bind()
+        finally:
+            session.close()
+
+    assert await instance.async_add_executor_job(_read_states) == 1
+    assert read_engine.pool.checkouts >= 1
+    with pytest.raises(SQLAlchemyError):
+        await instance.async_add_executor_job(_write_states)
+
+    # The recorder thread must see its own writes
+    with patch.object(instance, "thread_id", threading.get_ident()):
+        assert _recorder_thread_session_bind() is instance.engine
+
+    await hass.async_stop()
+    assert instance.read_engine is None
+
+
+async def test_read_pool_in_memory_database(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the read pool is not used with an in-memory SQLite database."""
+    if recorder_db_url != "sqlite://":
+        # This test is specific for in-memory SQLite
+        return
+
+    instance = await async_setup_recorder_instance(hass, {CONF_READ_POOL: True})
+    await async_wait_recording_done(hass)
+
+    assert "The read pool is not supported with in-memory SQLite" in caplog.text
+    assert instance.read_engine is None
+
+    def _read_session_bind() -> Engine:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.get_bind()
+
+    assert await instance.async_add_executor_job(_read_session_bind) is instance.engine
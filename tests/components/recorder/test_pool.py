@@ -1,13 +1,16 @@
 """Test pool."""
 
+from pathlib import Path
 import threading
+from unittest.mock import ANY
 
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker
 
 from homeassistant.components.recorder.const import DB_WORKER_PREFIX
-from homeassistant.components.recorder.pool import RecorderPool
+from homeassistant.components.recorder.pool import RecorderPool, RecorderReadPool
 
 
 async def test_recorder_pool_called_from_event_loop() -> None:
@@ -65,3 +68,44 @@ def test_recorder_pool(caplog: pytest.LogCaptureFixture) -> None:
     new_thread.join()
     assert "accesses the database without the database executor" not in caplog.text
     assert connections[6] != connections[7]
+
+
+async def test_recorder_read_pool_called_from_event_loop(tmp_path: Path) -> None:
+    """Test we raise an exception when calling the read pool from the event loop."""
+    engine = create_engine(
+        "sqlite:///" + str(tmp_path / "pool.db"), poolclass=RecorderReadPool
+    )
+    with pytest.raises(RuntimeError):
+        sessionmaker(bind=engine)().connection()
+
+
+def test_recorder_read_pool(tmp_path: Path) -> None:
+    """Test RecorderReadPool is bounded and tracks its usage."""
+    engine = create_engine(
+        "sqlite:///" + str(tmp_path / "pool.db"),
+        poolclass=RecorderReadPool,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=0.1,
+        connect_args={"check_same_thread": False},
+    )
+    pool = engine.pool
+    assert isinstance(pool, RecorderReadPool)
+    first = engine.connect()
+    second = engine.connect()
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    first.close()
+    engine.connect().close()
+
+    assert pool.as_dict() == {
+        "read_pool_size": 2,
+        "read_pool_checked_out": 1,
+        "read_pool_max_checked_out": 2,
+        "read_pool_checkouts": 3,
+        "read_pool_waits": 1,
+        "read_pool_wait_time": ANY,
+    }
+    assert pool.wait_time >= 0.1
+    second.close()
+    engine.dispose()
@@ -5,11 +5,15 @@ from datetime import timedelta
 from unittest.mock import patch
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -31,6 +35,10 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.tasks import (
+    AdjustStatisticsTask,
+    StatisticsRollupMigrationTask,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant, callback
@@ -2480,3 +2488,174 @@ def test_change_with_none(
         types={"change"},
     )
     assert stats == {}
+
+
+def _assert_statistics_equal(
+    stats: dict[str, list[dict]], expected: dict[str, list[dict]]
+) -> None:
+    """Assert statistics are equal, allowing for rounding of floats."""
+    assert stats == {
+        statistic_id: [
+            {
+                key: pytest.approx(value) if isinstance(value, float) else value
+                for key, value in row.items()
+            }
+            for row in rows
+        ]
+        for statistic_id, rows in expected.items()
+    }
+
+
+def _wait_statistics_rollups_active(hass: HomeAssistant) -> None:
+    """Wait for the statistics rollup migration tasks to compile all months."""
+    instance = recorder.get_instance(hass)
+    for _ in range(10):
+        wait_recording_done(hass)
+        if instance.statistics_rollups_active:
+            return
+    pytest.fail("Statistics rollups were not compiled")
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-11-05 00:00:00+00:00")
+def test_statistics_rollups(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+    timezone,
+) -> None:
+    """Test daily and monthly statistics are read from the rollups."""
+    hass = hass_recorder(timezone=timezone)
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.statistics_rollups_active
+
+    # Hourly statistics spanning a daylight saving time change and three months
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-09-29 00:00:00"))
+    hours = int((dt_util.utcnow() - start).total_seconds() // 3600) - 1
+    mean_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": (hour % 7) * 1.5,
+            "min": hour % 7 - 1.0,
+            "max": hour % 7 + 1.0,
+        }
+        for hour in range(hours)
+    ]
+    sum_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "state": float(hour % 50),
+            "sum": hour * 0.25,
+        }
+        for hour in range(hours)
+    ]
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": "Temperature",
+            "source": "test",
+            "statistic_id": "test:temperature",
+            "unit_of_measurement": "°C",
+        },
+        mean_statistics,
+    )
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": "Total imported energy",
+            "source": "test",
+            "statistic_id": "test:total_energy_import",
+            "unit_of_measurement": "kWh",
+        },
+        sum_statistics,
+    )
+    wait_recording_done(hass)
+
+    types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
+
+    def _statistics_during_period(period, **kwargs):
+        return statistics_during_period(
+            hass, start, period=period, types=types, **kwargs
+        )
+
+    def _reduced_statistics_during_period(period, **kwargs):
+        with patch.object(instance, "statistics_rollups_active", False):
+            return _statistics_during_period(period, **kwargs)
+
+    for period, table in (("day", StatisticsDaily), ("month", StatisticsMonthly)):
+        stats = _statistics_during_period(period)
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.query(table).count() == 2 * len(stats["test:temperature"])
+        _assert_statistics_equal(stats, _reduced_statistics_during_period(period))
+        kwargs = {
+            "end_time": start + timedelta(days=33, hours=5),
+            "statistic_ids": {"test:total_energy_import"},
+            "units": {"energy": "Wh"},
+        }
+        _assert_statistics_equal(
+            _statistics_during_period(period, **kwargs),
+            _reduced_statistics_during_period(period, **kwargs),
+        )
+
+    # The monthly rollups are compiled from the daily rollups, weighting
+    # the daily means by the number of hourly means
+    with session_scope(hass=hass, read_only=True) as session:
+        for table in (StatisticsDaily, StatisticsMonthly):
+            assert session.query(func.sum(table.hours)).scalar() == hours
+
+    # Adjusting the sum compiles the rollup of the period again and adjusts
+    # the rollups of later periods
+    instance.queue_task(
+        AdjustStatisticsTask(
+            "test:total_energy_import",
+            start + timedelta(days=20, hours=5),
+            100.0,
+            "kWh",
+        )
+    )
+    wait_recording_done(hass)
+    for period in ("day", "month"):
+        _assert_statistics_equal(
+            _statistics_during_period(period),
+            _reduced_statistics_during_period(period),
+        )
+
+    # The rollups are compiled again when they are missing
+    expected = {
+        period: _statistics_during_period(period) for period in ("day", "month")
+    }
+    with session_scope(hass=hass) as session:
+        session.query(StatisticsDaily).delete()
+        session.query(StatisticsMonthly).delete()
+    instance.statistics_rollups_active = False
+    instance.queue_task(StatisticsRollupMigrationTask())
+    _wait_statistics_rollups_active(hass)
+    for period in ("day", "month"):
+        assert _statistics_during_period(period) == expected[period]
+
+    # The rollups are compiled again when the time zone changes
+    hass.config.set_time_zone("Asia/Kolkata")
+    caplog.clear()
+    for period in ("day", "month"):
+        with patch.object(instance, "queue_task") as queue_task:
+            instance.statistics_rollups_active = True
+            stats = _statistics_during_period(period)
+            assert not instance.statistics_rollups_active
+            assert isinstance(
+                queue_task.mock_calls[0].args[0], StatisticsRollupMigrationTask
+            )
+        assert stats == _reduced_statistics_during_period(period)
+    assert "Time zone changed, compiling statistics rollups again" in caplog.text
+
+    instance.queue_task(StatisticsRollupMigrationTask())
+    _wait_statistics_rollups_active(hass)
+    for period in ("day", "month"):
+        _assert_statistics_equal(
+            _statistics_during_period(period),
+            _reduced_statistics_during_period(period),
+        )
@@ -1,5 +1,6 @@
 """Test recorder system health."""
 
+from pathlib import Path
 from unittest.mock import ANY, Mock, patch
 
 import pytest
@@ -124,3 +125,71 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
     }
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"commit_interval": 5, "adaptive_commit": True}]
+)
+async def test_recorder_system_health_adaptive_commit(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health with adaptive commits."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # This test is specific for SQLite
+        return
+
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.test", "1")
+    hass.states.async_set("sensor.test", "2")
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info == {
+        "current_recorder_run": ANY,
+        "oldest_recorder_run": ANY,
+        "estimated_db_size": ANY,
+        "database_engine": SupportedDialect.SQLITE.value,
+        "database_version": ANY,
+        "effective_commit_interval": ANY,
+        "last_commit_batch_size": ANY,
+        "average_commit_batch_size": ANY,
+        "max_commit_batch_size": ANY,
+        "average_commit_time": ANY,
+    }
+    assert 1 <= info["effective_commit_interval"] <= 30
+    assert info["max_commit_batch_size"] >= 2
+
+
+async def test_recorder_system_health_read_pool(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test recorder system health with a read pool."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # This test is specific for SQLite
+        return
+
+    assert await async_setup_component(hass, "system_health", {})
+    await async_setup_recorder_instance(
+        hass,
+        {
+            "db_url": "sqlite:///" + str(tmp_path / "pytest.db"),
+            "read_pool": True,
+        },
+    )
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info == {
+        "current_recorder_run": ANY,
+        "oldest_recorder_run": ANY,
+        "estimated_db_size": ANY,
+        "database_engine": SupportedDialect.SQLITE.value,
+        "database_version": ANY,
+        "read_pool_size": 4,
+        "read_pool_checked_out": 0,
+        "read_pool_max_checked_out": ANY,
+        "read_pool_checkouts": ANY,
+        "read_pool_waits": 0,
+        "read_pool_wait_time": 0.0,
+    }
@@ -0,0 +1,220 @@
+"""Test the NumPy engine for compiling sensor statistics."""
+
+from datetime import datetime, timedelta
+import random
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.util import get_instance, session_scope
+from homeassistant.components.sensor import recorder, recorder_numpy
+from homeassistant.core import HomeAssistant, State
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.components.recorder.common import (
+    async_wait_recording_done,
+    do_adhoc_statistics,
+)
+
+MEASUREMENT_ATTRIBUTES = {"state_class": "measurement", "unit_of_measurement": "W"}
+TOTAL_INCREASING_ATTRIBUTES = {
+    "device_class": "energy",
+    "state_class": "total_increasing",
+    "unit_of_measurement": "kWh",
+}
+TOTAL_ATTRIBUTES = {
+    "device_class": "energy",
+    "state_class": "total",
+    "unit_of_measurement": "kWh",
+}
+
+
+def _float_states(
+    start: datetime, offsets: list[float], values: list[float]
+) -> list[tuple[float, State]]:
+    """Return float states at offsets in seconds from start."""
+    return [
+        (
+            value,
+            State(
+                "sensor.test",
+                str(value),
+                last_updated=start + timedelta(seconds=offset),
+            ),
+        )
+        for offset, value in zip(offsets, values, strict=True)
+    ]
+
+
+def test_time_weighted_mean_min_max_parity() -> None:
+    """Test the NumPy engine matches the Python implementation."""
+    rnd = random.Random(42)
+    start = dt_util.utc_from_timestamp(1700000000)
+    end = start + timedelta(minutes=5)
+    groups = [
+        # A single state before the period
+        _float_states(start, [-10], [5.0]),
+        # A single state at the end of the period
+        _float_states(start, [300], [5.0]),
+        # Several states before the period
+        _float_states(start, [-20, -10, 30, 150], [1.0, 2.0, 3.0, -4.0]),
+        # No state before the period
+        _float_states(start, [0.5, 20.25, 299.999999], [10.0, 20.0, 30.0]),
+    ]
+    for _ in range(50):
+        count = rnd.randint(1, 30)
+        groups.append(
+            _float_states(
+                start,
+                sorted(round(rnd.uniform(-60, 300), 6) for _ in range(count)),
+                [rnd.uniform(-1000, 1000) for _ in range(count)],
+            )
+        )
+
+    result = recorder_numpy.time_weighted_mean_min_max(groups, start, end)
+
+    assert result == [
+        pytest.approx(
+            (
+                recorder._time_weighted_average(group, start, end),
+                min(fstate for fstate, _ in group),
+                max(fstate for fstate, _ in group),
+            )
+        )
+        for group in groups
+    ]
+    assert recorder_numpy.time_weighted_mean_min_max([], start, end) == []
+
+
+def test_total_increasing_sums() -> None:
+    """Test the growth of total_increasing sums."""
+    start = dt_util.utc_from_timestamp(1700000000)
+    groups = [
+        _float_states(start, [10, 20], [12.0, 15.0]),
+        # New cycles when the state drops below 90%
+        _float_states(start, [10, 20, 30, 40], [12.0, 2.0, 5.0, 1.0]),
+        # Dips above 90% are not new cycles
+        _float_states(start, [10, 20, 30], [9.5, 12.0, 11.5]),
+        # Negative states have to be handled by the caller
+        _float_states(start, [10, 20], [12.0, -1.0]),
+    ]
+
+    assert recorder_numpy.total_increasing_sums(groups, [10.0] * 4) == [
+        (5.0, [], []),
+        (12.0 + 5.0 + 1.0 - 10.0, [1, 3], []),
+        (11.5 - 10.0, [], [0, 2]),
+        None,
+    ]
+    assert recorder_numpy.total_increasing_sums([], []) == []
+
+
+def _record_states(
+    hass: HomeAssistant, start: datetime, states: dict[str, list[Any]]
+) -> None:
+    """Record states of sensors spread over a statistics period."""
+    for entity_id, (attributes, values) in states.items():
+        for idx, value in enumerate(values):
+            hass.states.async_set(
+                entity_id,
+                str(value),
+                attributes,
+                timestamp=(start + timedelta(seconds=30 + idx * 40)).timestamp(),
+            )
+
+
+def _compile(hass: HomeAssistant, start: datetime) -> list[dict[str, Any]]:
+    """Compile statistics for the 5 minute period starting at start."""
+    for key in (recorder.SEEN_DIP, recorder.WARN_DIP, recorder.WARN_NEGATIVE):
+        hass.data.pop(key, None)
+    with session_scope(hass=hass, read_only=True) as session:
+        return recorder.compile_statistics(
+            hass, session, start, start + timedelta(minutes=5)
+        ).platform_stats
+
+
+async def test_compile_statistics_parity(
+    recorder_mock: Recorder, hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compiling with the NumPy engine matches compiling in Python."""
+    await async_setup_component(hass, "sensor", {})
+    await async_wait_recording_done(hass)
+    period1 = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=1
+    )
+    period2 = period1 + timedelta(minutes=5)
+    _record_states(
+        hass,
+        period1,
+        {
+            "sensor.power": (MEASUREMENT_ATTRIBUTES, [100, 200, 150]),
+            "sensor.steady": (TOTAL_INCREASING_ATTRIBUTES, [10, 11]),
+            "sensor.reset": (TOTAL_INCREASING_ATTRIBUTES, [10, 20]),
+            "sensor.dip": (TOTAL_INCREASING_ATTRIBUTES, [10, 20]),
+            "sensor.negative": (TOTAL_INCREASING_ATTRIBUTES, [10, 20]),
+            "sensor.total": (
+                {**TOTAL_ATTRIBUTES, "last_reset": period1.isoformat()},
+                [10, 20],
+            ),
+        },
+    )
+    await async_wait_recording_done(hass)
+    do_adhoc_statistics(hass, start=period1)
+    await async_wait_recording_done(hass)
+
+    _record_states(
+        hass,
+        period2,
+        {
+            "sensor.power": (MEASUREMENT_ATTRIBUTES, [50, "unavailable", 300, 25.5]),
+            "sensor.steady": (TOTAL_INCREASING_ATTRIBUTES, [12, 14, 20]),
+            "sensor.reset": (TOTAL_INCREASING_ATTRIBUTES, [25, 1, 5, 2, 4]),
+            "sensor.dip": (TOTAL_INCREASING_ATTRIBUTES, [19.5, 30, 29]),
+            "sensor.negative": (TOTAL_INCREASING_ATTRIBUTES, [25, -3, 30]),
+            "sensor.total": (
+                {**TOTAL_ATTRIBUTES, "last_reset": period2.isoformat()},
+                [1, 5],
+            ),
+            "sensor.new": (TOTAL_INCREASING_ATTRIBUTES, [5, 7]),
+        },
+    )
+    await async_wait_recording_done(hass)
+
+    instance = get_instance(hass)
+    caplog.clear()
+    with patch.object(recorder, "_numpy_engine", return_value=None):
+        python_stats = await instance.async_add_executor_job(_compile, hass, period2)
+    python_log = caplog.text
+
+    caplog.clear()
+    with (
+        patch.object(recorder, "NUMPY_ENGINE_MIN_SENSORS", 0),
+        patch.object(
+            recorder_numpy,
+            "total_increasing_sums",
+            wraps=recorder_numpy.total_increasing_sums,
+        ) as total_increasing_sums,
+    ):
+        numpy_stats = await instance.async_add_executor_job(_compile, hass, period2)
+    numpy_log = caplog.text
+
+    # Only the sensors which have been compiled before are vectorized
+    assert len(total_increasing_sums.mock_calls[0].args[0]) == 4
+    assert len(numpy_stats) == len(python_stats) == 7
+    for numpy_stat, python_stat in zip(numpy_stats, python_stats, strict=True):
+        assert numpy_stat["meta"] == python_stat["meta"]
+        assert numpy_stat["stat"] == {
+            key: pytest.approx(value) if isinstance(value, float) else value
+            for key, value in python_stat["stat"].items()
+        }
+    for message in (
+        "Detected new cycle for sensor.reset, value dropped from 25.0 to 1.0",
+        "Detected new cycle for sensor.reset, value dropped from 5.0 to 2.0",
+        "sensor.negative has state class total_increasing, but its state is negative",
+        "Detected new cycle for sensor.total",
+        "Compiling initial sum statistics for sensor.new",
+    ):
+        assert message in python_log
+        assert message in numpy_log
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
@@ -10,7 +11,7 @@ import voluptuous as vol
 
 from homeassistant import loader
 from homeassistant.components.device_automation import toggle_entity
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import const, messages
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
@@ -21,10 +22,13 @@ from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, template
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.template import Template
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -32,6 +36,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1196,6 +1201,152 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_share_message_cache(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_entities subscriptions share the state diff messages."""
+    for msg_id in (7, 8):
+        await websocket_client.send_json({"id": msg_id, "type": "subscribe_entities"})
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"a": {}}
+
+    with patch(
+        "homeassistant.components.websocket_api.messages._state_diff_message",
+        wraps=messages._state_diff_message,
+    ) as state_diff_message_mock:
+        hass.states.async_set("light.kitchen", "on")
+        for msg_id in (7, 8):
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == msg_id
+            assert msg["event"]["a"]["light.kitchen"]["s"] == "on"
+    assert state_diff_message_mock.call_count == 1
+
+
+async def test_subscribe_entities_max_update_rate_and_attributes(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_entities with an update rate and attribute allow-list."""
+    hass.states.async_set(
+        "light.kitchen", "off", {"friendly_name": "Kitchen", "brightness": 10}
+    )
+    hass.states.async_set("light.hall", "off")
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.kitchen", "light.bed", "light.hall"],
+            "attributes": ["friendly_name"],
+            "max_update_rate": 1,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["a"] == {"friendly_name": "Kitchen"}
+    assert msg["event"]["a"]["light.hall"]["a"] == {}
+
+    # The first change is sent right away
+    hass.states.async_set(
+        "light.kitchen", "on", {"friendly_name": "Kitchen", "brightness": 10}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"s": "on", "c": ANY, "lc": ANY}}}
+    }
+
+    # Later changes are coalesced until a second has passed
+    hass.states.async_set(
+        "light.kitchen", "off", {"friendly_name": "Kitchen", "brightness": 20}
+    )
+    hass.states.async_set(
+        "light.kitchen", "on", {"friendly_name": "Kitchen light", "brightness": 30}
+    )
+    hass.states.async_set("light.bed", "on", {"brightness": 30})
+    hass.states.async_set("light.hall", "off", {"brightness": 30})
+    hass.states.async_remove("light.hall")
+    hass.states.async_set("light.attic", "on")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "a": {"light.bed": {"s": "on", "a": {}, "c": ANY, "lc": ANY}},
+        "c": {
+            "light.kitchen": {
+                "+": {"a": {"friendly_name": "Kitchen light"}, "c": ANY, "lc": ANY}
+            }
+        },
+        "r": ["light.hall"],
+    }
+
+    # Changes of other attributes are not sent
+    hass.states.async_set(
+        "light.kitchen", "on", {"friendly_name": "Kitchen light", "brightness": 40}
+    )
+    hass.states.async_set("light.bed", "off")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.bed": {"+": {"s": "off", "c": ANY, "lc": ANY}}}
+    }
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+
+async def test_subscribe_entities_drop_superseded(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test queued entity changes are replaced by newer changes."""
+    hass.states.async_set("light.kitchen", "off", {"color": "red", "effect": "none"})
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "drop_superseded": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "off"
+
+    # The writer does not run while the event loop is busy
+    with patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 2):
+        hass.states.async_set("light.kitchen", "on", {"color": "red", "effect": "x"})
+        hass.states.async_set("light.kitchen", "on", {"color": "blue"})
+        hass.states.async_set("light.hall", "on")
+        hass.states.async_set("light.hall", "off")
+        hass.states.async_set("light.attic", "on")
+        hass.states.async_remove("light.attic")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {
+            "light.kitchen": {
+                "+": {"s": "on", "a": {"color": "blue"}, "c": ANY, "lc": ANY},
+                "-": {"a": ["effect"]},
+            }
+        }
+    }
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {"light.hall": {"s": "off", "a": {}, "c": ANY, "lc": ANY}}
+    }
+
+    hass.states.async_set("light.hall", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.hall": {"+": {"s": "on", "c": ANY, "lc": ANY}}}
+    }
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2792,3 +2943,92 @@ async def test_integration_descriptions(
 
     assert response["success"]
     assert response["result"]
+
+
+async def test_get_states_memory_usage(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_states_memory_usage command."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.bedroom", "off")
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+
+    # Yield to the event loop between every state
+    with patch(
+        "homeassistant.components.websocket_api.commands.MEMORY_USAGE_CHUNK_SIZE", 1
+    ):
+        await websocket_client.send_json({"id": 5, "type": "get_states_memory_usage"})
+        msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    result = msg["result"]
+    assert result["compact"] is False
+    assert result["states"] == 3
+    assert result["domains"].keys() == {"light", "sensor"}
+    assert result["domains"]["light"]["states"] == 2
+    assert result["domains"]["sensor"]["states"] == 1
+    assert result["bytes"] == sum(
+        usage["bytes"] for usage in result["domains"].values()
+    )
+    assert result["bytes_per_state"] == result["bytes"] // 3
+    assert result["domains"]["sensor"]["bytes_per_state"] > 0
+
+
+async def test_get_states_memory_usage_requires_admin(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test get_states_memory_usage command requires an admin."""
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 5, "type": "get_states_memory_usage"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_get_template_cache_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_template_cache_stats command."""
+    Template("{{ 'cache' ~ ' stats' }}", hass).async_render()
+
+    await websocket_client.send_json({"id": 5, "type": "get_template_cache_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == template.COMPILED_TEMPLATE_CACHE_STATS.as_dict()
+    assert msg["result"]["misses"] > 0
+
+
+async def test_get_template_render_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_template_render_stats command."""
+    hass.states.async_set("sensor.power", "10")
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('sensor.power') }}", hass), None)],
+        lambda event, updates: None,
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.power", "20")
+    await hass.async_block_till_done()
+
+    await websocket_client.send_json({"id": 5, "type": "get_template_render_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    stats = msg["result"][0]
+    assert stats["template"] == "{{ states('sensor.power') }}"
+    assert stats["renders"] == 2
+    assert stats["shared"] == 0
+    assert stats["render_time"] > 0
+
+    info.async_remove()
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -17,6 +18,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -435,6 +437,47 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_compress(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test enabling compressed messages."""
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_COMPRESS_MESSAGES: 1,
+            },
+        }
+    )
+    decompressor = zlib.decompressobj(
+        wbits=-zlib.MAX_WBITS, zdict=const.COMPRESS_MESSAGES_DICTIONARY
+    )
+
+    async def _receive_compressed() -> Any:
+        msg = await websocket_client.receive()
+        assert msg.type is WSMsgType.BINARY
+        return json_loads(decompressor.decompress(msg.data + b"\x00\x00\xff\xff"))
+
+    msg = await _receive_compressed()
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    await asyncio.gather(
+        *(websocket_client.send_json({"id": id_, "type": "ping"}) for id_ in (2, 3, 4))
+    )
+    returned_ids: set[int] = set()
+    while len(returned_ids) < 3:
+        msgs = await _receive_compressed()
+        for msg in msgs if isinstance(msgs, list) else [msgs]:
+            assert msg["type"] == "pong"
+            returned_ids.add(msg["id"])
+    assert returned_ids == {2, 3, 4}
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
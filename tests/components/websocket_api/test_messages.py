@@ -1,15 +1,21 @@
 """Test Websocket API messages module."""
 
+from unittest.mock import patch
+
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
+    _partial_cached_state_diff_message,
     _state_diff_event,
+    _state_diff_message,
     cached_event_message,
+    cached_state_diff_message,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -83,6 +89,37 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
     assert cache_info.currsize == 1
 
 
+async def test_cached_state_diff_message(hass: HomeAssistant) -> None:
+    """Test the state diff message of the last event is shared by all subscriptions."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.door", "on")
+    await hass.async_block_till_done()
+    _partial_cached_state_diff_message.cache_clear()
+
+    with patch(
+        "homeassistant.components.websocket_api.messages._state_diff_message",
+        wraps=_state_diff_message,
+    ) as state_diff_message_mock:
+        msg0 = cached_state_diff_message(b"2", events[0])
+        assert cached_state_diff_message(b"3", events[0]) == msg0.replace(
+            b'"id":2', b'"id":3'
+        )
+        assert json_loads(msg0) == {
+            "id": 2,
+            "type": "event",
+            "event": _state_diff_event(events[0]),
+        }
+        assert state_diff_message_mock.call_count == 1
+
+        cached_state_diff_message(b"2", events[1])
+        assert state_diff_message_mock.call_count == 2
+
+    cache_info = _partial_cached_state_diff_message.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.currsize == 1
+
+
 async def test_state_diff_event(hass: HomeAssistant) -> None:
     """Test building state_diff_message."""
     state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
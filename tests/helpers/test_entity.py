@@ -2596,6 +2596,65 @@ async def test_get_hassjob_type(hass: HomeAssistant) -> None:
     assert ent_1.get_hassjob_type("update_callback") is HassJobType.Callback
 
 
+@pytest.mark.parametrize("compact", [False, True])
+async def test_cache_state_attributes(hass: HomeAssistant, compact: bool) -> None:
+    """Test the attributes are reused when only the state has been set."""
+    hass.states.async_set_compact(compact)
+    calculated = 0
+
+    class CachedAttributesEntity(entity.Entity):
+        """An entity which reuses the attributes of the previous write."""
+
+        _cache_state_attributes = True
+
+        @property
+        def capability_attributes(self) -> dict[str, Any] | None:
+            nonlocal calculated
+            calculated += 1
+            return None
+
+    ent = CachedAttributesEntity()
+    ent.entity_id = "test.cached"
+    ent.hass = hass
+    ent._attr_extra_state_attributes = {"level": 1}
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    first_state = hass.states.get("test.cached")
+    assert first_state.state == "on"
+    assert first_state.attributes == {"level": 1}
+    assert calculated == 1
+
+    ent._attr_state = "off"
+    ent.async_write_ha_state()
+    state = hass.states.get("test.cached")
+    assert state.state == "off"
+    assert state.attributes is first_state.attributes
+    assert calculated == 1
+
+    ent._attr_extra_state_attributes = {"level": 2}
+    ent.async_write_ha_state()
+    state = hass.states.get("test.cached")
+    assert state.state == "off"
+    assert state.attributes == {"level": 2}
+    assert calculated == 2
+
+    # The attributes are calculated if the state was written by someone else
+    hass.states.async_set("test.cached", "on", {"other": True})
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    state = hass.states.get("test.cached")
+    assert state.attributes == {"level": 2}
+    assert calculated == 3
+
+    # And if the entity becomes unavailable
+    ent._attr_available = False
+    ent.async_write_ha_state()
+    state = hass.states.get("test.cached")
+    assert state.state == STATE_UNAVAILABLE
+    assert state.attributes == {}
+    assert calculated == 4
+
+
 async def test_async_write_ha_state_thread_safety(hass: HomeAssistant) -> None:
     """Test async_write_ha_state thread safety."""
     hass.config.debug = True
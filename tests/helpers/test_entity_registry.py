@@ -1,12 +1,16 @@
 """Tests for the Entity Registry."""
 
+import asyncio
 from datetime import timedelta
 from functools import partial
+import json
+from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
 import attr
 from freezegun.api import FrozenDateTimeFactory
+import py
 import pytest
 import voluptuous as vol
 
@@ -24,6 +28,7 @@ from tests.common import (
     MockConfigEntry,
     async_capture_events,
     async_fire_time_changed,
+    async_test_home_assistant,
     flush_store,
 )
 
@@ -238,7 +243,9 @@ def test_get_or_create_suggested_object_id_conflict_existing(
 
 def test_create_triggers_save(entity_registry: er.EntityRegistry) -> None:
     """Test that registering entry triggers a save."""
-    with patch.object(entity_registry, "async_schedule_save") as mock_schedule_save:
+    with patch.object(
+        entity_registry, "async_schedule_save_changes"
+    ) as mock_schedule_save:
         entity_registry.async_get_or_create("light", "hue", "1234")
 
     assert len(mock_schedule_save.mock_calls) == 1
@@ -435,6 +442,47 @@ async def test_filter_on_load(
     assert entry_disabled_user.disabled_by is er.RegistryEntryDisabler.USER
 
 
+async def test_changes_are_journaled(tmpdir: py.path.local) -> None:
+    """Test changes are journaled on top of a file written without a journal."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        registry = er.async_get(hass)
+        entry1 = registry.async_get_or_create("light", "hue", "1234")
+        entry2 = registry.async_get_or_create("light", "hue", "5678")
+        await flush_store(registry._store)
+
+        # Write the registry like it was written before the journal was used
+        path = Path(registry._store.path)
+        snapshot = await hass.async_add_executor_job(json.loads, path.read_text())
+        del snapshot["journal_generation"]
+        await hass.async_add_executor_job(path.write_text, json.dumps(snapshot))
+
+        registry = er.EntityRegistry(hass)
+        await registry.async_load()
+        registry.async_update_entity(entry1.entity_id, name="New name")
+        registry.async_remove(entry2.entity_id)
+        await flush_store(registry._store)
+
+        assert await hass.async_add_executor_job(path.read_text) == json.dumps(snapshot)
+        journal = await hass.async_add_executor_job(
+            Path(registry._store.journal_path).read_text
+        )
+        assert [json.loads(line)["path"] for line in journal.splitlines()[1:]] == [
+            ["entities", {"id": entry1.id}],
+            ["entities", {"id": entry2.id}],
+            ["deleted_entities", {"id": entry2.id}],
+        ]
+
+        registry2 = er.EntityRegistry(hass)
+        await registry2.async_load()
+        assert list(registry2.entities) == [entry1.entity_id]
+        assert registry2.async_get(entry1.entity_id).name == "New name"
+        assert list(registry2.deleted_entities) == [("light", "hue", "5678")]
+
+        await hass.async_stop(force=True)
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_load_bad_data(
     hass: HomeAssistant,
@@ -776,7 +824,9 @@ async def test_update_entity_unique_id(entity_registry: er.EntityRegistry) -> No
     )
 
     new_unique_id = "1234"
-    with patch.object(entity_registry, "async_schedule_save") as mock_schedule_save:
+    with patch.object(
+        entity_registry, "async_schedule_save_changes"
+    ) as mock_schedule_save:
         updated_entry = entity_registry.async_update_entity(
             entry.entity_id, new_unique_id=new_unique_id
         )
@@ -803,7 +853,9 @@ async def test_update_entity_unique_id_conflict(
         "light", "hue", "1234", config_entry=mock_config
     )
     with (
-        patch.object(entity_registry, "async_schedule_save") as mock_schedule_save,
+        patch.object(
+            entity_registry, "async_schedule_save_changes"
+        ) as mock_schedule_save,
         pytest.raises(ValueError),
     ):
         entity_registry.async_update_entity(
@@ -827,7 +879,9 @@ async def test_update_entity_entity_id(entity_registry: er.EntityRegistry) -> No
 
     new_entity_id = "light.blah"
     assert new_entity_id != entry.entity_id
-    with patch.object(entity_registry, "async_schedule_save") as mock_schedule_save:
+    with patch.object(
+        entity_registry, "async_schedule_save_changes"
+    ) as mock_schedule_save:
         updated_entry = entity_registry.async_update_entity(
             entry.entity_id, new_entity_id=new_entity_id
         )
@@ -852,7 +906,9 @@ async def test_update_entity_entity_id_entity_id(
 
     # Try updating to a registered entity_id
     with (
-        patch.object(entity_registry, "async_schedule_save") as mock_schedule_save,
+        patch.object(
+            entity_registry, "async_schedule_save_changes"
+        ) as mock_schedule_save,
         pytest.raises(ValueError),
     ):
         entity_registry.async_update_entity(
@@ -870,7 +926,9 @@ async def test_update_entity_entity_id_entity_id(
 
     # Try updating to an entity_id which is in the state machine
     with (
-        patch.object(entity_registry, "async_schedule_save") as mock_schedule_save,
+        patch.object(
+            entity_registry, "async_schedule_save_changes"
+        ) as mock_schedule_save,
         pytest.raises(ValueError),
     ):
         entity_registry.async_update_entity(
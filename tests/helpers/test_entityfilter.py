@@ -1,5 +1,8 @@
 """The tests for the EntityFilter component."""
 
+import pytest
+
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entityfilter import (
     FILTER_SCHEMA,
     INCLUDE_EXCLUDE_FILTER_SCHEMA,
@@ -479,3 +482,61 @@ def test_complex_include_exclude_filter() -> None:
     }
     filt: EntityFilter = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt("switch.espresso_keuken") is True
+
+
+@pytest.mark.parametrize(
+    "conf",
+    [
+        {"include": {}, "exclude": {}},
+        {
+            "include": {
+                "domains": ["light"],
+                "entity_globs": ["sensor.*_temperature", "*.kitchen_*"],
+                "entities": ["switch.kitchen", "switch.missing"],
+            },
+            "exclude": {},
+        },
+        {
+            "include": {
+                "domains": ["light"],
+                "entity_globs": ["sensor.*_temperature", "binary_sensor.*door"],
+                "entities": ["switch.kitchen"],
+            },
+            "exclude": {
+                "domains": ["cover"],
+                "entity_globs": ["light.*_ambilight"],
+                "entities": ["light.kitchen_ceiling"],
+            },
+        },
+        {
+            "include": {},
+            "exclude": {
+                "domains": ["light"],
+                "entity_globs": ["sensor.*_temperature"],
+                "entities": ["switch.kitchen"],
+            },
+        },
+    ],
+)
+async def test_async_filter_entity_ids(
+    hass: HomeAssistant, conf: dict[str, dict[str, list[str]]]
+) -> None:
+    """Test filtering the entity ids of the state machine."""
+    for entity_id in (
+        "light.kitchen_ceiling",
+        "light.tv_ambilight",
+        "sensor.kitchen_temperature",
+        "sensor.outside_temperature",
+        "sensor.kitchen_humidity",
+        "switch.kitchen",
+        "switch.kitchen_fan",
+        "binary_sensor.front_door",
+        "binary_sensor.garage_door_open",
+        "cover.kitchen_blinds",
+    ):
+        hass.states.async_set(entity_id, "on")
+
+    filt: EntityFilter = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
+    assert sorted(filt.async_filter_entity_ids(hass.states)) == sorted(
+        entity_id for entity_id in hass.states.async_entity_ids() if filt(entity_id)
+    )
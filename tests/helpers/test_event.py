@@ -24,6 +24,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -2459,6 +2460,174 @@ async def test_track_template_rate_limit(hass: HomeAssistant) -> None:
     info.async_remove()
 
 
+async def test_track_template_result_batches_renders(hass: HomeAssistant) -> None:
+    """Test state changes in the same iteration are rendered once."""
+    template = Template("{{ states('sensor.power') }}", hass)
+    runs = []
+
+    @ha.callback
+    def listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], listener, batch_renders=True
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.power", "1")
+    hass.states.async_set("sensor.power", "2")
+    hass.states.async_set("sensor.power", "3")
+    assert runs == []
+    await hass.async_block_till_done()
+    assert runs == [3]
+
+    hass.states.async_set("sensor.power", "4")
+    await hass.async_block_till_done()
+    assert runs == [3, 4]
+
+    info.async_remove()
+
+
+async def test_track_template_result_not_batched(hass: HomeAssistant) -> None:
+    """Test every result is seen without batching.
+
+    A state which is replaced in the same iteration must still trigger.
+    """
+    template = Template("{{ is_state('sensor.x', 'B') }}", hass)
+    runs = []
+
+    @ha.callback
+    def listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    hass.states.async_set("sensor.x", "A")
+    info = async_track_template_result(hass, [TrackTemplate(template, None)], listener)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.x", "B")
+    hass.states.async_set("sensor.x", "C")
+    assert runs == [True, False]
+    await hass.async_block_till_done()
+    assert runs == [True, False]
+
+    info.async_remove()
+
+
+async def test_track_template_result_shares_renders(hass: HomeAssistant) -> None:
+    """Test trackers of the same template share a render."""
+    hass.states.async_set("sensor.power", "1")
+    runs: list[list[int]] = [[], [], []]
+
+    def make_listener(runs_: list[int]) -> Callable[..., None]:
+        @ha.callback
+        def listener(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            runs_.append(updates.pop().result)
+
+        return listener
+
+    source = "{{ states('sensor.power') | int * 2 }}"
+    infos = [
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template(source, hass), None)],
+            make_listener(runs[0]),
+            batch_renders=True,
+        ),
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template(source, hass), None)],
+            make_listener(runs[1]),
+            batch_renders=True,
+        ),
+        # Templates rendered with variables they use are not shared
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(
+                    Template("{{ states('sensor.power') | int * factor }}", hass),
+                    {"factor": 3},
+                )
+            ],
+            make_listener(runs[2]),
+            batch_renders=True,
+        ),
+    ]
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.power", "5")
+    await hass.async_block_till_done()
+    assert runs == [[10], [10], [15]]
+
+    stats = {
+        stats["template"]: stats for stats in async_get_template_render_stats(hass)
+    }
+    assert stats[source]["renders"] == 3
+    assert stats[source]["shared"] == 1
+    assert stats[source]["render_time"] > 0
+    variable_source = "{{ states('sensor.power') | int * factor }}"
+    assert stats[variable_source]["renders"] == 2
+    assert stats[variable_source]["shared"] == 0
+
+    for info in infos:
+        info.async_remove()
+    assert async_get_template_render_stats(hass) == []
+
+
+async def test_track_template_result_removed_in_batch(hass: HomeAssistant) -> None:
+    """Test a tracker removed by an action in the same batch is not called."""
+    hass.states.async_set("sensor.power", "1")
+    runs = []
+    infos = []
+
+    @ha.callback
+    def remove_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append("remove")
+        infos[1].async_remove()
+
+    @ha.callback
+    def listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append("removed")
+
+    infos.append(
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template("{{ states('sensor.power') }}", hass), None)],
+            remove_listener,
+            batch_renders=True,
+        )
+    )
+    infos.append(
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template("{{ states('sensor.power') }}", hass), None)],
+            listener,
+            batch_renders=True,
+        )
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.power", "2")
+    await hass.async_block_till_done()
+    assert runs == ["remove"]
+
+    infos[0].async_remove()
+
+
 async def test_track_template_rate_limit_super(hass: HomeAssistant) -> None:
     """Test template rate limit with super template."""
     template_availability = Template(
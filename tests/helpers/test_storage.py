@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -23,11 +24,13 @@ from homeassistant.helpers import issue_registry as ir, storage
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
+from homeassistant.util.file import WriteError
 
 from tests.common import (
     async_fire_time_changed,
     async_fire_time_changed_exact,
     async_test_home_assistant,
+    flush_store,
 )
 
 MOCK_VERSION = 1
@@ -1159,3 +1162,261 @@ async def test_store_manager_cleanup_after_stop(
         assert store_manager.async_fetch("integration1") is None
         assert store_manager.async_fetch("integration2") is None
         await hass.async_stop(force=True)
+
+
+def _read_journal(path: str) -> list[dict[str, Any]]:
+    """Read the records of a journal."""
+    with open(path, encoding="utf-8") as fdesc:
+        return [json.loads(line) for line in fdesc]
+
+
+async def test_saving_changes(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test saving changes with and without a journal."""
+    data = {"entities": {"a": {"name": "A"}, "b": {"name": "B"}}}
+    changes = [
+        (("entities", "a", "name"), "New A"),
+        (("entities", "c"), {"name": "C"}),
+        (("entities", "b"), storage.JOURNAL_REMOVE),
+    ]
+    new_data = {"entities": {"a": {"name": "New A"}, "c": {"name": "C"}}}
+
+    for journal in (False, True):
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=journal)
+        await store.async_save(data)
+        store.async_delay_save_changes(lambda: new_data, changes)
+        await flush_store(store)
+        assert hass_storage[MOCK_KEY]["data"] == new_data
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and compacted when stopping."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"entities": {"a": {"name": "A"}, "b": {"name": "B"}}})
+        new_data = {"entities": {"a": {"name": "New A"}, "c": {"name": "C"}}}
+        store.async_delay_save_changes(
+            lambda: new_data,
+            [
+                (("entities", "a", "name"), "New A"),
+                (("entities", "c"), {"name": "C"}),
+                (("entities", "b"), storage.JOURNAL_REMOVE),
+            ],
+        )
+        await flush_store(store)
+
+        snapshot = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+        assert snapshot["journal_generation"] == 1
+        assert snapshot["data"] == {
+            "entities": {"a": {"name": "A"}, "b": {"name": "B"}}
+        }
+        assert await hass.async_add_executor_job(_read_journal, store.journal_path) == [
+            {"journal_generation": 1},
+            {"path": ["entities", "a", "name"], "value": "New A"},
+            {"path": ["entities", "c"], "value": {"name": "C"}},
+            {"path": ["entities", "b"]},
+        ]
+
+        new_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await new_store.async_load() == new_data
+
+        await hass.async_stop(force=True)
+
+        snapshot = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+        assert snapshot["journal_generation"] == 2
+        assert snapshot["data"] == new_data
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into a snapshot when it grows too large."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data: dict[str, Any] = {}
+        await store.async_save(data)
+
+        with patch.object(storage, "JOURNAL_MAX_RECORDS", 3):
+            for key in ("a", "b", "c"):
+                data[key] = key
+                store.async_delay_save_changes(lambda: data, [((key,), key)])
+                await flush_store(store)
+
+        snapshot = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+        assert snapshot["journal_generation"] == 2
+        assert snapshot["data"] == {"a": "a", "b": "b", "c": "c"}
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_recovery(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test loading a journal cut short by an unclean shutdown."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"hello": "world"})
+        store.async_delay_save_changes(
+            dict, [(("hello",), "journal"), (("goodbye",), "journal")]
+        )
+        await flush_store(store)
+
+        def truncate_journal() -> None:
+            with open(store.journal_path, "r+b") as fdesc:
+                fdesc.truncate(os.path.getsize(store.journal_path) - 5)
+
+        await hass.async_add_executor_job(truncate_journal)
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {"hello": "journal"}
+        assert "Ignoring incomplete journal record for storage-test" in caplog.text
+
+        # The next write replaces the incomplete journal with a snapshot
+        store.async_delay_save_changes(
+            lambda: {"hello": "journal", "goodbye": "again"},
+            [(("goodbye",), "again")],
+        )
+        await flush_store(store)
+        snapshot = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+        assert snapshot["journal_generation"] == 2
+        assert snapshot["data"] == {"hello": "journal", "goodbye": "again"}
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_outdated(tmpdir: py.path.local) -> None:
+    """Test a journal older than the snapshot is ignored and replaced."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"hello": "world"})
+        store.async_delay_save_changes(dict, [(("hello",), "journal")])
+        await flush_store(store)
+
+        # Interrupted compaction, the snapshot was written but not the journal
+        with patch.object(storage.Store, "_remove_journal"):
+            await store.async_save({"hello": "snapshot"})
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {"hello": "snapshot"}
+
+        store.async_delay_save_changes(dict, [(("goodbye",), "journal")])
+        await flush_store(store)
+        assert await hass.async_add_executor_job(_read_journal, store.journal_path) == [
+            {"journal_generation": 2},
+            {"path": ["goodbye"], "value": "journal"},
+        ]
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_keyed_list_items(tmpdir: py.path.local) -> None:
+    """Test changes to list items selected by a key are journaled."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save(
+            {"entities": [{"id": "a", "name": "A"}, {"id": "b", "name": "B"}]}
+        )
+        new_data = {
+            "entities": [{"id": "a", "name": "New A"}, {"id": "c", "name": "C"}],
+            "deleted": [{"id": "b", "name": "B"}],
+        }
+        store.async_delay_save_changes(
+            lambda: new_data,
+            [
+                (("entities", {"id": "a"}, "name"), "New A"),
+                (("entities", {"id": "c"}), {"id": "c", "name": "C"}),
+                (("entities", {"id": "b"}), storage.JOURNAL_REMOVE),
+                (("deleted", {"id": "b"}), {"id": "b", "name": "B"}),
+            ],
+        )
+        await flush_store(store)
+        assert await hass.async_add_executor_job(_read_journal, store.journal_path) == [
+            {"journal_generation": 1},
+            {"path": ["entities", {"id": "a"}, "name"], "value": "New A"},
+            {"path": ["entities", {"id": "c"}], "value": {"id": "c", "name": "C"}},
+            {"path": ["entities", {"id": "b"}]},
+            {"path": ["deleted", {"id": "b"}], "value": {"id": "b", "name": "B"}},
+        ]
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == new_data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_failed_append_written_when_stopping(
+    tmpdir: py.path.local,
+) -> None:
+    """Test changes of a failed journal append are written when stopping."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"hello": "world"})
+
+        with patch.object(
+            storage.Store, "_append_journal", side_effect=WriteError("failed")
+        ):
+            store.async_delay_save_changes(
+                lambda: {"hello": "changes"}, [(("hello",), "changes")]
+            )
+            await flush_store(store)
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        await hass.async_stop(force=True)
+
+        snapshot = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+        assert snapshot["journal_generation"] == 2
+        assert snapshot["data"] == {"hello": "changes"}
+
+
+async def test_journal_save_during_compaction(tmpdir: py.path.local) -> None:
+    """Test a save requested while the journal is compacted is a snapshot."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        write_data = store._async_write_data
+
+        async def _async_write_data(path: str, data: dict) -> None:
+            store.async_delay_save(lambda: {"hello": "again"}, 10)
+            await write_data(path, data)
+
+        with patch.object(store, "_async_write_data", _async_write_data):
+            await store.async_save({"hello": "world"})
+        assert store._journal_compact
+
+        store.async_delay_save_changes(
+            lambda: {"hello": "changes"}, [(("hello",), "changes")]
+        )
+        await flush_store(store)
+        snapshot = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+        assert snapshot["journal_generation"] == 2
+        assert snapshot["data"] == {"hello": "changes"}
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        await hass.async_stop(force=True)
@@ -5066,9 +5066,59 @@ async def test_cache_garbage_collection() -> None:
     del tpl
     assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
+    # The compiled code is kept alive by the process-wide cache
+    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    del template.CACHED_COMPILED_TEMPLATES[(template_string, "no_hass")]
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared by environments of the same flavor."""
+    template_string = "{{ 'compiled' ~ ' cache' }}"
+    stats = template.COMPILED_TEMPLATE_CACHE_STATS
+    initial = (stats.environment_hits, stats.shared_hits, stats.misses)
+
+    def counts() -> tuple[int, int, int]:
+        return (
+            stats.environment_hits - initial[0],
+            stats.shared_hits - initial[1],
+            stats.misses - initial[2],
+        )
+
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == "compiled cache"
+    assert counts() == (0, 0, 1)
+
+    tpl2 = template.Template(template_string, hass)
+    assert tpl2.async_render() == "compiled cache"
+    assert counts() == (1, 0, 1)
+    assert tpl2._compiled_code is tpl._compiled_code
+
+    # A new environment of the same flavor uses the same compiled code
+    env = template.TemplateEnvironment(hass)
+    assert env.compile(template_string) is tpl._compiled_code
+    assert counts() == (1, 1, 1)
+
+    # Other flavors compile their own code
+    limited_env = template.TemplateEnvironment(hass, limited=True)
+    assert limited_env.compile(template_string) is not tpl._compiled_code
+    assert counts() == (1, 1, 2)
+    assert (template_string, "normal") in template.CACHED_COMPILED_TEMPLATES
+    assert (template_string, "limited") in template.CACHED_COMPILED_TEMPLATES
+
+    stats_dict = stats.as_dict()
+    assert stats_dict["environment_hits"] == stats.environment_hits
+    assert stats_dict["shared_hits"] == stats.shared_hits
+    assert stats_dict["misses"] == stats.misses
+    assert stats_dict["hit_rate"] == (stats.environment_hits + stats.shared_hits) / (
+        stats.environment_hits + stats.shared_hits + stats.misses
+    )
+    assert stats_dict["shared_hit_rate"] == stats.shared_hits / (
+        stats.shared_hits + stats.misses
+    )
+    assert stats_dict["max_size"] == template.COMPILED_TEMPLATE_CACHE_SIZE
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
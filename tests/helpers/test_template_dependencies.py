@@ -0,0 +1,194 @@
+"""Test the static dependency analysis of templates."""
+
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template, TemplateStateFromEntityId
+from homeassistant.helpers.template_dependencies import (
+    TemplateDependencies,
+    async_analyze_template,
+    async_render_to_info_with_dependencies,
+)
+
+
+@pytest.mark.parametrize(
+    ("template_str", "entities", "domains", "domains_lifecycle", "has_time"),
+    [
+        ("{{ states('sensor.temp') }}", {"sensor.temp"}, set(), set(), False),
+        ("{{ states.sensor.temp.state }}", {"sensor.temp"}, set(), set(), False),
+        ("{{ states['sensor.temp'].state }}", {"sensor.temp"}, set(), set(), False),
+        ("{{ states.sensor['temp'].state }}", {"sensor.temp"}, set(), set(), False),
+        (
+            "{{ is_state('light.a', 'on') }} {{ state_attr('light.b', 'brightness') }}",
+            {"light.a", "light.b"},
+            set(),
+            set(),
+            False,
+        ),
+        (
+            "{{ 'light.a' | has_value }} {{ 'light.b' is is_state('on') }}",
+            {"light.a", "light.b"},
+            set(),
+            set(),
+            False,
+        ),
+        (
+            "{{ states.sensor | selectattr('state', 'eq', 'on') | list | count }}",
+            set(),
+            {"sensor"},
+            set(),
+            False,
+        ),
+        ("{{ states.sensor | count }}", set(), set(), {"sensor"}, False),
+        (
+            "{{ states | selectattr('domain', 'eq', 'sensor') | list }}",
+            set(),
+            {"sensor"},
+            set(),
+            False,
+        ),
+        (
+            "{{ states | selectattr('domain', 'in', ['light', 'switch']) | list }}",
+            set(),
+            {"light", "switch"},
+            set(),
+            False,
+        ),
+        (
+            "{% for s in states.light %}{{ s.state }}{% endfor %}",
+            set(),
+            {"light"},
+            set(),
+            False,
+        ),
+        (
+            "{% set t = states('sensor.temp') | float(0) %}{{ t > 20 }}",
+            {"sensor.temp"},
+            set(),
+            set(),
+            False,
+        ),
+        ("{{ now().hour }}", set(), set(), set(), True),
+        ("{{ 1 + 1 }}", set(), set(), set(), False),
+    ],
+)
+async def test_analyze_template(
+    hass: HomeAssistant,
+    template_str: str,
+    entities: set[str],
+    domains: set[str],
+    domains_lifecycle: set[str],
+    has_time: bool,
+) -> None:
+    """Test analyzing the dependencies of templates."""
+    assert async_analyze_template(Template(template_str, hass)) == (
+        TemplateDependencies(
+            frozenset(entities),
+            frozenset(domains),
+            frozenset(domains_lifecycle),
+            has_time,
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "static",
+        "{{ states | count }}",
+        "{% for s in states %}{{ s.state }}{% endfor %}",
+        "{{ states(entity_id) }}",
+        "{{ states[entity_id] }}",
+        "{{ expand('group.all') | list }}",
+        "{{ closest(states.device_tracker) }}",
+        "{{ ['light.a'] | map('states') | list }}",
+        "{{ ['light.a'] | select('is_state', 'on') | list }}",
+        "{% if is_state('light.a', 'on') %}{{ states('light.b') }}{% endif %}",
+        "{{ is_state('light.a', 'on') and is_state('light.b', 'on') }}",
+        "{{ states('light.a') if x else 'off' }}",
+        "{% for x in [1] %}{{ states('light.a') }}{% endfor %}",
+        "{% if x %}{{ now() }}{% endif %}",
+        "{% macro m() %}{{ states('light.a') }}{% endmacro %}{{ m() }}",
+        "{% from 'tools.jinja' import m %}{{ m() }}",
+        "{% set states = 1 %}{{ states }}",
+        "{{ states | selectattr('domain', 'ne', 'light') | list }}",
+        "{{ states.Invalid.entity }}",
+        "{{ invalid syntax",
+        "{{ states.switch | lunch }}",
+    ],
+)
+async def test_analyze_template_unprovable(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test templates whose dependencies can not be proven."""
+    assert async_analyze_template(Template(template_str, hass)) is None
+
+
+@pytest.mark.parametrize(
+    ("variables", "expected"),
+    [
+        (None, TemplateDependencies(frozenset(), frozenset(), frozenset(), False)),
+        (
+            {"value": 1, "data": {"list": [1, "a", None]}},
+            TemplateDependencies(frozenset(), frozenset(), frozenset(), False),
+        ),
+        ({"value": object()}, None),
+        ({"states": 1}, None),
+    ],
+)
+async def test_analyze_template_variables(
+    hass: HomeAssistant,
+    variables: dict[str, Any] | None,
+    expected: TemplateDependencies | None,
+) -> None:
+    """Test the variables a template is rendered with are checked."""
+    tpl = Template("{{ value }}", hass)
+    assert async_analyze_template(tpl, variables) == expected
+
+
+async def test_analyze_template_state_variable(hass: HomeAssistant) -> None:
+    """Test template states passed as variables are dependencies."""
+    variables = {"this": TemplateStateFromEntityId(hass, "sensor.this")}
+
+    tpl = Template("{{ this.state }} {{ states('sensor.other') }}", hass)
+    assert async_analyze_template(tpl, variables) == TemplateDependencies(
+        frozenset({"sensor.this", "sensor.other"}), frozenset(), frozenset(), False
+    )
+
+    tpl = Template("{{ this.state if x else 'off' }}", hass)
+    assert async_analyze_template(tpl, variables) is None
+
+
+async def test_render_to_info_with_dependencies(hass: HomeAssistant) -> None:
+    """Test rendering with the analyzed dependencies."""
+    hass.states.async_set("sensor.power", "10")
+    hass.states.async_set("switch.a", "on")
+    tpl = Template(
+        "{{ states | selectattr('domain', 'eq', 'sensor')"
+        " | map(attribute='state') | map('int') | sum }}",
+        hass,
+    )
+    collected = tpl.async_render_to_info()
+    assert collected.result() == 10
+    assert collected.all_states is True
+
+    dependencies = async_analyze_template(tpl)
+    assert dependencies is not None
+    info = async_render_to_info_with_dependencies(tpl, dependencies)
+    assert info.result() == 10
+    assert info.all_states is False
+    assert info.domains == {"sensor"}
+    assert info.entities == set()
+    assert info.filter("sensor.power") is True
+    assert info.filter("switch.a") is False
+
+    info = async_render_to_info_with_dependencies(
+        Template("{{ states('sensor.power') | int / 0 }}", hass),
+        TemplateDependencies(
+            frozenset({"sensor.power"}), frozenset(), frozenset(), False
+        ),
+    )
+    assert info.exception is not None
+    assert info.entities == {"sensor.power"}
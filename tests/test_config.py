@@ -858,6 +858,7 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
             "media_dirs": {"mymedia": "/usr"},
             "legacy_templates": True,
             "debug": True,
+            "compact_states": True,
             "currency": "EUR",
             "country": "SE",
             "language": "sv",
@@ -879,6 +880,7 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
     assert hass.config.config_source is ConfigSource.YAML
     assert hass.config.legacy_templates is True
     assert hass.config.debug is True
+    assert hass.states.compact is True
     assert hass.config.currency == "EUR"
     assert hass.config.country == "SE"
     assert hass.config.language == "sv"
@@ -1128,6 +1128,88 @@ async def test_eventbus_add_remove_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_dispatch_follows_listener_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test the cached dispatch is rebuilt when listeners change."""
+    calls: list[str] = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        calls.append("test")
+
+    @ha.callback
+    def match_all_listener(event: ha.Event) -> None:
+        calls.append(MATCH_ALL)
+
+    @ha.callback
+    def state_reported_listener(event: ha.Event) -> None:
+        calls.append(EVENT_STATE_REPORTED)
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == []
+
+    unsub = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["test"]
+
+    calls.clear()
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["test", MATCH_ALL]
+
+    calls.clear()
+    unsub()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == [MATCH_ALL]
+
+    calls.clear()
+    unsub_match_all()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == []
+
+    # State reported listeners are called for state changed events
+    unsub_state_reported = hass.bus.async_listen(
+        EVENT_STATE_REPORTED, state_reported_listener, ha.callback(lambda _: True)
+    )
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {})
+    await hass.async_block_till_done()
+    assert calls == [EVENT_STATE_REPORTED]
+
+    calls.clear()
+    unsub_state_reported()
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {})
+    await hass.async_block_till_done()
+    assert calls == []
+
+
+async def test_eventbus_dispatch_not_cached_without_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test event types without listeners do not grow the dispatch cache."""
+    calls: list[str] = []
+
+    @ha.callback
+    def match_all_listener(event: ha.Event) -> None:
+        calls.append(event.event_type)
+
+    unsub = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    for idx in range(10):
+        hass.bus.async_fire(f"unknown_event_{idx}")
+    await hass.async_block_till_done()
+
+    assert calls == [f"unknown_event_{idx}" for idx in range(10)]
+    assert not any(
+        event_type.startswith("unknown_event_") for event_type in hass.bus._dispatch
+    )
+    unsub()
+
+
 async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     """Test we can prefilter events."""
     calls = []
@@ -1480,6 +1562,141 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_state_machine_compact_states(hass: HomeAssistant) -> None:
+    """Test states stored in the compact format behave like regular states."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    regular_state = hass.states.get("light.bowl")
+    assert not hass.states.compact
+
+    hass.states.async_set_compact(True)
+    assert hass.states.compact
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    hass.states.async_set("light.lamp", "on", {"brightness": 10})
+    state = hass.states.get("light.bowl")
+    other_state = hass.states.get("light.lamp")
+
+    assert isinstance(state, ha.CompactState)
+    assert type(regular_state) is ha.State
+    assert type(state.attributes) is ReadOnlyDict
+    assert state.attributes == {"brightness": 50}
+    assert "attributes" not in state.__dict__
+    # Keys are shared between states with the same attribute layout
+    assert state._attribute_keys is other_state._attribute_keys
+    assert state.as_dict() == {
+        "entity_id": "light.bowl",
+        "state": "off",
+        "attributes": {"brightness": 50},
+        "last_changed": state.last_changed.isoformat(),
+        "last_reported": state.last_reported.isoformat(),
+        "last_updated": state.last_updated.isoformat(),
+        "context": {"id": state.context.id, "parent_id": None, "user_id": None},
+    }
+    assert state.as_compressed_state == {
+        "s": "off",
+        "a": {"brightness": 50},
+        "c": state.context.id,
+        "lc": state.last_changed_timestamp,
+    }
+    assert "_as_dict" not in state.__dict__
+    assert "as_compressed_state" not in state.__dict__
+
+    # Unchanged attributes are reported and not replaced
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    assert hass.states.get("light.bowl") is state
+
+    # The attributes view is shared while it is referenced
+    attributes = state.attributes
+    assert state.attributes is attributes
+    hass.states.async_set("light.bowl", "dim", {"brightness": 50})
+    assert hass.states.get("light.bowl").attributes is attributes
+
+    hass.states.async_set_compact(False)
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    assert type(hass.states.get("light.bowl")) is ha.State
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("light.kitchen_ceiling", ["light.kitchen_ceiling"]),
+        ("light.missing", []),
+        ("light.*", ["light.kitchen_ceiling", "light.tv_ambilight"]),
+        ("sensor.*_temperature", ["sensor.kitchen_temperature"]),
+        ("*_temperature", ["sensor.kitchen_temperature", "climate.hall_temperature"]),
+        ("*.kitchen_*", ["light.kitchen_ceiling", "sensor.kitchen_temperature"]),
+        ("*.hall_temperature", ["climate.hall_temperature"]),
+        ("*ature", ["sensor.kitchen_temperature", "climate.hall_temperature"]),
+        ("*e.hall_temp?rature", ["climate.hall_temperature"]),
+        ("sensor.kitchen_temp[aeiou]rature", ["sensor.kitchen_temperature"]),
+        ("switch.*_missing", []),
+        (
+            "*",
+            [
+                "light.kitchen_ceiling",
+                "light.tv_ambilight",
+                "sensor.kitchen_temperature",
+                "climate.hall_temperature",
+            ],
+        ),
+    ],
+)
+async def test_state_machine_entity_ids_glob(
+    hass: HomeAssistant, pattern: str, expected: list[str]
+) -> None:
+    """Test resolving globs with the state machine indexes."""
+    for entity_id in (
+        "light.kitchen_ceiling",
+        "light.tv_ambilight",
+        "sensor.kitchen_temperature",
+        "climate.hall_temperature",
+    ):
+        hass.states.async_set(entity_id, "on")
+
+    assert sorted(hass.states.async_entity_ids_glob(pattern)) == sorted(expected)
+    assert sorted(hass.states.async_entity_ids_glob([pattern, pattern])) == sorted(
+        expected
+    )
+
+
+async def test_state_machine_entity_ids_glob_follows_removals(
+    hass: HomeAssistant,
+) -> None:
+    """Test the glob indexes follow entities being added and removed."""
+    hass.states.async_set("sensor.kitchen_temperature", "20")
+    hass.states.async_set("sensor.kitchen_temperature", "21")
+    hass.states.async_set("sensor.hall_temperature", "19")
+    assert sorted(hass.states.async_entity_ids_glob("sensor.*_temperature")) == [
+        "sensor.hall_temperature",
+        "sensor.kitchen_temperature",
+    ]
+
+    hass.states.async_remove("sensor.kitchen_temperature")
+    assert hass.states.async_entity_ids_glob("sensor.*_temperature") == [
+        "sensor.hall_temperature"
+    ]
+    hass.states.async_remove("sensor.hall_temperature")
+    assert hass.states.async_entity_ids_glob("sensor.*_temperature") == []
+    assert "temperature" not in hass.states._states._suffix_index
+
+
+async def test_compact_state_attribute_keys_bounded(hass: HomeAssistant) -> None:
+    """Test the interned attribute key layouts are bounded."""
+    hass.states.async_set_compact(True)
+    with (
+        patch.object(ha, "_COMPACT_ATTRIBUTE_KEYS", {}) as attribute_keys,
+        patch.object(ha, "_COMPACT_ATTRIBUTE_KEYS_MAX", 3),
+    ):
+        for idx in range(5):
+            hass.states.async_set(f"light.bowl_{idx}", "on", {f"attr_{idx}": idx})
+        assert len(attribute_keys) <= 3
+        hass.states.async_set("light.lamp", "on", {"attr_4": 1})
+        assert (
+            hass.states.get("light.lamp")._attribute_keys
+            is hass.states.get("light.bowl_4")._attribute_keys
+        )
+        assert hass.states.get("light.bowl_0").attributes == {"attr_0": 0}
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)